@@ -1,6 +1,12 @@
 from ._accessor_dataframe import *
 from ._accessor_series import *
 from ._array import *
+from ._arrow import *
+from ._categorical import *
+from ._dask import *
+from ._options import *
+from ._parquet import *
+from ._sindex import *
 from ._version import get_versions
 
 __version__ = get_versions()['version']
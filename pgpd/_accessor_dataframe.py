@@ -7,7 +7,10 @@ import pandas as pd
 
 from ._accessor_series import GeosSeriesAccessor
 from ._array import GeosArray
+from ._curves import curve_distance
 from ._delegated_dataframe import unary_dataframe_expanded
+from ._join import sjoin, sjoin_nearest
+from ._parquet import write_parquet
 
 try:
     import geopandas as gpd
@@ -104,6 +107,169 @@ class GeosDataFrameAccessor:
         df[geometry] = df[geometry].astype(object)
         return gpd.GeoDataFrame(df, geometry=geometry, crs=crs)
 
+    def to_parquet(self, path, geometry=None, row_group_size=2**16, bbox_covering=True, sort=True, **kwargs):
+        """
+        Write the DataFrame to a `GeoParquet <https://geoparquet.org>`_ file.
+
+        The geos columns are stored as WKB, together with the "geo" metadata of the GeoParquet specification.
+        By default, we also add a ``<column>_bbox`` covering column with the bounding box of each geometry
+        and sort the rows along a Hilbert curve, so that each row group covers a small spatial extent.
+        This allows :func:`pgpd.read_parquet` to skip row groups and rows when filtering with a bbox.
+
+        Args:
+            path (str or path-like or file-like): Path of the Parquet file.
+            geometry (str, optional): Name of the primary geometry column; Default **first geos column**.
+            row_group_size (int, optional): Maximum number of rows per row group; Default **65536**.
+            bbox_covering (bool, optional): Whether to add bounding box covering columns; Default **True**.
+            sort (bool, optional): Whether to spatially sort the rows by their primary geometry; Default **True**.
+            kwargs: Extra keyword arguments that are passed to :func:`pyarrow.parquet.write_table`.
+
+        Raises:
+            ImportError: PyArrow is not installed.
+            TypeError: "geometry" column is not of geos dtype.
+
+        Note:
+            Sorting the rows changes their order in the file, but the index is stored as well.
+            Use :meth:`pandas.DataFrame.sort_index` after reading to restore the original order.
+        """
+        write_parquet(self._obj, path, geometry, row_group_size, bbox_covering, sort, **kwargs)
+
+    def sort_spatially(self, geometry=None, curve='hilbert', level=16):
+        """
+        Sort the rows of the DataFrame along a space-filling curve through the centers of the bounding boxes of the geometries.
+
+        Spatially sorted data keeps geometries that are close to each other in neighbouring rows,
+        which makes spatial indices, Parquet row group pruning and chunked parallel execution more efficient.
+
+        Args:
+            geometry (str, optional): Name of the geos column to sort by; Default **first geos column**.
+            curve ('hilbert' or 'morton', optional): Type of space-filling curve; Default **hilbert**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+        Returns:
+            pandas.DataFrame: Sorted DataFrame, where rows with missing or empty geometries are placed last.
+
+        Raises:
+            TypeError: "geometry" column is not of geos dtype.
+        """
+        geos_columns = list(self._obj.dtypes[self._obj.dtypes == 'geos'].index)
+        if geometry is None:
+            geometry = geos_columns[0]
+        elif geometry not in geos_columns:
+            raise TypeError(f'Column "{geometry}" should be of "geos" type')
+
+        array = self._obj[geometry].array
+        order = np.argsort(curve_distance(curve, array.bounds, array.total_bounds, level), kind='stable')
+        return self._obj.take(order)
+
+    def sjoin(self, other, predicate='intersects', how='inner', left_on=None, right_on=None, lsuffix='left', rsuffix='right', distance=None):
+        """
+        Spatially join this DataFrame with another one.
+
+        The geometries of ``other`` are indexed with a cached :class:`~pgpd.GeosSpatialIndex`,
+        which is queried in bulk with all the geometries of this DataFrame.
+        The candidate pairs from the index are then refined with the given predicate,
+        so that the cost of the join scales with the number of matches instead of ``len(self) * len(other)``.
+
+        Args:
+            other (pandas.DataFrame or pandas.Series): DataFrame with a geos column or geos Series to join with.
+            predicate (str, optional): Binary predicate that should be true for ``predicate(self, other)``; Default **"intersects"**.
+            how ('inner' or 'left' or 'right', optional): Type of join to perform; Default **"inner"**.
+            left_on (str, optional): Name of the geos column in this DataFrame; Default **Infer if there is only one geos column**.
+            right_on (str, optional): Name of the geos column in the other DataFrame; Default **Infer if there is only one geos column**.
+            lsuffix (str, optional): Suffix to add to overlapping column names of this DataFrame; Default **"left"**.
+            rsuffix (str, optional): Suffix to add to overlapping column names of the other DataFrame; Default **"right"**.
+            distance (float or array-like, optional): Distance to use with the "dwithin" predicate; Default **None**.
+
+        Returns:
+            pandas.DataFrame:
+                Joined DataFrame with the columns of both DataFrames.
+                For "inner" and "left" joins, the index of this DataFrame is kept and the index of ``other`` is added as an "index_{rsuffix}" column.
+                For "right" joins, the index of ``other`` is kept and the index of this DataFrame is added as an "index_{lsuffix}" column.
+
+        Raises:
+            ValueError: Unknown ``how`` or ``predicate`` argument.
+
+        Example:
+            >>> left = pd.DataFrame({
+            ...     'a': list('abc'),
+            ...     'pt': shapely.points([0.5, 5.5, 20], 0.5),
+            ... }).astype({'pt': 'geos'})
+            >>> right = pd.DataFrame({
+            ...     'b': [10, 20],
+            ...     'poly': shapely.box([0, 5], 0, [1, 6], 1),
+            ... }).astype({'poly': 'geos'})
+            >>> left.geos.sjoin(right, predicate='within')
+               a               pt  index_right   b                                poly
+            0  a  POINT (0.5 0.5)            0  10  POLYGON ((1 0, 1 1, 0 1, 0 0, 1 0))
+            1  b  POINT (5.5 0.5)            1  20  POLYGON ((6 0, 6 1, 5 1, 5 0, 6 0))
+        """
+        return sjoin(self._obj, other, predicate, how, left_on, right_on, lsuffix, rsuffix, distance)
+
+    def sjoin_nearest(
+        self,
+        other,
+        k=1,
+        max_distance=None,
+        how='inner',
+        left_on=None,
+        right_on=None,
+        lsuffix='left',
+        rsuffix='right',
+        distance_col='distance',
+        exclusive=False,
+        all_matches=True,
+    ):
+        """
+        Join this DataFrame with the nearest geometries of another one.
+
+        The geometries of ``other`` are indexed with a cached :class:`~pgpd.GeosSpatialIndex`.
+        For ``k=1``, we use :func:`shapely.STRtree.query_nearest` directly.
+        For ``k>1``, we compute the distance to all candidates within a search radius and keep the k nearest ones.
+        Setting a ``max_distance`` bounds this search radius and thus the memory usage of the join,
+        otherwise we grow the radius of each geometry until it has enough candidates.
+
+        Args:
+            other (pandas.DataFrame or pandas.Series): DataFrame with a geos column or geos Series to join with.
+            k (int, optional): Number of nearest geometries to join with each geometry; Default **1**.
+            max_distance (float, optional): Maximum distance to search for nearest geometries; Default **None**.
+            how ('inner' or 'left' or 'right', optional): Type of join to perform; Default **"inner"**.
+            left_on (str, optional): Name of the geos column in this DataFrame; Default **Infer if there is only one geos column**.
+            right_on (str, optional): Name of the geos column in the other DataFrame; Default **Infer if there is only one geos column**.
+            lsuffix (str, optional): Suffix to add to overlapping column names of this DataFrame; Default **"left"**.
+            rsuffix (str, optional): Suffix to add to overlapping column names of the other DataFrame; Default **"right"**.
+            distance_col (str, optional): Name of the column with the distances, or **None** to not add it; Default **"distance"**.
+            exclusive (bool, optional): Whether to ignore geometries that are equal to the input geometry; Default **False**.
+            all_matches (bool, optional):
+                Whether to return all geometries that are tied with the k-th nearest geometry,
+                which means you might get more than k matches; Default **True**.
+
+        Returns:
+            pandas.DataFrame: Joined DataFrame (see :meth:`~pgpd.GeosDataFrameAccessor.sjoin`).
+
+        Raises:
+            ValueError: Unknown ``how`` argument or ``k`` is smaller than 1.
+            RuntimeError: ``k`` is larger than 1 and shapely is built against GEOS < 3.10.
+
+        Example:
+            >>> left = pd.DataFrame({
+            ...     'a': list('abc'),
+            ...     'pt': shapely.points([0, 5, 20], 0),
+            ... }).astype({'pt': 'geos'})
+            >>> right = pd.DataFrame({
+            ...     'b': [10, 20, 30],
+            ...     'line': shapely.linestrings([[[0, 1], [1, 1]], [[4, 2], [6, 2]], [[10, 0], [10, 5]]]),
+            ... }).astype({'line': 'geos'})
+            >>> left.geos.sjoin_nearest(right, k=2, max_distance=10)
+               a            pt  index_right   b                     line   distance
+            0  a   POINT (0 0)            0  10    LINESTRING (0 1, 1 1)   1.000000
+            0  a   POINT (0 0)            1  20    LINESTRING (4 2, 6 2)   4.472136
+            1  b   POINT (5 0)            1  20    LINESTRING (4 2, 6 2)   2.000000
+            1  b   POINT (5 0)            0  10    LINESTRING (0 1, 1 1)   4.123106
+            2  c  POINT (20 0)            2  30  LINESTRING (10 0, 10 5)  10.000000
+        """
+        return sjoin_nearest(self._obj, other, k, max_distance, how, left_on, right_on, lsuffix, rsuffix, distance_col, exclusive, all_matches)
+
 
 for name in dir(GeosSeriesAccessor):
     if name.startswith('__'):
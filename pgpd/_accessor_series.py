@@ -1,24 +1,22 @@
 #
 # Geos Accessor for Series
 #
-from math import cos, sin, tan
-
 import numpy as np
 import pandas as pd
-import shapely
 
+from ._affine import TransformChain, get_origin, rotate_matrix, scale_matrix, skew_matrix, translate_matrix
 from ._array import GeosArray
+from ._curves import curve_distance
 from ._delegated_series import (
     binary,
     enable_dataframe_expand,
-    unary_dataframe_indexed,
     unary_dataframe_keyed,
     unary_none,
     unary_return,
-    unary_series,
     unary_series_indexed,
     unary_series_keyed,
 )
+from ._lazy import LazyChain
 
 try:
     import geopandas as gpd
@@ -63,6 +61,7 @@ class GeosSeriesAccessor:
     """
 
     def __init__(self, obj):
+        self._converted = pd.api.types.pandas_dtype('geos') != obj.dtype
         if gpd is not None and pd.api.types.pandas_dtype('geometry') == obj.dtype:
             obj = pd.Series(GeosArray(np.asarray(obj.array)), name=obj.name, index=obj.index)
         elif pd.api.types.pandas_dtype('geos') != obj.dtype:
@@ -168,31 +167,29 @@ class GeosSeriesAccessor:
     # shapely/measurement.py
     # -------------------------------------------------------------------------
     area = unary_series_indexed('measurement.area')
-    bounds = unary_dataframe_indexed('measurement.bounds', ['xmin', 'ymin', 'xmax', 'ymax'])
     distance = binary('measurement.distance')
     frechet_distance = binary('measurement.frechet_distance')
     hausdorff_distance = binary('measurement.hausdorff_distance')
     length = unary_series_indexed('measurement.length')
     minimum_bounding_radius = unary_series_indexed('measurement.minimum_bounding_radius')
     minimum_clearance = unary_series_indexed('measurement.minimum_clearance')
-    total_bounds = unary_series('measurement.total_bounds', ['xmin', 'ymin', 'xmax', 'ymax'])
 
     # -------------------------------------------------------------------------
     # shapely/predicates.py
     # -------------------------------------------------------------------------
-    contains = binary('predicates.contains')
-    contains_properly = binary('predicates.contains_properly')
+    contains = binary('predicates.contains', sparse=True)
+    contains_properly = binary('predicates.contains_properly', sparse=True)
     contains_xy = unary_series_indexed('predicates.contains_xy')
-    covered_by = binary('predicates.covered_by')
-    covers = binary('predicates.covers')
-    crosses = binary('predicates.crosses')
+    covered_by = binary('predicates.covered_by', sparse=True)
+    covers = binary('predicates.covers', sparse=True)
+    crosses = binary('predicates.crosses', sparse=True)
     disjoint = binary('predicates.disjoint')
     dwithin = binary('predicates.within')
-    equals = binary('predicates.equals')
+    equals = binary('predicates.equals', sparse=True)
     equals_exact = binary('predicates.equals_exact')
     has_z = unary_series_indexed('predicates.has_z')
     has_m = unary_series_indexed('predicates.has_m')
-    intersects = binary('predicates.intersects')
+    intersects = binary('predicates.intersects', sparse=True)
     intersects_xy = unary_series_indexed('predicates.intersects_xy')
     is_ccw = unary_series_indexed('predicates.is_ccw')
     is_closed = unary_series_indexed('predicates.is_closed')
@@ -205,11 +202,11 @@ class GeosSeriesAccessor:
     is_valid = unary_series_indexed('predicates.is_valid')
     is_valid_input = unary_series_indexed('predicates.is_valid_input')
     is_valid_reason = unary_series_indexed('predicates.is_valid_reason')
-    overlaps = binary('predicates.overlaps')
+    overlaps = binary('predicates.overlaps', sparse=True)
     relate = binary('predicates.relate')
     relate_pattern = binary('predicates.relate_pattern')
-    touches = binary('predicates.touches')
-    within = binary('predicates.within')
+    touches = binary('predicates.touches', sparse=True)
+    within = binary('predicates.within', sparse=True)
 
     # -------------------------------------------------------------------------
     # shapely/set_operations.py
@@ -268,21 +265,113 @@ class GeosSeriesAccessor:
     # shapely/coordinates.py
     # -------------------------------------------------------------------------
     transform = unary_series_indexed('coordinates.transform', geos=True)
-    count_coordinates = unary_series_indexed('coordinates.count_coordinates')
+    count_coordinates = unary_series_indexed('coordinates.count_coordinates', parallel=False)
     get_coordinates_2d = unary_dataframe_keyed('coordinates.get_coordinates', ['x', 'y'], include_z=False, return_index=True)
     get_coordinates_3d = unary_dataframe_keyed('coordinates.get_coordinates', ['x', 'y', 'z'], include_z=True, return_index=True)
-    set_coordinates = unary_series_indexed('coordinates.set_coordinates', geos=True)
 
     # -------------------------------------------------------------------------
     # shapely/strtree.py
     # -------------------------------------------------------------------------
     STRtree = unary_return('strtree.STRtree')
 
+    @property
+    def sindex(self):
+        """
+        Cached spatial index of the data.
+
+        The index is built once per underlying :class:`~pgpd.GeosArray` and reused for every subsequent query.
+        It gets invalidated when the data is modified.
+
+        Returns:
+            pgpd.GeosSpatialIndex: Spatial index which can return both positional indices and labels of the Series.
+
+        Example:
+            >>> s = pd.Series(shapely.points(range(5), 0), index=list('abcde'), dtype='geos')
+            >>> s.geos.sindex.query_nearest(shapely.points(2.2, 1), labels=True)
+            Index(['c'], dtype='object')
+        """
+        return self._obj.array.sindex._with_index(self._obj.index)
+
     # -------------------------------------------------------------------------
     # Custom Methods
     # -------------------------------------------------------------------------
+    def bounds(self):
+        """
+        Computes the bounds (extent) of the geometries. |br|
+        The bounds are cached in the underlying :class:`~pgpd.GeosArray` (see :attr:`pgpd.GeosArray.bounds`).
+
+        Returns:
+            pandas.DataFrame: DataFrame with the "xmin", "ymin", "xmax" and "ymax" of each geometry.
+        """
+        return pd.DataFrame(self._obj.array.bounds, index=self._obj.index, columns=['xmin', 'ymin', 'xmax', 'ymax'], copy=True)
+
+    @enable_dataframe_expand(2)
+    def total_bounds(self):
+        """
+        Computes the total bounds (extent) of the geometries. |br|
+        This is a reduction of the bounds that are cached in the underlying :class:`~pgpd.GeosArray` (see :attr:`pgpd.GeosArray.total_bounds`).
+
+        Returns:
+            pandas.Series: Series with the "xmin", "ymin", "xmax" and "ymax" of all the geometries.
+        """
+        return pd.Series(self._obj.array.total_bounds, index=['xmin', 'ymin', 'xmax', 'ymax'], name='total_bounds', copy=True)
+
+    def memory_report(self):
+        """
+        Break down the estimated memory of the geometries by geometry type. |br|
+        The estimate is based on the coordinates, coordinate sequences and parts of the geometries (see :meth:`pgpd.GeosArray.memory_usage`).
+
+        Returns:
+            pandas.DataFrame: DataFrame with the number of geometries, coordinates and estimated bytes for each geometry type.
+
+        Example:
+            >>> s = pd.Series([*shapely.points(range(3), 0), shapely.box(0, 0, 1, 1), None], dtype='geos')
+            >>> s.geos.memory_report()
+                           count  coordinates  bytes
+            geometry_type
+            POINT              3            3    480
+            POLYGON            1            5    392
+        """
+        return self._obj.array.memory_report()
+
+    def hilbert_distance(self, total_bounds=None, level=16):
+        """
+        Computes the distance along a Hilbert curve of the center of the bounding box of each geometry. |br|
+        Sorting geometries by this distance keeps geometries that are close to each other together.
+
+        Args:
+            total_bounds (array-like, optional): Extent that is covered by the curve; Default **total bounds of the Series**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+        Returns:
+            pandas.Series: int64 distances, where missing or empty geometries get a distance of ``2**(2*level)``.
+        """
+        return self._curve_distance('hilbert', total_bounds, level)
+
+    def morton_distance(self, total_bounds=None, level=16):
+        """
+        Computes the distance along a Morton (Z-order) curve of the center of the bounding box of each geometry. |br|
+        This is cheaper to compute than :meth:`~pgpd.GeosSeriesAccessor.hilbert_distance`, but has a worse spatial locality.
+
+        Args:
+            total_bounds (array-like, optional): Extent that is covered by the curve; Default **total bounds of the Series**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+        Returns:
+            pandas.Series: int64 distances, where missing or empty geometries get a distance of ``2**(2*level)``.
+        """
+        return self._curve_distance('morton', total_bounds, level)
+
+    def _curve_distance(self, curve, total_bounds, level):
+        array = self._obj.array
+        if total_bounds is None:
+            total_bounds = array.total_bounds
+
+        result = curve_distance(curve, array.bounds, total_bounds, level)
+        return pd.Series(result, index=self._obj.index, name=f'{curve}_distance')
+
     @enable_dataframe_expand
-    def affine(self, matrix):
+    def affine(self, matrix, inplace=False):
         r"""
         Performs a 2D or 3D affine transformation on all the coordinates.
 
@@ -321,9 +410,10 @@ class GeosSeriesAccessor:
 
         Args:
             matrix (numpy.ndarray or list-like): Affine transformation matrix.
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
 
         Returns:
-            pandas.Series: Transformed geometries.
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
 
         Note:
             The transformation matrix can be one of the following types:
@@ -336,12 +426,56 @@ class GeosSeriesAccessor:
               Performs a 3D affine transformation, where the last row of homogeneous coordinates can optionally be discarded.
             - list-like <12> |br|
               Performs a 3D affine transformation, where the `matrix` represents **(a, b, c, d, e, f, g, h, i, xoff, yoff, zoff)**.
+
+            When working inplace, the transformed geometries replace the original ones in the existing :class:`~pgpd.GeosArray`,
+            so that the transformation does not need memory for a second copy of the geometries.
+            This is also the case for the other coordinate transformations (eg. :meth:`~pgpd.GeosSeriesAccessor.rotate`).
         """
-        result = self._obj.array.affine(matrix)
-        return pd.Series(result, index=self._obj.index, name='affine')
+        return self._affine(matrix, 'affine', inplace)
+
+    def transform_chain(self):
+        """
+        Create a deferred chain of affine transformations.
+
+        The rotations, scalings, skews, translations and affine transformations of the chain are composed into a single matrix,
+        which is only applied to the coordinates when calling :meth:`~pgpd._affine.TransformChain.apply`.
+        This avoids extracting the coordinates and creating new geometries for each individual transformation.
+
+        Returns:
+            pgpd._affine.TransformChain: Chain of transformations for this Series.
+
+        Example:
+            >>> s = pd.Series(shapely.box(range(3), 0, range(1, 4), 1), dtype='geos')
+            >>> s.geos.transform_chain().scale(2, 1, origin='center').translate(0, 1).apply()
+            0    POLYGON ((1.5 1, 1.5 2, -0.5 2, -0.5 1, 1.5 1))
+            1      POLYGON ((2.5 1, 2.5 2, 0.5 2, 0.5 1, 2.5 1))
+            2      POLYGON ((3.5 1, 3.5 2, 1.5 2, 1.5 1, 3.5 1))
+            Name: affine, dtype: geos
+        """
+        return TransformChain(self._obj, self)
+
+    def lazy(self):
+        """
+        Create a deferred chain of elementwise shapely functions.
+
+        The functions of the chain are computed together on chunks of rows, when calling :meth:`~pgpd._lazy.LazyChain.collect`.
+        This avoids creating an intermediate Series with all the geometries for each individual step.
+
+        Returns:
+            pgpd._lazy.LazyChain: Chain of functions for this Series.
+
+        Example:
+            >>> s = pd.Series(shapely.box(range(3), 0, range(1, 4), 1), dtype='geos')
+            >>> s.geos.lazy().make_valid().buffer(1).simplify(0.5).area().collect()
+            0    6.199217
+            1    6.199217
+            2    6.199217
+            Name: area, dtype: float64
+        """
+        return LazyChain(self._obj)
 
     @enable_dataframe_expand
-    def rotate(self, *angles, origin):
+    def rotate(self, *angles, origin, inplace=False):
         r"""
         Performs a 2D or 3D rotation on all the coordinates.
 
@@ -395,69 +529,23 @@ class GeosSeriesAccessor:
                 z_{off} &= z_{origin} - (g)*x_{origin} - (h)*y_{origin} - (i)*z_{origin}
 
         Args:
-            angles (float): 2D rotation angle or X,Y,Z 3D rotation angles in radians.
-            origin (shapely.lib.Geometry or list-like): Origin point for the transformation.
+            angles (float or array-like): 2D rotation angle or X,Y,Z 3D rotation angles in radians.
+            origin (shapely.lib.Geometry or list-like or str): Origin point for the transformation (see Note).
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
 
         Returns:
-            pandas.Series: Transformed geometries.
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
+
+        Note:
+            All values can be scalars or arrays with a value for each geometry, in which case a different matrix is applied to each geometry.
+            The origin can be a point geometry, a list-like with 2 or 3 coordinates,
+            a ``<Nx2>`` or ``<Nx3>`` array or an array of points with an origin for each geometry,
+            or one of the strings "center" (center of the bounding box) or "centroid" of each geometry.
         """
-        if origin is None:
-            origin = (0, 0, 0)
-        elif isinstance(origin, shapely.lib.Geometry):
-            if shapely.get_type_id(origin) != 0:
-                raise TypeError('Origin should be a single point geometry')
-            origin = np.nan_to_num(shapely.get_coordinates(origin, True)).squeeze()
-
-        if len(angles) == 1:
-            x0, y0 = origin[:2]
-            ca = cos(angles[0])
-            sa = sin(angles[0])
-            result = self._obj.array.affine(
-                (
-                    ca,
-                    -sa,
-                    sa,
-                    ca,
-                    x0 - x0 * ca + y0 * sa,
-                    y0 - x0 * sa - y0 * ca,
-                )
-            )
-        elif len(angles) == 3:
-            x0, y0, z0 = origin[:3]
-            cx, cy, cz = (cos(a) for a in angles)
-            sx, sy, sz = (sin(a) for a in angles)
-            a = cz * cy
-            b = cz * sy * sx - sz * cx
-            c = cz * sy * cx + sz * sx
-            d = sz * cy
-            e = sz * sy * sx + cz * cx
-            f = sz * sy * cx - cz * sx
-            g = -sy
-            h = cy * sx
-            i = cy * cx
-            result = self._obj.array.affine(
-                (
-                    a,
-                    b,
-                    c,
-                    d,
-                    e,
-                    f,
-                    g,
-                    h,
-                    i,
-                    x0 - a * x0 - b * y0 - c * z0,
-                    y0 - d * x0 - e * y0 - f * z0,
-                    z0 - g * x0 - h * y0 - i * z0,
-                )
-            )
-        else:
-            raise ValueError('The rotate transformation requires 1 or 3 angles')
-
-        return pd.Series(result, index=self._obj.index, name='rotate')
+        return self._affine(rotate_matrix(angles, *get_origin(origin, self._obj.array.data)), 'rotate', inplace)
 
     @enable_dataframe_expand
-    def scale(self, x, y, z=None, *, origin=None):
+    def scale(self, x, y, z=None, *, origin=None, inplace=False):
         r"""
         Performs a 2D or 3D scaling on all the coordinates.
 
@@ -502,56 +590,25 @@ class GeosSeriesAccessor:
                 z_{off} &= z_{origin} - z_{origin}*z_s
 
         Args:
-            x (float): Scaling value in the X direction.
-            y (float): Scaling value in the Y direction.
-            z (float, optional): Scaling value in the Z direction; Default **None**.
-            origin (shapely.lib.Geometry or list-like): Origin point for the transformation.
+            x (float or array-like): Scaling value in the X direction.
+            y (float or array-like): Scaling value in the Y direction.
+            z (float or array-like, optional): Scaling value in the Z direction; Default **None**.
+            origin (shapely.lib.Geometry or list-like or str, optional): Origin point for the transformation (see Note); Default **(0, 0, 0)**.
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
 
         Returns:
-            pandas.Series: Transformed geometries.
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
+
+        Note:
+            All values can be scalars or arrays with a value for each geometry, in which case a different matrix is applied to each geometry.
+            The origin can be a point geometry, a list-like with 2 or 3 coordinates,
+            a ``<Nx2>`` or ``<Nx3>`` array or an array of points with an origin for each geometry,
+            or one of the strings "center" (center of the bounding box) or "centroid" of each geometry.
         """
-        if origin is None:
-            origin = (0, 0, 0)
-        elif isinstance(origin, shapely.lib.Geometry):
-            if shapely.get_type_id(origin) != 0:
-                raise TypeError('Origin should be a single point geometry')
-            origin = np.nan_to_num(shapely.get_coordinates(origin, True)).squeeze()
-
-        if z is None:
-            x0, y0 = origin[:2]
-            result = self._obj.array.affine(
-                (
-                    x,
-                    0,
-                    0,
-                    y,
-                    x0 - x * x0,
-                    y0 - y * y0,
-                )
-            )
-        else:
-            x0, y0, z0 = origin[:3]
-            result = self._obj.array.affine(
-                (
-                    x,
-                    0,
-                    0,
-                    0,
-                    y,
-                    0,
-                    0,
-                    0,
-                    z,
-                    x0 - x * x0,
-                    y0 - y * y0,
-                    z0 - z * z0,
-                )
-            )
-
-        return pd.Series(result, index=self._obj.index, name='scale')
+        return self._affine(scale_matrix(x, y, z, *get_origin(origin, self._obj.array.data)), 'scale', inplace)
 
     @enable_dataframe_expand
-    def skew(self, *angles, origin=None):
+    def skew(self, *angles, origin=None, inplace=False):
         r"""
         Performs a 2D or 3D skew/shear transformation on all the coordinates.
 
@@ -596,58 +653,23 @@ class GeosSeriesAccessor:
                 z_{off} &= -(x_{origin}*a_{zx} + y_{origin}*a_{zy})
 
         Args:
-            angles (float): skewing angles (2D: ``[x, y]`` ; 3D: ``[xy, xz, yx, yz, zx, zy]``)
-            origin (shapely.lib.Geometry or list-like): Origin point for the transformation.
+            angles (float or array-like): skewing angles (2D: ``[x, y]`` ; 3D: ``[xy, xz, yx, yz, zx, zy]``)
+            origin (shapely.lib.Geometry or list-like or str, optional): Origin point for the transformation (see Note); Default **(0, 0, 0)**.
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
 
         Returns:
-            pandas.Series: Transformed geometries.
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
+
+        Note:
+            All values can be scalars or arrays with a value for each geometry, in which case a different matrix is applied to each geometry.
+            The origin can be a point geometry, a list-like with 2 or 3 coordinates,
+            a ``<Nx2>`` or ``<Nx3>`` array or an array of points with an origin for each geometry,
+            or one of the strings "center" (center of the bounding box) or "centroid" of each geometry.
         """
-        if origin is None:
-            origin = (0, 0, 0)
-        elif isinstance(origin, shapely.lib.Geometry):
-            if shapely.get_type_id(origin) != 0:
-                raise TypeError('Origin should be a single point geometry')
-            origin = np.nan_to_num(shapely.get_coordinates(origin, True)).squeeze()
-
-        if len(angles) == 2:
-            x0, y0 = origin[:2]
-            x, y = (tan(a) for a in angles)
-            result = self._obj.array.affine(
-                (
-                    1,
-                    x,
-                    y,
-                    1,
-                    -(y0 * x),
-                    -(x0 * y),
-                )
-            )
-        elif len(angles) == 6:
-            x0, y0, z0 = origin[:3]
-            xy, xz, yx, yz, zx, zy = (tan(a) for a in angles)
-            result = self._obj.array.affine(
-                (
-                    1,
-                    xy,
-                    xz,
-                    yx,
-                    1,
-                    yz,
-                    zx,
-                    zy,
-                    1,
-                    -(y0 * xy + z0 * xz),
-                    -(x0 * yx + z0 * yz),
-                    -(x0 * zx + y0 * zy),
-                )
-            )
-        else:
-            raise ValueError('The skew transformation requires 2 or 6 angles')
-
-        return pd.Series(result, index=self._obj.index, name='skew')
+        return self._affine(skew_matrix(angles, *get_origin(origin, self._obj.array.data)), 'skew', inplace)
 
     @enable_dataframe_expand
-    def translate(self, x, y, z=None):
+    def translate(self, x, y, z=None, *, inplace=False):
         r"""
         Performs a 2D or 3D translation on all the coordinates.
 
@@ -685,12 +707,49 @@ class GeosSeriesAccessor:
                 \end{bmatrix}
 
         Args:
-            x (float): Translation value in the X direction.
-            y (float): Translation value in the Y direction.
-            z (float, optional): Translation value in the Z direction; Default **None**.
+            x (float or array-like): Translation value in the X direction.
+            y (float or array-like): Translation value in the Y direction.
+            z (float or array-like, optional): Translation value in the Z direction; Default **None**.
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
+
+        Returns:
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
+
+        Note:
+            The translation values can be scalars or arrays with a value for each geometry.
+        """
+        return self._affine(translate_matrix(x, y, z), 'translate', inplace)
+
+    @enable_dataframe_expand
+    def set_coordinates(self, coordinates, inplace=False):
+        """
+        Replace the coordinates of the geometries. |br|
+        This function is a wrapper around :func:`shapely.coordinates.set_coordinates`.
+
+        Args:
+            coordinates (array-like): ``<Mx2>`` or ``<Mx3>`` coordinates, in the order of :meth:`~pgpd.GeosSeriesAccessor.get_coordinates_2d`.
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
 
         Returns:
-            pandas.Series: Transformed geometries.
+            pandas.Series or None: Geometries with the new coordinates or None if ``inplace=True``.
         """
-        result = self._obj.array.affine((1, 0, 0, 1, x, y)) if z is None else self._obj.array.affine((1, 0, 0, 0, 1, 0, 0, 0, 1, x, y, z))
-        return pd.Series(result, index=self._obj.index, name='translate')
+        if inplace:
+            self._check_inplace()
+            self._obj.array.set_coordinates(coordinates, inplace=True)
+            return None
+
+        result = self._obj.array.set_coordinates(coordinates)
+        return pd.Series(result, index=self._obj.index, name='set_coordinates')
+
+    def _affine(self, matrix, name, inplace):
+        if inplace:
+            self._check_inplace()
+            self._obj.array.affine(matrix, inplace=True)
+            return None
+
+        result = self._obj.array.affine(matrix)
+        return pd.Series(result, index=self._obj.index, name=name)
+
+    def _check_inplace(self):
+        if self._converted:
+            raise ValueError('Inplace modifications are only possible on Series of "geos" dtype')
@@ -0,0 +1,438 @@
+#
+# Vectorized affine transformations
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+__all__ = [
+    'TransformChain',
+    'affine',
+    'build_matrix',
+    'get_origin',
+    'rotate_matrix',
+    'scale_matrix',
+    'skew_matrix',
+    'to_matrix',
+    'translate_matrix',
+]
+
+
+def affine(data, matrix, inplace=False):
+    """
+    Apply an affine transformation matrix to all the coordinates of the geometries.
+
+    The coordinates are extracted once as a flat ``<Mx2>`` or ``<Mx3>`` buffer,
+    which gets multiplied by the linear part of the matrix, after which the offsets are added in place.
+    Per-geometry matrices are broadcast to the coordinates with the geometry index of :func:`shapely.get_coordinates`.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries.
+        matrix (numpy.ndarray or list-like): Affine transformation matrix (see :meth:`pgpd.GeosArray.affine`).
+        inplace (bool, optional): Whether to replace the geometries in the ``data`` array instead of a copy; Default **False**.
+
+    Returns:
+        numpy.ndarray: Transformed geometries.
+    """
+    matrix, zdim = to_matrix(matrix)
+    if matrix.ndim == 3 and matrix.shape[0] != data.shape[0]:
+        raise ValueError(f'Number of matrices ({matrix.shape[0]}) should be equal to the number of geometries ({data.shape[0]})')
+
+    coords, index = get_coordinates(data, zdim, matrix.ndim == 3)
+    coords = transform_coordinates(coords, matrix, index)
+    return shapely.set_coordinates(data if inplace else data.copy(), coords)
+
+
+def get_coordinates(data, zdim, return_index):
+    """
+    Get the flat coordinate buffer of the geometries.
+
+    2D geometries have a NaN Z coordinate when ``zdim=True``, which we set to zero so that they do not spread NaN values to X and Y.
+    Their Z coordinates are ignored again when setting the coordinates.
+    """
+    if return_index:
+        coords, index = shapely.get_coordinates(data, include_z=zdim, return_index=True)
+    else:
+        coords, index = shapely.get_coordinates(data, include_z=zdim), None
+
+    if zdim:
+        z = coords[:, 2]
+        z[np.isnan(z)] = 0
+
+    return coords, index
+
+
+def transform_coordinates(coords, matrix, index=None):
+    """
+    Apply an affine transformation matrix to a coordinate buffer.
+
+    Args:
+        coords (numpy.ndarray): ``<Mx2>`` or ``<Mx3>`` coordinates.
+        matrix (numpy.ndarray): ``<3x3>`` or ``<4x4>`` matrix or a ``<Nx3x3>`` or ``<Nx4x4>`` stack of matrices.
+        index (numpy.ndarray, optional): Index of the matrix for each coordinate, when using a stack of matrices.
+
+    Returns:
+        numpy.ndarray: Transformed coordinates.
+    """
+    dim = matrix.shape[-1] - 1
+    if matrix.ndim == 2:
+        result = coords @ matrix[:dim, :dim].T
+        result += matrix[:dim, dim]
+        return result
+
+    # Compute each output dimension separately, so that we only gather one matrix element per coordinate at a time
+    result = np.empty_like(coords)
+    for i in range(dim):
+        row = matrix[:, i]
+        out = result[:, i]
+        np.multiply(coords[:, 0], row[index, 0], out=out)
+        for j in range(1, dim):
+            out += coords[:, j] * row[index, j]
+        out += row[index, dim]
+
+    return result
+
+
+def to_matrix(matrix):
+    """
+    Convert the different matrix formats of :meth:`pgpd.GeosArray.affine` into full homogeneous matrices.
+
+    Returns:
+        tuple: ``<3x3>``, ``<4x4>``, ``<Nx3x3>`` or ``<Nx4x4>`` float matrix and whether it is a 3D transformation.
+    """
+    if isinstance(matrix, np.ndarray) and matrix.dtype != object and matrix.ndim in (2, 3):
+        r, c = matrix.shape[-2:]
+        if (r, c) not in ((2, 3), (3, 3), (3, 4), (4, 4)):
+            raise ValueError(f'Affine matrix should be of shape <3x3>, <2x3>, <4x4> or <3x4>, not <{r}x{c}>')
+
+        zdim = c == 4
+        full = np.zeros((*matrix.shape[:-2], c, c), dtype=float)
+        full[..., :r, :] = matrix
+        full[..., c - 1, c - 1] = 1
+        return full, zdim
+
+    if len(matrix) == 6:
+        return build_matrix(matrix, False), False
+    if len(matrix) == 12:
+        return build_matrix(matrix, True), True
+
+    raise ValueError('Affine matrix should be a numpy array or a list-like of 6 or 12 values')
+
+
+def build_matrix(values, zdim):
+    """
+    Build homogeneous matrices from their individual elements.
+
+    Args:
+        values (list-like): ``(a, b, d, e, xoff, yoff)`` or ``(a, b, c, d, e, f, g, h, i, xoff, yoff, zoff)``,
+            where each value is either a scalar or an array with a value per geometry.
+        zdim (bool): Whether the values represent a 3D transformation.
+
+    Returns:
+        numpy.ndarray: ``<3x3>`` or ``<4x4>`` matrix if all values are scalars, otherwise a ``<Nx3x3>`` or ``<Nx4x4>`` stack.
+    """
+    dim = 3 if zdim else 2
+    values = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+    if values[0].ndim > 1:
+        raise ValueError('Affine values should be scalars or 1D arrays')
+
+    matrix = np.zeros((*values[0].shape, dim + 1, dim + 1), dtype=float)
+    for k, value in enumerate(values[: dim * dim]):
+        matrix[..., k // dim, k % dim] = value
+    for k, value in enumerate(values[dim * dim :]):
+        matrix[..., k, dim] = value
+    matrix[..., dim, dim] = 1
+
+    return matrix
+
+
+def rotate_matrix(angles, x0, y0, z0):
+    """Build the matrix of a 2D (1 angle) or 3D (3 angles) rotation around an origin."""
+    angles = [np.asarray(a, dtype=float) for a in angles]
+    if len(angles) == 1:
+        ca = np.cos(angles[0])
+        sa = np.sin(angles[0])
+        return build_matrix((ca, -sa, sa, ca, x0 - x0 * ca + y0 * sa, y0 - x0 * sa - y0 * ca), False)
+
+    if len(angles) == 3:
+        cx, cy, cz = (np.cos(a) for a in angles)
+        sx, sy, sz = (np.sin(a) for a in angles)
+        a = cz * cy
+        b = cz * sy * sx - sz * cx
+        c = cz * sy * cx + sz * sx
+        d = sz * cy
+        e = sz * sy * sx + cz * cx
+        f = sz * sy * cx - cz * sx
+        g = -sy
+        h = cy * sx
+        i = cy * cx
+        return build_matrix(
+            (
+                a,
+                b,
+                c,
+                d,
+                e,
+                f,
+                g,
+                h,
+                i,
+                x0 - a * x0 - b * y0 - c * z0,
+                y0 - d * x0 - e * y0 - f * z0,
+                z0 - g * x0 - h * y0 - i * z0,
+            ),
+            True,
+        )
+
+    raise ValueError('The rotate transformation requires 1 or 3 angles')
+
+
+def scale_matrix(x, y, z, x0, y0, z0):
+    """Build the matrix of a 2D (z is None) or 3D scaling around an origin."""
+    if z is None:
+        return build_matrix((x, 0, 0, y, x0 - x * x0, y0 - y * y0), False)
+    return build_matrix((x, 0, 0, 0, y, 0, 0, 0, z, x0 - x * x0, y0 - y * y0, z0 - z * z0), True)
+
+
+def skew_matrix(angles, x0, y0, z0):
+    """Build the matrix of a 2D (2 angles) or 3D (6 angles) skew around an origin."""
+    if len(angles) == 2:
+        x, y = (np.tan(a) for a in angles)
+        return build_matrix((1, x, y, 1, -(y0 * x), -(x0 * y)), False)
+
+    if len(angles) == 6:
+        xy, xz, yx, yz, zx, zy = (np.tan(a) for a in angles)
+        return build_matrix(
+            (
+                1,
+                xy,
+                xz,
+                yx,
+                1,
+                yz,
+                zx,
+                zy,
+                1,
+                -(y0 * xy + z0 * xz),
+                -(x0 * yx + z0 * yz),
+                -(x0 * zx + y0 * zy),
+            ),
+            True,
+        )
+
+    raise ValueError('The skew transformation requires 2 or 6 angles')
+
+
+def translate_matrix(x, y, z):
+    """Build the matrix of a 2D (z is None) or 3D translation."""
+    if z is None:
+        return build_matrix((1, 0, 0, 1, x, y), False)
+    return build_matrix((1, 0, 0, 0, 1, 0, 0, 0, 1, x, y, z), True)
+
+
+def get_origin(origin, data):
+    """
+    Get the X, Y and Z coordinates of the origin of a transformation.
+
+    Args:
+        origin (None or str or shapely.lib.Geometry or array-like):
+            The origin can be one of the following:
+
+            - *None*: ``(0, 0, 0)``
+            - *"center"*: Center of the bounding box of each geometry.
+            - *"centroid"*: Centroid of each geometry.
+            - *shapely.lib.Geometry*: Point geometry.
+            - *list-like <2> or <3>*: Single coordinate.
+            - *numpy.ndarray <Nx2> or <Nx3>*: Coordinate for each geometry.
+            - *array-like of shapely.lib.Geometry*: Point for each geometry.
+        data (numpy.ndarray): Shapely geometries that are being transformed.
+
+    Returns:
+        tuple: X, Y and Z coordinates, which are either scalars or arrays with a value for each geometry.
+    """
+    if origin is None:
+        return 0.0, 0.0, 0.0
+
+    if isinstance(origin, str):
+        if origin == 'center':
+            bounds = shapely.bounds(data)
+            return (bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2, 0.0
+        if origin == 'centroid':
+            return get_point_coordinates(shapely.centroid(data))
+        raise ValueError(f'Origin should be "center", "centroid", a point or coordinates, not "{origin}"')
+
+    if isinstance(origin, shapely.lib.Geometry):
+        return tuple(float(c) for c in get_point_coordinates(np.array([origin])))
+
+    if isinstance(origin, pd.Series):
+        origin = origin.array
+    origin = np.asarray(origin)
+    if origin.dtype == object:
+        return get_point_coordinates(origin)
+
+    if origin.ndim == 1 and origin.shape[0] in (2, 3):
+        return origin[0], origin[1], origin[2] if origin.shape[0] == 3 else 0.0
+    if origin.ndim == 2 and origin.shape[1] in (2, 3):
+        return origin[:, 0], origin[:, 1], origin[:, 2] if origin.shape[1] == 3 else 0.0
+
+    raise ValueError('Origin should be a list-like with 2 or 3 values or an array of shape <Nx2> or <Nx3>')
+
+
+def get_point_coordinates(points):
+    """Return the X, Y and Z coordinates of point geometries, where missing coordinates are set to zero."""
+    if not np.isin(shapely.get_type_id(points), (-1, 0)).all():
+        raise TypeError('Origin should only contain point geometries')
+
+    return (
+        np.nan_to_num(shapely.get_x(points)),
+        np.nan_to_num(shapely.get_y(points)),
+        np.nan_to_num(shapely.get_z(points)),
+    )
+
+
+class TransformChain:
+    """
+    Deferred chain of affine transformations, which is created with :meth:`pgpd.GeosSeriesAccessor.transform_chain`.
+
+    Every transformation of the chain only multiplies its matrix with the composed matrix of the previous ones,
+    so that :meth:`~pgpd._affine.TransformChain.apply` only needs to extract, transform and set the coordinates once.
+    The transformations accept the same arguments as their :class:`~pgpd.GeosSeriesAccessor` counterparts.
+    String origins ("center" and "centroid") are computed from the geometries as they are transformed by the previous steps of the chain.
+    The "center" origin is computed from the transformed coordinates directly,
+    but a "centroid" origin after other transformations requires to create the intermediate geometries.
+
+    Note:
+        If the Series mixes 2D and 3D geometries, 3D transformations in the chain carry the intermediate Z coordinates of 2D geometries
+        to the next steps, whereas applying the transformations one by one would drop them after each step.
+
+    Args:
+        obj (pandas.Series): Series with geos data to transform.
+        accessor (pgpd.GeosSeriesAccessor, optional): Accessor that created the chain, which validates inplace modifications; Default **obj.geos**.
+
+    Example:
+        >>> s = pd.Series(shapely.box(range(3), 0, range(1, 4), 1), dtype='geos')
+        >>> s.geos.transform_chain().scale(2, 1, origin='center').translate(0, 1).apply()
+        0    POLYGON ((1.5 1, 1.5 2, -0.5 2, -0.5 1, 1.5 1))
+        1      POLYGON ((2.5 1, 2.5 2, 0.5 2, 0.5 1, 2.5 1))
+        2      POLYGON ((3.5 1, 3.5 2, 1.5 2, 1.5 1, 3.5 1))
+        Name: affine, dtype: geos
+    """
+
+    def __init__(self, obj, accessor=None):
+        self._obj = obj
+        self._accessor = accessor if accessor is not None else obj.geos
+        self._matrix = None
+        self._z = None
+
+    def __repr__(self):
+        shape = 'none' if self._matrix is None else 'x'.join(str(s) for s in self._matrix.shape)
+        return f'<{self.__class__.__name__}: matrix={shape}>'
+
+    @property
+    def matrix(self):
+        """Composed homogeneous matrix (or stack of matrices) of all transformations or None if the chain is empty."""
+        return self._matrix
+
+    def affine(self, matrix):
+        """Add an affine transformation (see :meth:`pgpd.GeosSeriesAccessor.affine`)."""
+        return self._compose(to_matrix(matrix)[0])
+
+    def rotate(self, *angles, origin):
+        """Add a rotation (see :meth:`pgpd.GeosSeriesAccessor.rotate`)."""
+        return self._compose(rotate_matrix(angles, *self._get_origin(origin)))
+
+    def scale(self, x, y, z=None, *, origin=None):
+        """Add a scaling (see :meth:`pgpd.GeosSeriesAccessor.scale`)."""
+        return self._compose(scale_matrix(x, y, z, *self._get_origin(origin)))
+
+    def skew(self, *angles, origin=None):
+        """Add a skew (see :meth:`pgpd.GeosSeriesAccessor.skew`)."""
+        return self._compose(skew_matrix(angles, *self._get_origin(origin)))
+
+    def translate(self, x, y, z=None):
+        """Add a translation (see :meth:`pgpd.GeosSeriesAccessor.translate`)."""
+        return self._compose(translate_matrix(x, y, z))
+
+    def apply(self, inplace=False):
+        """
+        Apply the composed transformation to the geometries.
+
+        Args:
+            inplace (bool, optional): Whether to replace the geometries of the Series instead of returning a new one; Default **False**.
+
+        Returns:
+            pandas.Series or None: Transformed geometries or None if ``inplace=True``.
+        """
+        if inplace:
+            # Use the same validation as the inplace transformations of the accessor
+            self._accessor._check_inplace()
+            if self._matrix is not None:
+                self._obj.array.affine(self._matrix, inplace=True)
+            return None
+
+        array = self._obj.array
+        result = array.copy() if self._matrix is None else array.affine(self._matrix)
+        return pd.Series(result, index=self._obj.index, name='affine')
+
+    def _compose(self, matrix):
+        if self._matrix is None:
+            self._matrix = matrix
+            return self
+
+        # Mixing 2D and 3D transformations results in a 3D transformation
+        previous = self._matrix
+        if matrix.shape[-1] != previous.shape[-1]:
+            matrix, previous = to_3d(matrix), to_3d(previous)
+
+        self._matrix = matrix @ previous
+        if self._matrix.shape[-1] == 4 and not self._has_z():
+            # 2D geometries lose their Z coordinate after each individual transformation
+            self._matrix[..., 2, :] = 0
+        return self
+
+    def _has_z(self):
+        if self._z is None:
+            self._z = bool(shapely.has_z(self._obj.array.data).any())
+        return self._z
+
+    def _get_origin(self, origin):
+        if self._matrix is None or not isinstance(origin, str):
+            return get_origin(origin, self._obj.array.data)
+
+        data = self._obj.array.data
+        if origin == 'centroid':
+            # Centroids of lines are not preserved by all affine transformations, so we need the intermediate geometries
+            return get_origin(origin, affine(data, self._matrix))
+
+        if origin == 'center':
+            return transformed_center(data, self._matrix)
+
+        return get_origin(origin, data)
+
+
+def transformed_center(data, matrix):
+    """Compute the center of the bounding box of the transformed geometries, without creating the transformed geometries."""
+    coords, index = get_coordinates(data, matrix.shape[-1] == 4, True)
+    coords = transform_coordinates(coords, matrix, index if matrix.ndim == 3 else None)
+
+    center = np.full((len(data), 2), np.nan)
+    if len(index):
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+        lower = np.minimum.reduceat(coords[:, :2], starts)
+        upper = np.maximum.reduceat(coords[:, :2], starts)
+        center[index[starts]] = (lower + upper) / 2
+
+    return center[:, 0], center[:, 1], 0.0
+
+
+def to_3d(matrix):
+    """Convert 2D homogeneous matrices to 3D ones, which leave the Z coordinate untouched."""
+    if matrix.shape[-1] == 4:
+        return matrix
+
+    result = np.zeros((*matrix.shape[:-2], 4, 4), dtype=float)
+    result[..., :2, :2] = matrix[..., :2, :2]
+    result[..., :2, 3] = matrix[..., :2, 2]
+    result[..., 2, 2] = 1
+    result[..., 3, 3] = 1
+    return result
@@ -0,0 +1,68 @@
+#
+# Coordinate arithmetic
+#
+import shapely
+
+from ._affine import get_coordinates
+from ._options import options
+
+__all__ = ['arithmetic', 'operand_zdim']
+
+
+def operand_zdim(other):
+    """
+    Decide whether the Z-dimension is used for the computation from the shape of the operand.
+
+    Returns:
+        bool or None: Whether to use the Z-dimension or None if it depends on the geometries.
+    """
+    zshape = other.ndim == 2 and other.shape[1]
+    if zshape == 2:
+        return False
+    if zshape == 3:
+        return True
+    return None
+
+
+def arithmetic(data, other, op, zdim, reverse=False):
+    """
+    Apply an arithmetic ufunc between the coordinates of the geometries and an operand.
+
+    The coordinates are extracted once as a flat ``<Mx2>`` or ``<Mx3>`` buffer and the operation is computed in place on that buffer.
+    Operands with a row per geometry are gathered with the geometry index of :func:`shapely.get_coordinates`,
+    one block of coordinates at a time (see :attr:`pgpd.options.block_memory <pgpd._options.Options>`),
+    so that we never create a full per-coordinate copy of the operand.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries, which get modified in place.
+        other (numpy.ndarray): Operand (max 2-dimensional).
+        op (numpy.ufunc): Arithmetic ufunc (eg. :data:`numpy.add`).
+        zdim (bool): Whether to use the Z-dimension.
+        reverse (bool, optional): Compute ``op(other, coords)`` instead of ``op(coords, other)``; Default **False**.
+
+    Returns:
+        numpy.ndarray: The modified ``data`` array.
+    """
+    if other.ndim > 2:
+        raise ValueError('Other cannot have more than 2 dimensions.')
+
+    per_geometry = other.ndim == 2 and other.shape[0] == data.shape[0]
+    coords, index = get_coordinates(data, zdim, per_geometry)
+
+    if per_geometry:
+        size = max(1, int(options.block_memory) // (coords.shape[1] * coords.itemsize))
+        for start in range(0, coords.shape[0], size):
+            block = coords[start : start + size]
+            apply_op(op, block, other[index[start : start + size]], reverse)
+    else:
+        apply_op(op, coords, other, reverse)
+
+    return shapely.set_coordinates(data, coords)
+
+
+def apply_op(op, coords, other, reverse):
+    """Compute the ufunc, writing the result back into the coordinate buffer."""
+    if reverse:
+        op(other, coords, out=coords)
+    else:
+        op(coords, other, out=coords)
@@ -2,13 +2,23 @@
 # Shapely ExtensionDType & ExtensionArray
 #
 import numbers
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 
 import numpy as np
 import pandas as pd
 import shapely
 from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype
 
+from ._affine import affine
+from ._arithmetic import arithmetic, operand_zdim
+from ._curves import curve_distance
+from ._memory import estimate_memory, memory_report
+from ._options import options
+from ._parallel import apply_chunked, apply_stream
+from ._shared import read_shared_memory, write_shared_memory
+from ._sindex import GeosSpatialIndex
+from ._wkb import WKBStorage, encode_wkb
+
 __all__ = ['GeosDtype', 'GeosArray']
 
 
@@ -46,10 +56,25 @@ class GeosDtype(ExtensionDtype):
         """
         return GeosArray
 
+    def __from_arrow__(self, array):
+        """
+        Construct a GeosArray from pyarrow data.
+
+        Args:
+            array (pyarrow.Array or pyarrow.ChunkedArray): WKB or WKT data, which can be wrapped in a :class:`~pgpd.GeosArrowType`.
+
+        Returns:
+            GeosArray: Decoded geometries.
+        """
+        from ._arrow import from_arrow
+
+        return GeosArray._simple_new(from_arrow(array))
+
 
 class GeosArray(ExtensionArray):
     dtype = GeosDtype()  #: Dtype for this ExtensionArray
     ndim = 1  #: Number of dimensions of this ExtensionArray
+    __array_priority__ = 1000  #: Make NumPy defer arithmetic to the reversed operators of this ExtensionArray
 
     # -------------------------------------------------------------------------
     # (De-)Serialization
@@ -66,67 +91,274 @@ class GeosArray(ExtensionArray):
 
         Raises:
             ValueError: data is not of correct type
+            TypeError: data contains values that are not geometries or missing values
 
         Note:
             The ``data`` argument can be one of different types:
 
             - *GeosArray* |br|
-                Shallow copy of the internal data.
+                Shallow copy of the internal data (which remains lazy for WKB backed arrays and is decoded for a :class:`~pgpd.GeosCategoricalArray`).
             - *None or shapely.lib.Geometry* |br|
                 Wrap data in an array.
             - *Iterable of shapely.lib.Geometry* |br|
-                use ``np.asarray(data)``.
+                use ``np.asarray(data, dtype=object)``, where missing values (eg. NaN or pd.NA) are replaced by None.
         """
-        if isinstance(data, self.__class__):
-            self.data = data.data
+        self._wkb = None
+        if isinstance(data, GeosArray):
+            if data._data is None and data._wkb is None:
+                # Other storage modes (eg. GeosCategoricalArray) are decoded into a plain array
+                self.data = data.data
+            else:
+                self._data, self._wkb = data._data, data._wkb
         elif data is None or isinstance(data, self.dtype.type):
             self.data = np.array((data,))
         elif isinstance(data, Iterable):
-            val = next((d for d in data if not pd.isna(d)), None)
-            if val is None or isinstance(val, self.dtype.type):
-                self.data = np.asarray(data)
-            else:
-                raise TypeError(f'Data should be an iterable of {self.dtype.type}')
+            self.data = normalize_missing(np.asarray(data, dtype=object))
         else:
             raise ValueError(f'Data should be an iterable of {self.dtype.type}')
 
-        self.data[pd.isna(self.data)] = None
+        self._reset_cache()
+
+    @classmethod
+    def _simple_new(cls, data):
+        """
+        Create a GeosArray from a trusted NumPy array, without checking the types or normalizing the missing values.
+
+        Args:
+            data (numpy.ndarray): Object array with shapely geometries and None for missing values (eg. the output of a shapely function).
+
+        Returns:
+            pgpd.GeosArray: Data wrapped in a GeosArray.
+        """
+        result = cls.__new__(cls)
+        result._data = data
+        result._wkb = None
+        result._reset_cache()
+        return result
+
+    @classmethod
+    def from_buffer(cls, buffer, offsets, chunksize=None, cache_size=0):
+        """
+        Create a lazy GeosArray from a contiguous buffer of WKB data.
+
+        The geometries are only decoded with :func:`shapely.io.from_wkb` when they are needed.
+        Selecting rows (eg. filtering a DataFrame on another column) keeps the array lazy and does not copy the WKB data,
+        accessing a single element only decodes the chunk of geometries around it
+        and any other operation decodes all the geometries once.
+
+        Args:
+            buffer (bytes-like or str or os.PathLike): WKB data or path to a file with WKB data, which gets memory-mapped.
+            offsets (array-like): ``N+1`` byte offsets of the geometries in the buffer, where missing values have an empty segment.
+            chunksize (int, optional): Number of geometries that are decoded together when accessing a single element; Default **options.chunksize**.
+            cache_size (int, optional): Maximum number of decoded chunks to keep in an LRU cache; Default **0**.
+
+        Returns:
+            pgpd.GeosArray: Lazy array backed by the WKB data.
+
+        Example:
+            >>> data = pgpd.GeosArray(shapely.points(range(5), 0))
+            >>> buffer, offsets = data.to_buffer()
+            >>> buffer.tofile('points.wkb')
+            >>> lazy = pgpd.GeosArray.from_buffer('points.wkb', offsets)
+            >>> lazy[[1, 3]]
+            <GeosArray>
+            [<POINT (1 0)>, <POINT (3 0)>]
+            Length: 2, dtype: geos
+        """
+        if chunksize is None:
+            chunksize = options.chunksize
+        return cls._from_storage(WKBStorage.from_buffer(buffer, offsets, chunksize, cache_size))
+
+    @classmethod
+    def _from_storage(cls, storage):
+        """Create a lazy GeosArray from a :class:`~pgpd._wkb.WKBStorage`."""
+        result = cls.__new__(cls)
+        result._data = None
+        result._wkb = storage
+        result._reset_cache()
+        return result
+
+    def to_buffer(self, **kwargs):
+        """
+        Encode the geometries into a contiguous buffer of WKB data.
+
+        Args:
+            kwargs: Keyword arguments passed to :func:`~shapely.io.to_wkb`.
+
+        Returns:
+            tuple: uint8 NumPy buffer and int64 ``N+1`` offsets, which can be passed to :meth:`~pgpd.GeosArray.from_buffer`.
+
+        Note:
+            For lazy arrays, the original WKB data is returned without decoding it (and thus ignoring the keyword arguments).
+        """
+        if self._data is None:
+            return self._wkb.to_buffer()
+        return encode_wkb(self._data, **kwargs)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle the geometries as one contiguous WKB buffer with offsets (see :meth:`~pgpd.GeosArray.to_buffer`),
+        instead of pickling each shapely geometry individually.
+
+        The buffer and offsets are NumPy arrays, which are transferred out-of-band (without copying them) with pickle protocol 5.
+        The array gets unpickled as a lazy array (see :meth:`~pgpd.GeosArray.from_buffer`),
+        so that the geometries are only decoded when they are needed.
+        """
+        buffer, offsets = self.to_buffer(include_srid=True)
+        return GeosArray.from_buffer, (buffer, offsets)
+
+    def to_shared_memory(self):
+        """
+        Copy the geometries as WKB data with offsets into a new shared memory segment,
+        which other processes can attach to with :meth:`~pgpd.GeosArray.from_shared_memory`.
+
+        Returns:
+            multiprocessing.shared_memory.SharedMemory: New segment, which you should close and unlink when the other processes are done.
+
+        Example:
+            >>> shm = data.to_shared_memory()
+            >>> with ProcessPoolExecutor() as pool:
+            ...     results = list(pool.map(work, [shm.name] * 4, [slice(i, i + 100) for i in range(0, 400, 100)]))
+            >>> shm.close()
+            >>> shm.unlink()
+        """
+        return write_shared_memory(*self.to_buffer(include_srid=True))
+
+    @classmethod
+    def from_shared_memory(cls, name, rows=None):
+        """
+        Attach to a shared memory segment, which was created with :meth:`~pgpd.GeosArray.to_shared_memory`,
+        and decode the geometries of some of its rows.
+
+        The segment is only attached while decoding the geometries,
+        so that a worker process only needs memory for its own partition of the data.
+
+        Args:
+            name (str): Name of the shared memory segment.
+            rows (slice or numpy.ndarray, optional): Rows to decode; Default **all rows**.
+
+        Returns:
+            pgpd.GeosArray: Decoded geometries.
+        """
+        return cls._simple_new(read_shared_memory(name, rows))
+
+    @property
+    def data(self):
+        """NumPy array with the shapely geometries, which are decoded on first access for lazy arrays."""
+        if self._data is None:
+            self._data = self._wkb.decode()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._wkb = None
+
+    def to_categorical(self):
+        """
+        Dictionary-encode the geometries, which saves memory and computations for columns with many repeated geometries.
+
+        Returns:
+            pgpd.GeosCategoricalArray: Encoded geometries.
+        """
+        from ._categorical import GeosCategoricalArray
+
+        return GeosCategoricalArray(self)
 
     @classmethod
     def from_wkb(cls, data, **kwargs):
         """
         Create a GeosArray from WKB data. |br|
-        This function is a simple wrapper around :func:`shapely.io.from_wkb`.
+        This function is a wrapper around :func:`shapely.io.from_wkb`,
+        which parses the data in chunks on multiple threads (see :attr:`pgpd.options.n_jobs <pgpd._options.Options>`).
 
         Args:
-            data: WKB data or list of WKB data.
+            data: WKB data, list of WKB data or an iterator of batches of WKB data.
             kwargs: Keyword arguments passed to :func:`~shapely.io.from_wkb`.
 
         Returns:
             pgpd.GeosArray: Data wrapped in a GeosArray.
+
+        Note:
+            When passing an iterator of batches, the batches are parsed in parallel and concatenated at the end.
+            Use :meth:`~pgpd.GeosArray.stream_wkb` if you want to process the batches one by one.
         """
-        data = data.copy()
-        data[pd.isna(data)] = None
-        data = shapely.io.from_wkb(data, **kwargs)
-        return cls(data)
+        return cls._from_parsed(shapely.io.from_wkb, data, kwargs)
 
     @classmethod
     def from_wkt(cls, data, **kwargs):
         """
         Create a GeosArray from WKT data. |br|
-        This function is a simple wrapper around :func:`shapely.io.from_wkt`.
+        This function is a wrapper around :func:`shapely.io.from_wkt`,
+        which parses the data in chunks on multiple threads (see :attr:`pgpd.options.n_jobs <pgpd._options.Options>`).
 
         Args:
-            data: WKT data or list of WKT data.
+            data: WKT data, list of WKT data or an iterator of batches of WKT data.
             kwargs: Keyword arguments passed to :func:`~shapely.io.from_wkt`.
 
         Returns:
             pgpd.GeosArray: Data wrapped in a GeosArray.
+
+        Note:
+            When passing an iterator of batches, the batches are parsed in parallel and concatenated at the end.
+            Use :meth:`~pgpd.GeosArray.stream_wkt` if you want to process the batches one by one.
+        """
+        return cls._from_parsed(shapely.io.from_wkt, data, kwargs)
+
+    @classmethod
+    def stream_wkb(cls, batches, **kwargs):
+        """
+        Parse batches of WKB data into GeosArray chunks.
+
+        The batches are parsed on a thread pool (see :attr:`pgpd.options.n_jobs <pgpd._options.Options>`),
+        but only a few batches are consumed ahead of the chunks that are yielded,
+        so that the peak memory usage is bounded regardless of the total size of the data.
+
+        Args:
+            batches (Iterable): Batches of WKB data (eg. columns of a chunked :func:`pandas.read_csv`).
+            kwargs: Keyword arguments passed to :func:`~shapely.io.from_wkb`.
+
+        Yields:
+            pgpd.GeosArray: Parsed geometries of each batch.
         """
-        data = data.copy()
-        data[pd.isna(data)] = None
-        data = shapely.io.from_wkt(data, **kwargs)
-        return cls(data)
+        for data in apply_stream(lambda batch: parse_geometries(batch, shapely.io.from_wkb, kwargs), batches):
+            yield cls(data)
+
+    @classmethod
+    def stream_wkt(cls, batches, **kwargs):
+        """
+        Parse batches of WKT data into GeosArray chunks.
+
+        The batches are parsed on a thread pool (see :attr:`pgpd.options.n_jobs <pgpd._options.Options>`),
+        but only a few batches are consumed ahead of the chunks that are yielded,
+        so that the peak memory usage is bounded regardless of the total size of the data.
+
+        Args:
+            batches (Iterable): Batches of WKT data (eg. columns of a chunked :func:`pandas.read_csv`).
+            kwargs: Keyword arguments passed to :func:`~shapely.io.from_wkt`.
+
+        Yields:
+            pgpd.GeosArray: Parsed geometries of each batch.
+
+        Example:
+            >>> reader = pd.read_csv('data.csv', chunksize=1_000_000)
+            >>> with pgpd.options(n_jobs=-1):
+            ...     for chunk in pgpd.GeosArray.stream_wkt(df['wkt'] for df in reader):
+            ...         process(chunk)
+        """
+        for data in apply_stream(lambda batch: parse_geometries(batch, shapely.io.from_wkt, kwargs), batches):
+            yield cls(data)
+
+    @classmethod
+    def _from_parsed(cls, func, data, kwargs):
+        if isinstance(data, Iterator):
+            stream = apply_stream(lambda batch: parse_geometries(batch, func, kwargs), data)
+            return cls._simple_new(np.concatenate([np.empty(0, dtype=object), *stream]))
+
+        values = np.asarray(data, dtype=object)
+        if values.ndim == 0:
+            values = values[None]
+        return cls._simple_new(apply_chunked(parse_geometries, values, func, kwargs))
 
     def to_wkb(self, **kwargs):
         """
@@ -138,9 +370,28 @@ class GeosArray(ExtensionArray):
 
         Returns:
             numpy.ndarray: Array with the WKB data.
+
+        Note:
+            For lazy arrays without keyword arguments, the original WKB data is returned without decoding it.
         """
+        if self._data is None and not kwargs:
+            return self._wkb.to_wkb()
         return shapely.io.to_wkb(self.data, **kwargs)
 
+    def __arrow_array__(self, type=None):
+        """
+        Convert the GeosArray to a pyarrow array, which allows native serialization to Parquet and Feather.
+
+        Args:
+            type (pyarrow.DataType, optional): Requested type; Default **pgpd.GeosArrowType()**.
+
+        Returns:
+            pyarrow.ExtensionArray: Array with WKB data of type :class:`~pgpd.GeosArrowType`.
+        """
+        from ._arrow import to_arrow
+
+        return to_arrow(self._wkb if self._data is None else self._data, type)
+
     def to_wkt(self, **kwargs):
         """
         Transform the GeosArray to a NumPy array of WKT strings. |br|
@@ -162,26 +413,104 @@ class GeosArray(ExtensionArray):
         if isinstance(scalars, (str, bytes)) or not isinstance(scalars, Iterable):
             scalars = (scalars,)
 
-        values = np.array(scalars)
-        if copy:
-            values = values.copy()
-        val = next((v for v in values if not pd.isna(v)), None)
-
-        if isinstance(val, str):
-            return cls.from_wkt(values)
-        if isinstance(val, bytes):
-            return cls.from_wkb(values)
-        return cls(values)
+        # np.array always copies the scalars, so we can parse the values in place
+        values = np.array(scalars, dtype=object)
+        if values.ndim == 0:
+            values = values[None]
+        return cls._simple_new(parse_mixed(values))
 
     def _values_for_factorize(self):
-        return self.data, None
+        """
+        Return hashable keys of the geometries, which are their WKB representation.
+
+        The geometries can optionally be snapped to a grid and normalized before encoding them,
+        so that geometries that only differ in precision or in the order of their coordinates get the same key
+        (see :attr:`pgpd.options.factorize_grid_size <pgpd._options.Options>` and :attr:`pgpd.options.factorize_normalize <pgpd._options.Options>`).
+        The keys are always encoded as little-endian WKB without SRID,
+        so that they only depend on the geometries and not on how the data was stored (eg. the WKB of lazy arrays).
+
+        Returns:
+            tuple: Object array with WKB bytes (None for missing values) and None as NA value.
+        """
+        grid_size = options.factorize_grid_size
+        normalize = options.factorize_normalize
+
+        def encode(data):
+            if grid_size is not None:
+                data = shapely.set_precision(data, grid_size)
+            if normalize:
+                data = shapely.normalize(data)
+            return shapely.to_wkb(data, byte_order=1, include_srid=False)
+
+        # Lazy arrays are decoded without caching the geometries, so they keep their small memory footprint
+        data = self._wkb.decode() if self._data is None else self._data
+        return apply_chunked(encode, data), None
 
     @classmethod
     def _from_factorized(cls, values, original):
-        return cls(values)
+        return cls.from_wkb(values)
+
+    def factorize(self, use_na_sentinel=True):
+        """
+        Encode the geometries as an enumerated type.
+
+        The geometries are compared by their WKB keys (see :meth:`~pgpd.GeosArray._values_for_factorize`)
+        and the first geometry of each group is used as its unique value.
+
+        Args:
+            use_na_sentinel (bool, optional): Whether to give missing values a code of -1 instead of adding them to the uniques; Default **True**.
+
+        Returns:
+            tuple: int64 codes and a GeosArray with the unique geometries.
+        """
+        keys, _ = self._values_for_factorize()
+        codes, _ = pd.factorize(keys, use_na_sentinel=use_na_sentinel)
+
+        # Codes are numbered in order of appearance, so the first index of each code is the first occurrence of each unique value
+        values, first = np.unique(codes, return_index=True)
+        return codes, self.take(first[values >= 0])
+
+    def unique(self):
+        """
+        Compute the unique geometries, by comparing their WKB keys (see :meth:`~pgpd.GeosArray._values_for_factorize`).
+
+        Returns:
+            pgpd.GeosArray: Unique geometries, in order of appearance.
+        """
+        return self.factorize(use_na_sentinel=False)[1]
+
+    def duplicated(self, keep='first'):
+        """
+        Check which geometries are duplicates, by comparing their WKB keys (see :meth:`~pgpd.GeosArray._values_for_factorize`).
+
+        Args:
+            keep ('first' or 'last' or False, optional): Which occurrence is not marked as duplicate; Default **first**.
+
+        Returns:
+            numpy.ndarray: Boolean mask of duplicated geometries.
+        """
+        from pandas.core.algorithms import duplicated
+
+        return duplicated(self._values_for_factorize()[0], keep=keep)
+
+    def value_counts(self, dropna=True):
+        """
+        Count the number of occurrences of each unique geometry, by comparing their WKB keys (see :meth:`~pgpd.GeosArray._values_for_factorize`).
+
+        Args:
+            dropna (bool, optional): Whether to leave out missing values; Default **True**.
+
+        Returns:
+            pandas.Series: Counts, with the unique geometries as index.
+        """
+        codes, uniques = self.factorize(use_na_sentinel=dropna)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        return pd.Series(counts, index=pd.Index(uniques), name='count')
 
     def __getitem__(self, key):
         if isinstance(key, numbers.Integral):
+            if self._data is None:
+                return self._wkb[key]
             return self.data[key]
 
         if isinstance(key, tuple) and len(key) == 1:
@@ -189,16 +518,24 @@ class GeosArray(ExtensionArray):
         key = pd.api.indexers.check_array_indexer(self, key)
 
         if isinstance(key, (Iterable, slice)):
-            return GeosArray(self.data[key])
+            if self._data is None:
+                return self._carry_bounds(GeosArray._from_storage(self._wkb.take(key)), key)
+            # Slices of a NumPy array are views, which would share the geometries but not the cached index and bounds
+            data = self.data[key]
+            if isinstance(key, slice):
+                data = data.copy()
+            return self._carry_bounds(GeosArray._simple_new(data), key)
         raise TypeError('Index type not supported', key)
 
     def __setitem__(self, key, value):
         if isinstance(key, tuple) and len(key) == 1:
             key = key[0]
         key = pd.api.indexers.check_array_indexer(self, key)
+        self.data = self.data
+        self._reset_cache()
 
         if isinstance(key, (slice, list, np.ndarray)):
-            value = value.data if isinstance(value, self.__class__) else self._from_sequence(value)
+            value = value.data if isinstance(value, GeosArray) else self._from_sequence(value)
             self.data[key] = value
         else:
             if isinstance(value, Iterable):
@@ -214,22 +551,62 @@ class GeosArray(ExtensionArray):
                 self.data[key] = value
 
     def __len__(self):
-        return self.data.shape[0]
+        return self.shape[0]
 
     def __eq__(self, other):
         if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
             return NotImplemented
 
-        if isinstance(other, self.__class__):
+        if isinstance(other, GeosArray):
             return shapely.equals(self.data, other.data)
 
         return self.data == other
 
     @property
     def nbytes(self):
-        return self.data.nbytes
+        """Estimated number of bytes that are used by the array, including the geometries (see :meth:`~pgpd.GeosArray.memory_usage`)."""
+        return self.memory_usage(deep=True)
+
+    def memory_usage(self, deep=False):
+        """
+        Number of bytes that are used by the array.
+
+        The memory of the shapely geometries is estimated from their number of coordinates, coordinate sequences and parts,
+        which is cached until the data of the array is modified.
+        Set :attr:`pgpd.options.memory_sample <pgpd._options.Options>` to extrapolate the estimate from a sample of the geometries,
+        which is faster for large arrays.
+
+        Args:
+            deep (bool, optional): Whether to include the memory of the geometries, instead of only the array of pointers; Default **False**.
+
+        Returns:
+            int: Number of bytes.
+
+        Note:
+            Lazy arrays only hold WKB data (see :meth:`~pgpd.GeosArray.from_buffer`), so they return the size of the selected WKB data.
+        """
+        if self._data is None:
+            return self._wkb.nbytes
+        if not deep:
+            return self._data.nbytes
+
+        sample = options.memory_sample
+        if self._memory is None or self._memory[0] != sample:
+            self._memory = (sample, self._data.nbytes + estimate_memory(self._data, sample))
+        return self._memory[1]
+
+    def memory_report(self):
+        """
+        Break down the estimated memory of the geometries by geometry type (see :meth:`~pgpd.GeosArray.memory_usage`).
+
+        Returns:
+            pandas.DataFrame: Number of geometries, coordinates and estimated bytes for each geometry type that is present in the data.
+        """
+        return memory_report(self.data)
 
     def isna(self):
+        if self._data is None:
+            return self._wkb.isna()
         return shapely.is_missing(self.data)
 
     def take(self, indices, allow_fill=False, fill_value=None):
@@ -241,40 +618,66 @@ class GeosArray(ExtensionArray):
             elif not isinstance(fill_value, self.dtype.type):
                 raise TypeError('Provide geometry or None as fill value')
 
+        if self._data is None and fill_value is None:
+            return self._carry_bounds(self._from_storage(self._wkb.take(indices, allow_fill)), indices, allow_fill)
+
         result = take(self.data, indices, allow_fill=allow_fill, fill_value=fill_value)
 
         if allow_fill and fill_value is None:
-            result[pd.isna(result)] = None
+            # Filled rows are NaN, which are the only values that are not valid shapely input
+            result[~shapely.is_valid_input(result)] = None
+            return self._carry_bounds(GeosArray._simple_new(result), indices, allow_fill)
 
-        return self.__class__(result)
+        if not allow_fill:
+            return self._carry_bounds(GeosArray._simple_new(result), indices)
+        return GeosArray._simple_new(result)
 
     def copy(self, order='C'):
-        return GeosArray(self.data.copy(order))
+        if self._data is None:
+            # The WKB buffer is never modified, so we only need to copy the positions
+            return GeosArray._from_storage(self._wkb.take(slice(None)))
+        return GeosArray._simple_new(self.data.copy(order))
 
     @classmethod
     def _concat_same_type(cls, to_concat):
+        if all(c._data is None and c._wkb is not None for c in to_concat):
+            return cls._from_storage(WKBStorage.concatenate([c._wkb for c in to_concat]))
+
         data = np.concatenate([c.data for c in to_concat])
-        return cls(data)
+        return cls._simple_new(data)
 
     def _values_for_argsort(self):
         """
         Return values for sorting.
 
-        Raises:
-            TypeError: Geometries are not sortable.
+        Geometries have no natural order, so they are sorted along a space-filling curve through the centers of their bounding boxes
+        if :attr:`pgpd.options.sort_curve <pgpd._options.Options>` is set.
+        Otherwise, they are sorted by their WKB keys (see :meth:`~pgpd.GeosArray._values_for_factorize`),
+        which gives a deterministic order so that eg. :meth:`pandas.DataFrame.groupby` with ``sort=True`` works without choosing a curve,
+        but which has no spatial meaning.
+        The keys are compared bytewise as little-endian WKB without SRID, so they are ordered by geometry type and dimension first
+        and then by the bytes of the coordinates (which is not their numerical order).
+        This order does not depend on how the data is stored (eg. lazy arrays with big-endian WKB).
+
+        Returns:
+            numpy.ndarray: int64 curve distances or object array with WKB bytes.
         """
-        raise TypeError('geometries are not sortable')
+        if options.sort_curve is None:
+            return self._values_for_factorize()[0]
+        return curve_distance(options.sort_curve, self.bounds, self.total_bounds)
 
     # -------------------------------------------------------------------------
     # NumPy Specific
     # -------------------------------------------------------------------------
     @property
     def size(self):
-        return self.data.size
+        return self.shape[0]
 
     @property
     def shape(self):
-        return self.data.shape
+        if self._data is None:
+            return (len(self._wkb),)
+        return self._data.shape
 
     def __array__(self, dtype=None):
         """Return internal NumPy array."""
@@ -283,7 +686,78 @@ class GeosArray(ExtensionArray):
     # -------------------------------------------------------------------------
     # Custom Methods
     # -------------------------------------------------------------------------
-    def affine(self, matrix):
+    @property
+    def sindex(self):
+        """
+        Spatial index of the data.
+
+        The :class:`~pgpd.GeosSpatialIndex` is lazily built the first time you access this property and is then cached.
+        Modifying the data of the array invalidates the cached index
+        and the index is never carried over to new arrays (eg. :meth:`~pgpd.GeosArray.take` or :meth:`~pgpd.GeosArray.copy`).
+
+        Returns:
+            pgpd.GeosSpatialIndex: Spatial index that returns positional indices.
+        """
+        if self._sindex is None:
+            self._sindex = GeosSpatialIndex(self.data)
+        return self._sindex
+
+    @property
+    def bounds(self):
+        """
+        Bounding boxes of the geometries.
+
+        The bounds are lazily computed the first time you access this property and are then cached,
+        until the data of the array is modified.
+        Selecting rows (eg. :meth:`~pgpd.GeosArray.take`) carries the cached bounds over to the new array,
+        which gets its own geometries (also for slices), so that modifying either array does not invalidate the bounds of the other.
+
+        Returns:
+            numpy.ndarray: Read-only ``<Nx4>`` float64 array with the ``(xmin, ymin, xmax, ymax)`` of each geometry.
+                Missing and empty geometries have NaN bounds.
+        """
+        if self._bounds is None:
+            self._bounds = readonly(apply_chunked(shapely.bounds, self.data).astype(float, copy=False).reshape(-1, 4))
+        return self._bounds
+
+    @property
+    def total_bounds(self):
+        """
+        Bounding box of all the geometries.
+
+        This is a reduction of the cached :attr:`~pgpd.GeosArray.bounds`, which is cached as well.
+
+        Returns:
+            numpy.ndarray: Read-only float64 array with the ``(xmin, ymin, xmax, ymax)`` of all geometries (NaN if there are none).
+        """
+        if self._total_bounds is None:
+            bounds = self.bounds[~np.isnan(self.bounds[:, 0])]
+            total = np.full(4, np.nan)
+            if bounds.shape[0] > 0:
+                total = np.concatenate([bounds[:, :2].min(0), bounds[:, 2:].max(0)])
+            self._total_bounds = readonly(total)
+        return self._total_bounds
+
+    def _reset_cache(self):
+        """Invalidate all cached data that is derived from the geometries."""
+        self._sindex = None
+        self._has_z = None
+        self._bounds = None
+        self._total_bounds = None
+        self._memory = None
+
+    def _carry_bounds(self, result, key, allow_fill=False):
+        """Select the cached bounds of the rows of a new array, so that they do not need to be recomputed."""
+        if self._bounds is not None:
+            from pandas.core.algorithms import take
+
+            if allow_fill:
+                result._bounds = readonly(take(self._bounds, key, axis=0, allow_fill=True, fill_value=np.nan))
+            else:
+                result._bounds = readonly(self._bounds[key])
+        return result
+
+    def affine(self, matrix, inplace=False):
         r"""
         Performs a 2D or 3D affine transformation on all the coordinates.
 
@@ -322,9 +796,10 @@ class GeosArray(ExtensionArray):
 
         Args:
             matrix (numpy.ndarray or list-like): Affine transformation matrix.
+            inplace (bool, optional): Whether to replace the geometries of this array instead of creating a new one; Default **False**.
 
         Returns:
-            pgpd.GeosArray: Transformed geometries
+            pgpd.GeosArray: Transformed geometries (this array if ``inplace=True``).
 
         Note:
             The transformation matrix can be one of the following types:
@@ -337,43 +812,30 @@ class GeosArray(ExtensionArray):
               Performs a 3D affine transformation, where the last row of homogeneous coordinates can optionally be discarded.
             - list-like <12> |br|
               Performs a 3D affine transformation, where the `matrix` represents **(a, b, c, d, e, f, g, h, i, xoff, yoff, zoff)**.
+            - numpy.ndarray <Nx3x3 or Nx2x3 or Nx4x4 or Nx3x4> |br|
+              Performs a different 2D or 3D affine transformation on each of the N geometries.
+            - list-like <6 or 12> of arrays |br|
+              Same as the list-like formats, but each value can also be an array with a value for each geometry.
+
+            The matrix is applied directly to the coordinates, without creating homogeneous coordinates.
+            When working inplace, the transformed geometries replace the original ones in the existing data array
+            and any cached data (eg. the :attr:`~pgpd.GeosArray.sindex`) is invalidated.
         """
-        # Get Correct Affine transformation matrix
-        if isinstance(matrix, np.ndarray):
-            r, c = matrix.shape
-            zdim = c == 4
-            if r == 2:
-                matrix = np.append(matrix, [[0, 0, 1]], axis=0)
-            elif c == 4 and r == 3:
-                matrix = np.append(matrix, [[0, 0, 0, 1]], axis=0)
-        elif len(matrix) == 6:
-            zdim = False
-            matrix = np.array(
-                [
-                    [matrix[0], matrix[1], matrix[4]],
-                    [matrix[2], matrix[3], matrix[5]],
-                    [0, 0, 1],
-                ]
-            )
-        elif len(matrix) == 12:
-            zdim = True
-            matrix = np.array(
-                [
-                    [matrix[0], matrix[1], matrix[2], matrix[9]],
-                    [matrix[3], matrix[4], matrix[5], matrix[10]],
-                    [matrix[6], matrix[7], matrix[8], matrix[11]],
-                    [0, 0, 0, 1],
-                ]
-            )
-
-        matrix = matrix[None, ...]
-
-        # Coordinate Function
-        def _affine(points):
-            points = np.c_[points, np.ones(points.shape[0])][..., None]
-            return (matrix @ points)[:, :-1, 0]
-
-        return self.__class__(shapely.coordinates.transform(self.data, _affine, zdim))
+        return self._replace_geometries(lambda data: affine(data, matrix, inplace=True), inplace)
+
+    def set_coordinates(self, coordinates, inplace=False):
+        """
+        Replace the coordinates of the geometries. |br|
+        This function is a wrapper around :func:`shapely.coordinates.set_coordinates`.
+
+        Args:
+            coordinates (array-like): ``<Mx2>`` or ``<Mx3>`` coordinates, in the order of :func:`shapely.coordinates.get_coordinates`.
+            inplace (bool, optional): Whether to replace the geometries of this array instead of creating a new one; Default **False**.
+
+        Returns:
+            pgpd.GeosArray: Geometries with the new coordinates (this array if ``inplace=True``).
+        """
+        return self._replace_geometries(lambda data: shapely.set_coordinates(data, coordinates), inplace)
 
     def __add__(self, other):
         """
@@ -392,8 +854,8 @@ class GeosArray(ExtensionArray):
             - `other.ndim >= 2 and other.shape[1] == 3`: Do use Z-dimension.
             - `else`: Use Z-dimension if there are any.
 
-            Secondly, if `other.shape[0] == self.data.shape[0]`,
-            we automatically repeat each coordinate pair to the number of coordinates of its corresponding polygon.
+            Secondly, if `other.ndim == 2 and other.shape[0] == self.data.shape[0]`,
+            we automatically broadcast each coordinate pair to all the coordinates of its corresponding polygon.
             This allows you to easily add different coordinate pairs to each polygon.
 
         Example:
@@ -473,31 +935,7 @@ class GeosArray(ExtensionArray):
              <shapely.Geometry POLYGON ((23 10, 23 20, 13 20, 13 10, 23 10))>]
             Length: 4, dtype: geos
         """
-        other = np.asarray(other)
-        if other.ndim > 2:
-            raise ValueError('Other cannot have more than 2 dimensions.')
-
-        # Check whether we use Z-dimension
-        zshape = other.ndim == 2 and other.shape[1]
-        if zshape == 2:
-            zdim = False
-        elif zshape == 3:
-            zdim = True
-        else:
-            zdim = shapely.predicates.has_z(self.data).any()
-
-        # Expand other to number of coords per shape
-        pshape = other.ndim >= 1 and other.shape[0]
-        if pshape == self.data.shape[0]:
-            other = np.repeat(other, shapely.get_num_coordinates(self.data), 0)
-
-        return self.__class__(
-            shapely.coordinates.transform(
-                self.data,
-                lambda pt: pt + other,
-                zdim,
-            )
-        )
+        return self._arithmetic(other, np.add)
 
     def __sub__(self, other):
         """
@@ -516,8 +954,8 @@ class GeosArray(ExtensionArray):
             - `other.ndim >= 2 and other.shape[1] == 3`: Do use Z-dimension.
             - `else`: Use Z-dimension if there are any.
 
-            Secondly, if `other.shape[0] == self.data.shape[0]`,
-            we automatically repeat each coordinate pair to the number of coordinates of its corresponding polygon.
+            Secondly, if `other.ndim == 2 and other.shape[0] == self.data.shape[0]`,
+            we automatically broadcast each coordinate pair to all the coordinates of its corresponding polygon.
             This allows you to easily add different coordinate pairs to each polygon.
 
         Example:
@@ -597,31 +1035,7 @@ class GeosArray(ExtensionArray):
              <shapely.Geometry POLYGON ((3 -10, 3 0, -7 0, -7 -10, 3 -10))>]
             Length: 4, dtype: geos
         """
-        other = np.asarray(other)
-        if other.ndim > 2:
-            raise ValueError('Other cannot have more than 2 dimensions.')
-
-        # Check whether we use Z-dimension
-        zshape = other.ndim == 2 and other.shape[1]
-        if zshape == 2:
-            zdim = False
-        elif zshape == 3:
-            zdim = True
-        else:
-            zdim = shapely.predicates.has_z(self.data).any()
-
-        # Expand other to number of coords per shape
-        pshape = other.ndim >= 1 and other.shape[0]
-        if pshape == self.data.shape[0]:
-            other = np.repeat(other, shapely.get_num_coordinates(self.data), 0)
-
-        return self.__class__(
-            shapely.coordinates.transform(
-                self.data,
-                lambda pt: pt - other,
-                zdim,
-            )
-        )
+        return self._arithmetic(other, np.subtract)
 
     def __mul__(self, other):
         """
@@ -640,8 +1054,8 @@ class GeosArray(ExtensionArray):
             - `other.ndim >= 2 and other.shape[1] == 3`: Do use Z-dimension.
             - `else`: Use Z-dimension if there are any.
 
-            Secondly, if `other.shape[0] == self.data.shape[0]`,
-            we automatically repeat each coordinate pair to the number of coordinates of its corresponding polygon.
+            Secondly, if `other.ndim == 2 and other.shape[0] == self.data.shape[0]`,
+            we automatically broadcast each coordinate pair to all the coordinates of its corresponding polygon.
             This allows you to easily add different coordinate pairs to each polygon.
 
         Example:
@@ -721,31 +1135,7 @@ class GeosArray(ExtensionArray):
              <shapely.Geometry POLYGON ((130 0, 130 100, 30 100, 30 0, 130 0))>]
             Length: 4, dtype: geos
         """
-        other = np.asarray(other)
-        if other.ndim > 2:
-            raise ValueError('Other cannot have more than 2 dimensions.')
-
-        # Check whether we use Z-dimension
-        zshape = other.ndim == 2 and other.shape[1]
-        if zshape == 2:
-            zdim = False
-        elif zshape == 3:
-            zdim = True
-        else:
-            zdim = shapely.predicates.has_z(self.data).any()
-
-        # Expand other to number of coords per shape
-        pshape = other.ndim >= 1 and other.shape[0]
-        if pshape == self.data.shape[0]:
-            other = np.repeat(other, shapely.get_num_coordinates(self.data), 0)
-
-        return self.__class__(
-            shapely.coordinates.transform(
-                self.data,
-                lambda pt: pt * other,
-                zdim,
-            )
-        )
+        return self._arithmetic(other, np.multiply)
 
     def __truediv__(self, other):
         """
@@ -764,8 +1154,8 @@ class GeosArray(ExtensionArray):
             - `other.ndim >= 2 and other.shape[1] == 3`: Do use Z-dimension.
             - `else`: Use Z-dimension if there are any.
 
-            Secondly, if `other.shape[0] == self.data.shape[0]`,
-            we automatically repeat each coordinate pair to the number of coordinates of its corresponding polygon.
+            Secondly, if `other.ndim == 2 and other.shape[0] == self.data.shape[0]`,
+            we automatically broadcast each coordinate pair to all the coordinates of its corresponding polygon.
             This allows you to easily add different coordinate pairs to each polygon.
 
         Example:
@@ -845,31 +1235,7 @@ class GeosArray(ExtensionArray):
              <shapely.Geometry POLYGON ((1.3 0, 1.3 1, 0.3 1, 0.3 0, 1.3 0))>]
             Length: 4, dtype: geos
         """
-        other = np.asarray(other)
-        if other.ndim > 2:
-            raise ValueError('Other cannot have more than 2 dimensions.')
-
-        # Check whether we use Z-dimension
-        zshape = other.ndim == 2 and other.shape[1]
-        if zshape == 2:
-            zdim = False
-        elif zshape == 3:
-            zdim = True
-        else:
-            zdim = shapely.predicates.has_z(self.data).any()
-
-        # Expand other to number of coords per shape
-        pshape = other.ndim >= 1 and other.shape[0]
-        if pshape == self.data.shape[0]:
-            other = np.repeat(other, shapely.get_num_coordinates(self.data), 0)
-
-        return self.__class__(
-            shapely.coordinates.transform(
-                self.data,
-                lambda pt: pt / other,
-                zdim,
-            )
-        )
+        return self._arithmetic(other, np.true_divide)
 
     def __floordiv__(self, other):
         """
@@ -888,8 +1254,8 @@ class GeosArray(ExtensionArray):
             - `other.ndim >= 2 and other.shape[1] == 3`: Do use Z-dimension.
             - `else`: Use Z-dimension if there are any.
 
-            Secondly, if `other.shape[0] == self.data.shape[0]`,
-            we automatically repeat each coordinate pair to the number of coordinates of its corresponding polygon.
+            Secondly, if `other.ndim == 2 and other.shape[0] == self.data.shape[0]`,
+            we automatically broadcast each coordinate pair to all the coordinates of its corresponding polygon.
             This allows you to easily add different coordinate pairs to each polygon.
 
         Example:
@@ -969,28 +1335,158 @@ class GeosArray(ExtensionArray):
              <shapely.Geometry POLYGON ((1 0, 1 1, 0 1, 0 0, 1 0))>]
             Length: 4, dtype: geos
         """
+        return self._arithmetic(other, np.floor_divide)
+
+    def __radd__(self, other):
+        """Performs an addition between other and the coordinates array (see :meth:`~pgpd.GeosArray.__add__`)."""
+        return self._arithmetic(other, np.add, reverse=True)
+
+    def __rsub__(self, other):
+        """Performs a subtraction of the coordinates array from other (see :meth:`~pgpd.GeosArray.__sub__`)."""
+        return self._arithmetic(other, np.subtract, reverse=True)
+
+    def __rmul__(self, other):
+        """Performs a multiplication between other and the coordinates array (see :meth:`~pgpd.GeosArray.__mul__`)."""
+        return self._arithmetic(other, np.multiply, reverse=True)
+
+    def __rtruediv__(self, other):
+        """Performs a division of other by the coordinates array (see :meth:`~pgpd.GeosArray.__truediv__`)."""
+        return self._arithmetic(other, np.true_divide, reverse=True)
+
+    def __rfloordiv__(self, other):
+        """Performs a division of other by the coordinates array (see :meth:`~pgpd.GeosArray.__floordiv__`)."""
+        return self._arithmetic(other, np.floor_divide, reverse=True)
+
+    def __iadd__(self, other):
+        """In-place version of :meth:`~pgpd.GeosArray.__add__`, which replaces the geometries of this array."""
+        return self._arithmetic(other, np.add, inplace=True)
+
+    def __isub__(self, other):
+        """In-place version of :meth:`~pgpd.GeosArray.__sub__`, which replaces the geometries of this array."""
+        return self._arithmetic(other, np.subtract, inplace=True)
+
+    def __imul__(self, other):
+        """In-place version of :meth:`~pgpd.GeosArray.__mul__`, which replaces the geometries of this array."""
+        return self._arithmetic(other, np.multiply, inplace=True)
+
+    def __itruediv__(self, other):
+        """In-place version of :meth:`~pgpd.GeosArray.__truediv__`, which replaces the geometries of this array."""
+        return self._arithmetic(other, np.true_divide, inplace=True)
+
+    def __ifloordiv__(self, other):
+        """In-place version of :meth:`~pgpd.GeosArray.__floordiv__`, which replaces the geometries of this array."""
+        return self._arithmetic(other, np.floor_divide, inplace=True)
+
+    def _arithmetic(self, other, op, reverse=False, inplace=False):
+        """Apply an arithmetic ufunc on the coordinates, where the geometries are only checked for Z-dimensions once."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
         other = np.asarray(other)
-        if other.ndim > 2:
-            raise ValueError('Other cannot have more than 2 dimensions.')
-
-        # Check whether we use Z-dimension
-        zshape = other.ndim == 2 and other.shape[1]
-        if zshape == 2:
-            zdim = False
-        elif zshape == 3:
-            zdim = True
-        else:
-            zdim = shapely.predicates.has_z(self.data).any()
-
-        # Expand other to number of coords per shape
-        pshape = other.ndim >= 1 and other.shape[0]
-        if pshape == self.data.shape[0]:
-            other = np.repeat(other, shapely.get_num_coordinates(self.data), 0)
-
-        return self.__class__(
-            shapely.coordinates.transform(
-                self.data,
-                lambda pt: pt // other,
-                zdim,
-            )
-        )
+        zdim = operand_zdim(other)
+        if zdim is None:
+            zdim = self._any_z()
+
+        has_z = self._has_z
+        result = self._replace_geometries(lambda data: arithmetic(data, other, op, zdim, reverse), inplace)
+        result._has_z = has_z
+        return result
+
+    def _replace_geometries(self, func, inplace):
+        """
+        Run a function that replaces the geometries of a data array, either on a copy of the data or on this array.
+        When working inplace, the geometries are replaced in the existing data array, so that only one copy of them exists at any time.
+        """
+        if not inplace:
+            return GeosArray._simple_new(func(self.data.copy()))
+
+        self.data = self.data
+        func(self._data)
+        self._reset_cache()
+        return self
+
+    def _any_z(self):
+        """Whether any of the geometries has a Z-dimension, which is cached until the data is modified."""
+        if self._has_z is None:
+            self._has_z = bool(shapely.has_z(self.data).any())
+        return self._has_z
+
+
+def normalize_missing(values):
+    """
+    Check that an object array only contains geometries or missing values and replace the missing values with None.
+
+    The values are first checked with :func:`shapely.is_valid_input`, so that only the invalid values need to be inspected by pandas.
+    """
+    invalid = np.flatnonzero(~shapely.is_valid_input(values))
+    if invalid.shape[0] > 0:
+        missing = pd.isna(values[invalid])
+        if not missing.all():
+            raise TypeError(f'Data should be an iterable of {GeosDtype.type}')
+        values[invalid] = None
+
+    return values
+
+
+def readonly(values):
+    """Mark a NumPy array as read-only, so that cached data cannot be modified by accident."""
+    values.flags.writeable = False
+    return values
+
+
+def parse_mixed(values):
+    """
+    Convert an object array with geometries, WKT strings, WKB bytes, hex-WKB strings and missing values into geometries, in place.
+
+    The values are classified with vectorized checks and each group of values is parsed in bulk, on multiple threads.
+    Hex-WKB strings are recognized by their byte order prefix ("00" or "01"), which can never be the start of a WKT string.
+    """
+    index = np.flatnonzero(~shapely.is_valid_input(values))
+    if index.shape[0] == 0:
+        return values
+
+    rest = values[index]
+    missing = pd.isna(rest)
+    kind = pd.api.types.infer_dtype(rest, skipna=True)
+    if kind == 'string':
+        is_str, is_bytes = ~missing, np.zeros_like(missing)
+    elif kind == 'bytes':
+        is_str, is_bytes = np.zeros_like(missing), ~missing
+    else:
+        is_str = np.frompyfunc(lambda v: isinstance(v, str), 1, 1)(rest).astype(bool)
+        is_bytes = np.frompyfunc(lambda v: isinstance(v, bytes), 1, 1)(rest).astype(bool)
+    if not (missing | is_str | is_bytes).all():
+        raise TypeError(f'Data should be an iterable of {GeosDtype.type}, WKT strings or WKB bytes')
+
+    values[index[missing]] = None
+
+    strings = rest[is_str].astype(str)
+    is_hex = np.char.startswith(strings, '00') | np.char.startswith(strings, '01')
+    wkt = index[is_str][~is_hex]
+    wkb = np.concatenate([index[is_bytes], index[is_str][is_hex]])
+    if wkt.shape[0] > 0:
+        values[wkt] = apply_chunked(parse_geometries, values[wkt], shapely.io.from_wkt, {})
+    if wkb.shape[0] > 0:
+        values[wkb] = apply_chunked(parse_geometries, values[wkb], shapely.io.from_wkb, {})
+
+    return values
+
+
+def parse_geometries(values, func, kwargs):
+    """
+    Parse WKB or WKT data with a shapely function.
+
+    Shapely only accepts None as a missing value, so we only copy the data and replace other NA values (eg. NaN)
+    when parsing fails, instead of always checking the entire input for missing values.
+    """
+    values = np.asarray(values, dtype=object)
+    try:
+        return func(values, **kwargs)
+    except TypeError:
+        missing = pd.isna(values)
+        if not missing.any():
+            raise
+
+        values = values.copy()
+        values[missing] = None
+        return func(values, **kwargs)
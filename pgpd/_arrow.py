@@ -0,0 +1,109 @@
+#
+# Apache Arrow Integration
+#
+from contextlib import suppress
+
+import numpy as np
+import shapely
+
+from ._wkb import WKBStorage
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+__all__ = ['GeosArrowType'] if pa is not None else []
+
+
+if pa is not None:
+
+    class GeosArrowType(pa.ExtensionType):
+        """
+        PyArrow extension type for geos data.
+
+        The geometries are stored as WKB in a (large) binary array,
+        following the `GeoArrow <https://geoarrow.org>`_ "geoarrow.wkb" extension type.
+        This type gets registered with pyarrow when importing pgpd,
+        so that geos columns are natively serialized to Parquet or Feather.
+
+        Args:
+            storage_type (pyarrow.DataType, optional): Storage type of the WKB data; Default **pyarrow.large_binary()**.
+        """
+
+        def __init__(self, storage_type=None):
+            if storage_type is None:
+                storage_type = pa.large_binary()
+            super().__init__(storage_type, 'geoarrow.wkb')
+
+        def __arrow_ext_serialize__(self):
+            return b'{}'
+
+        @classmethod
+        def __arrow_ext_deserialize__(cls, storage_type, serialized):
+            return cls(storage_type)
+
+        def to_pandas_dtype(self):
+            from ._array import GeosDtype
+
+            return GeosDtype()
+
+    # Another library (eg. geoarrow-pyarrow) might already have registered the GeoArrow types,
+    # which we can still read through GeosDtype.__from_arrow__
+    with suppress(pa.ArrowKeyError):
+        pa.register_extension_type(GeosArrowType())
+
+
+def to_arrow(data, type=None):
+    """
+    Convert shapely geometries to a pyarrow extension array with WKB data.
+
+    Args:
+        data (numpy.ndarray or pgpd._wkb.WKBStorage): Shapely geometries or lazy WKB data.
+        type (pyarrow.DataType, optional): Requested type; Default **GeosArrowType()**.
+
+    Returns:
+        pyarrow.ExtensionArray: Array of :class:`~pgpd.GeosArrowType`.
+    """
+    if pa is None:
+        raise ImportError('PyArrow is required for this function')
+
+    if isinstance(type, GeosArrowType):
+        arrow_type = type
+    elif type is None or pa.types.is_large_binary(type) or pa.types.is_binary(type):
+        arrow_type = GeosArrowType(type)
+    else:
+        raise TypeError(f'Cannot convert geos data to "{type}"')
+
+    # Lazy arrays already contain WKB data, which does not need to be decoded
+    wkb = data.to_wkb() if isinstance(data, WKBStorage) else shapely.to_wkb(data)
+    storage = pa.array(wkb, type=arrow_type.storage_type, from_pandas=True)
+    return pa.ExtensionArray.from_storage(arrow_type, storage)
+
+
+def from_arrow(array):
+    """
+    Convert a pyarrow array with WKB (or WKT) data to shapely geometries.
+
+    Args:
+        array (pyarrow.Array or pyarrow.ChunkedArray): Arrow data, which can be a GeoArrow extension array or a plain binary or string array.
+
+    Returns:
+        numpy.ndarray: Shapely geometries.
+    """
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+
+    results = []
+    for chunk in chunks:
+        if isinstance(chunk, pa.ExtensionArray):
+            chunk = chunk.storage
+
+        values = chunk.to_numpy(zero_copy_only=False)
+        if pa.types.is_string(chunk.type) or pa.types.is_large_string(chunk.type):
+            results.append(shapely.from_wkt(values))
+        else:
+            results.append(shapely.from_wkb(values))
+
+    if len(results) == 0:
+        return np.array([], dtype=object)
+    return np.concatenate(results)
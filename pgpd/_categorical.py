@@ -0,0 +1,310 @@
+#
+# Dictionary-encoded GeosArray
+#
+import numbers
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from ._affine import to_matrix
+from ._array import GeosArray, readonly
+
+__all__ = ['GeosCategoricalArray']
+
+
+class GeosCategoricalArray(GeosArray):
+    """
+    Dictionary-encoded variant of the :class:`~pgpd.GeosArray`,
+    which stores an integer code for each row that points into an array of unique geometries (the categories).
+
+    This saves memory and computations for columns where the same geometries are repeated many times (eg. administrative boundaries).
+    Unary functions of the :class:`~pgpd.GeosSeriesAccessor` are only computed once for each category and then gathered for each row,
+    transformations with a single matrix or operand only transform the categories,
+    and :meth:`~pgpd.GeosCategoricalArray.take` or concatenating arrays preserves the encoding.
+    Operations that compute a different geometry for each row return a regular :class:`~pgpd.GeosArray`.
+
+    The array has the same "geos" dtype as a regular :class:`~pgpd.GeosArray`,
+    so you can use it in a Series and call any method of the accessors.
+
+    Args:
+        data (Iterable): Shapely data, which is encoded by comparing the WKB of the geometries (see :meth:`pgpd.GeosArray.factorize`).
+
+    Example:
+        >>> boundaries = shapely.box(range(3), 0, range(1, 4), 1)
+        >>> data = pgpd.GeosCategoricalArray(boundaries[[0, 1, 1, 2, 0, 0]])
+        >>> data.codes
+        array([0, 1, 1, 2, 0, 0])
+        >>> s = pd.Series(data, dtype='geos')
+        >>> s.geos.area()  # Only computed for 3 geometries
+        0    1.0
+        1    1.0
+        2    1.0
+        3    1.0
+        4    1.0
+        5    1.0
+        Name: area, dtype: float64
+    """
+
+    def __init__(self, data):
+        codes, categories = GeosArray(data).factorize()
+        self._set_codes(codes, categories)
+
+    @classmethod
+    def from_codes(cls, codes, categories):
+        """
+        Create a GeosCategoricalArray from codes and categories.
+
+        Args:
+            codes (array-like): Integer index into the categories for each row, where -1 means a missing value.
+            categories (Iterable): Shapely geometries, which do not need to be unique.
+
+        Returns:
+            pgpd.GeosCategoricalArray: Encoded geometries.
+
+        Raises:
+            ValueError: Codes are not in the range ``[-1, len(categories))``.
+        """
+        # Categories are never modified in place, so arrays with the same codes can share them (and their cached bounds)
+        if type(categories) is not GeosArray:
+            categories = GeosArray(categories)
+
+        result = cls.__new__(cls)
+        result._set_codes(codes, categories)
+        return result
+
+    def _set_codes(self, codes, categories):
+        codes = np.asarray(codes, dtype=np.intp)
+        if codes.ndim != 1:
+            raise ValueError('Codes should be 1-dimensional')
+        if codes.shape[0] > 0 and (codes.min() < -1 or codes.max() >= len(categories)):
+            raise ValueError('Codes should be in the range [-1, len(categories))')
+
+        self._codes = codes
+        self._categories = categories
+        self._data = None
+        self._wkb = None
+        self._reset_cache()
+
+    @classmethod
+    def _from_storage(cls, storage):
+        return cls(GeosArray._from_storage(storage))
+
+    @classmethod
+    def _simple_new(cls, data):
+        return cls(GeosArray._simple_new(data))
+
+    @property
+    def codes(self):
+        """Integer index into the categories for each row, where -1 means a missing value."""
+        return self._codes
+
+    @property
+    def categories(self):
+        """:class:`~pgpd.GeosArray` with the geometries that are referenced by the codes."""
+        return self._categories
+
+    @property
+    def data(self):
+        """NumPy array with the shapely geometries of each row, where the repeated geometries are the same objects."""
+        return self.map_categories(lambda categories: categories)
+
+    @data.setter
+    def data(self, value):
+        # Each row gets its own category, as the geometries of all rows might be different
+        value = np.asarray(value, dtype=object)
+        self._codes = np.where(pd.isna(value), -1, np.arange(value.shape[0]))
+        self._categories = GeosArray(value)
+        self._reset_cache()
+
+    def map_categories(self, func, geos=False):
+        """
+        Apply a function to the categories and gather the result for each row.
+
+        Args:
+            func (callable): Function that takes a NumPy array with the categories and a trailing None and returns an array of the same length.
+            geos (bool, optional): Whether the function returns geometries, which are returned with the same encoding; Default **False**.
+
+        Returns:
+            numpy.ndarray or pgpd.GeosCategoricalArray: Result of the function for each row.
+        """
+        result = func(np.append(self._categories.data, None))
+        if geos:
+            return self.from_codes(self._codes, result[:-1])
+
+        # Missing values have a code of -1, which selects the result of the trailing None
+        return result[self._codes]
+
+    def to_dense(self):
+        """
+        Decode the geometries into a regular GeosArray.
+
+        Returns:
+            pgpd.GeosArray: Geometries of each row.
+        """
+        return GeosArray(self.data)
+
+    def to_categorical(self):
+        return self
+
+    def to_buffer(self, **kwargs):
+        return self.to_dense().to_buffer(**kwargs)
+
+    def __reduce_ex__(self, protocol):
+        # The categories are pickled as a WKB buffer, so we only encode each unique geometry once
+        return GeosCategoricalArray.from_codes, (self._codes, self._categories)
+
+    def to_wkb(self, **kwargs):
+        return np.append(self._categories.to_wkb(**kwargs), None)[self._codes]
+
+    def to_wkt(self, **kwargs):
+        return np.append(self._categories.to_wkt(**kwargs), None)[self._codes]
+
+    def __arrow_array__(self, type=None):
+        from ._arrow import to_arrow
+
+        return to_arrow(self.data, type)
+
+    # -------------------------------------------------------------------------
+    # ExtensionArray Specific
+    # -------------------------------------------------------------------------
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        return cls(GeosArray._from_sequence(scalars, dtype, copy))
+
+    def _values_for_factorize(self):
+        keys, _ = self._categories._values_for_factorize()
+        return np.append(keys, None)[self._codes], None
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(GeosArray.from_wkb(values))
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral):
+            code = self._codes[key]
+            return None if code < 0 else self._categories[code]
+
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        key = pd.api.indexers.check_array_indexer(self, key)
+
+        if isinstance(key, (Iterable, slice)):
+            return self.from_codes(self._codes[key], self._categories)
+        raise TypeError('Index type not supported', key)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        key = pd.api.indexers.check_array_indexer(self, key)
+
+        scalar = not isinstance(key, (slice, list, np.ndarray))
+        if scalar and isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            raise ValueError('cannot set a single element with an array')
+
+        # Slices and transformed arrays share their codes, so we write to a copy that belongs to this array
+        self._codes = self._codes.copy()
+
+        # The new geometries are added as extra categories, so that we do not modify the existing ones
+        values = value if isinstance(value, GeosArray) else GeosArray._from_sequence(value)
+        codes = np.arange(len(self._categories), len(self._categories) + len(values))
+        codes[values.isna()] = -1
+
+        self._codes[key] = codes[0] if scalar else codes
+        self._categories = GeosArray._concat_same_type([self._categories, GeosArray(values)])
+        self._reset_cache()
+
+    def memory_usage(self, deep=False):
+        return self._codes.nbytes + self._categories.memory_usage(deep)
+
+    def memory_report(self):
+        # Repeated geometries are the same objects, so only the categories use memory
+        return self._categories.memory_report()
+
+    def isna(self):
+        return np.append(self._categories.isna(), True)[self._codes]
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        from pandas.core.algorithms import take
+
+        categories = self._categories
+        fill_code = -1
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            if not isinstance(fill_value, self.dtype.type):
+                raise TypeError('Provide geometry or None as fill value')
+
+            fill_code = len(categories)
+            categories = GeosArray._concat_same_type([categories, GeosArray(fill_value)])
+
+        codes = take(self._codes, indices, allow_fill=allow_fill, fill_value=fill_code)
+        return self.from_codes(codes, categories)
+
+    def copy(self, order='C'):
+        return self.from_codes(self._codes.copy(order), self._categories)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        if not all(isinstance(c, GeosCategoricalArray) for c in to_concat):
+            return GeosArray._concat_same_type(to_concat)
+
+        categories = to_concat[0]._categories
+        if all(c._categories is categories for c in to_concat):
+            return cls.from_codes(np.concatenate([c._codes for c in to_concat]), categories)
+
+        offsets = np.cumsum([0] + [len(c._categories) for c in to_concat[:-1]])
+        codes = np.concatenate([np.where(c._codes >= 0, c._codes + offset, -1) for c, offset in zip(to_concat, offsets)])
+        categories = GeosArray._concat_same_type([c._categories for c in to_concat])
+        return cls.from_codes(codes, categories)
+
+    # -------------------------------------------------------------------------
+    # NumPy Specific
+    # -------------------------------------------------------------------------
+    @property
+    def shape(self):
+        return self._codes.shape
+
+    # -------------------------------------------------------------------------
+    # Custom Methods
+    # -------------------------------------------------------------------------
+    @property
+    def bounds(self):
+        if self._bounds is None:
+            bounds = np.concatenate([self._categories.bounds, np.full((1, 4), np.nan)])
+            self._bounds = readonly(bounds[self._codes])
+        return self._bounds
+
+    def affine(self, matrix, inplace=False):
+        if to_matrix(matrix)[0].ndim == 3:
+            return super().affine(matrix, inplace)
+        return self._replace_categories(self._categories.affine(matrix), inplace)
+
+    def _arithmetic(self, other, op, reverse=False, inplace=False):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        # Operands with multiple rows have values for each geometry or coordinate of the rows
+        other = np.asarray(other)
+        if other.ndim == 2 and other.shape[0] > 1:
+            return super()._arithmetic(other, op, reverse, inplace)
+        return self._replace_categories(self._categories._arithmetic(other, op, reverse), inplace)
+
+    def _replace_categories(self, categories, inplace):
+        """Replace the categories with transformed ones, either in this array or in a new one."""
+        if not inplace:
+            return self.from_codes(self._codes, categories)
+
+        self._categories = categories
+        self._reset_cache()
+        return self
+
+    def _replace_geometries(self, func, inplace):
+        if not inplace:
+            return GeosArray(func(self.data))
+
+        self.data = self.data
+        self._categories._replace_geometries(func, True)
+        self._reset_cache()
+        return self
+
+    def _any_z(self):
+        return self._categories._any_z()
@@ -0,0 +1,135 @@
+#
+# Space-filling curves
+#
+import numpy as np
+
+__all__ = ['curve_distance', 'hilbert_distance', 'morton_distance']
+
+
+def hilbert_distance(bounds, total_bounds=None, level=16):
+    """
+    Compute the distance along a Hilbert curve of the centers of bounding boxes.
+
+    Args:
+        bounds (numpy.ndarray): ``<Nx4>`` array with (xmin, ymin, xmax, ymax) bounding boxes.
+        total_bounds (array-like, optional): Extent that is covered by the curve; Default **extent of the bounds**.
+        level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+    Returns:
+        numpy.ndarray: int64 distances, where missing or empty geometries get a distance of ``2**(2*level)``.
+    """
+    x, y, missing = discretize(bounds, total_bounds, level)
+
+    x = x << (16 - level)
+    y = y << (16 - level)
+
+    # Initial prefix scan round, primed with x and y
+    a = x ^ y
+    b = 0xFFFF ^ a
+    c = 0xFFFF ^ (x | y)
+    d = x & (y ^ 0xFFFF)
+
+    A = a | (b >> 1)
+    B = (a >> 1) ^ a
+    C = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    D = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    # Prefix scan rounds
+    for shift in (2, 4):
+        a, b, c, d = A, B, C, D
+        A = (a & (a >> shift)) ^ (b & (b >> shift))
+        B = (a & (b >> shift)) ^ (b & ((a ^ b) >> shift))
+        C = C ^ (a & (c >> shift)) ^ (b & (d >> shift))
+        D = D ^ (b & (c >> shift)) ^ ((a ^ b) & (d >> shift))
+
+    # Final round and projection
+    a, b, c, d = A, B, C, D
+    C = C ^ (a & (c >> 8)) ^ (b & (d >> 8))
+    D = D ^ (b & (c >> 8)) ^ ((a ^ b) & (d >> 8))
+
+    # Undo transformation prefix scan
+    a = C ^ (C >> 1)
+    b = D ^ (D >> 1)
+
+    # Recover index bits
+    i0 = x ^ y
+    i1 = b | (0xFFFF ^ (i0 | a))
+
+    distance = ((interleave(i1) << 1) | interleave(i0)) >> (32 - 2 * level)
+    distance = distance.astype(np.int64)
+    distance[missing] = 2 ** (2 * level)
+    return distance
+
+
+def morton_distance(bounds, total_bounds=None, level=16):
+    """
+    Compute the distance along a Morton (Z-order) curve of the centers of bounding boxes.
+
+    Args:
+        bounds (numpy.ndarray): ``<Nx4>`` array with (xmin, ymin, xmax, ymax) bounding boxes.
+        total_bounds (array-like, optional): Extent that is covered by the curve; Default **extent of the bounds**.
+        level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+    Returns:
+        numpy.ndarray: int64 distances, where missing or empty geometries get a distance of ``2**(2*level)``.
+    """
+    x, y, missing = discretize(bounds, total_bounds, level)
+
+    distance = ((interleave(y) << 1) | interleave(x)).astype(np.int64)
+    distance[missing] = 2 ** (2 * level)
+    return distance
+
+
+def curve_distance(curve, bounds, total_bounds=None, level=16):
+    """
+    Compute the distance along a space-filling curve of the centers of bounding boxes.
+
+    Args:
+        curve ('hilbert' or 'morton'): Type of space-filling curve.
+        bounds (numpy.ndarray): ``<Nx4>`` array with (xmin, ymin, xmax, ymax) bounding boxes.
+        total_bounds (array-like, optional): Extent that is covered by the curve; Default **extent of the bounds**.
+        level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+    Returns:
+        numpy.ndarray: int64 distances, where missing or empty geometries get a distance of ``2**(2*level)``.
+    """
+    if curve == 'hilbert':
+        return hilbert_distance(bounds, total_bounds, level)
+    if curve == 'morton':
+        return morton_distance(bounds, total_bounds, level)
+    raise ValueError(f'Curve should be "hilbert" or "morton", not "{curve}"')
+
+
+def discretize(bounds, total_bounds, level):
+    """Map the centers of the bounding boxes onto a ``<2**level x 2**level>`` integer grid."""
+    if not 1 <= level <= 16:
+        raise ValueError('"level" should be in the range [1, 16]')
+
+    bounds = np.asarray(bounds, dtype=float)
+    missing = np.isnan(bounds).any(axis=1)
+    if total_bounds is None:
+        total_bounds = (
+            np.nanmin(bounds[:, 0]) if not missing.all() else 0,
+            np.nanmin(bounds[:, 1]) if not missing.all() else 0,
+            np.nanmax(bounds[:, 2]) if not missing.all() else 0,
+            np.nanmax(bounds[:, 3]) if not missing.all() else 0,
+        )
+    xmin, ymin, xmax, ymax = total_bounds
+
+    side = 2**level - 1
+    width = xmax - xmin if xmax > xmin else 1
+    height = ymax - ymin if ymax > ymin else 1
+    x = ((bounds[:, 0] + bounds[:, 2]) / 2 - xmin) * (side / width)
+    y = ((bounds[:, 1] + bounds[:, 3]) / 2 - ymin) * (side / height)
+
+    x = np.clip(np.nan_to_num(x), 0, side).astype(np.uint32)
+    y = np.clip(np.nan_to_num(y), 0, side).astype(np.uint32)
+    return x, y, missing
+
+
+def interleave(x):
+    """Interleave the lower 16 bits of x with zeros."""
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    return (x | (x << 1)) & 0x55555555
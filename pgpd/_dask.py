@@ -0,0 +1,297 @@
+#
+# Dask DataFrame integration
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+from ._accessor_dataframe import GeosDataFrameAccessor
+from ._accessor_series import GeosSeriesAccessor
+from ._array import GeosArray, GeosDtype
+from ._curves import curve_distance
+from ._join import get_geos_column, sjoin, sjoin_nearest
+
+try:
+    import dask
+    import dask.dataframe as dd
+    from dask.dataframe.extensions import make_array_nonempty, make_scalar, register_dataframe_accessor, register_series_accessor
+except ImportError:
+    dd = None
+
+__all__ = ['GeosDaskSeriesAccessor', 'GeosDaskDataFrameAccessor']
+
+BOUNDS = ['xmin', 'ymin', 'xmax', 'ymax']
+
+
+class GeosDaskSeriesAccessor:
+    """
+    Access shapely functionality of a Dask Series through the "geos" accessor keyword.
+
+    The methods of the :class:`~pgpd.GeosSeriesAccessor` are run on each partition with :meth:`dask.dataframe.Series.map_partitions`,
+    which only makes sense for methods that compute a result for each row (eg. ``area`` or ``buffer``).
+    Computations run on any Dask scheduler, including the local threaded and process schedulers.
+
+    Example:
+        >>> s = dd.from_pandas(pd.Series(shapely.points(range(10), 0), dtype='geos'), npartitions=2)
+        >>> s.geos.buffer(1).geos.area().sum().compute()
+        31.214451522580515
+    """
+
+    def __init__(self, obj):
+        if pd.api.types.pandas_dtype('geos') != obj.dtype:
+            obj = obj.astype('geos')
+        self._obj = obj
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in ('lazy', 'transform_chain') or not callable(getattr(GeosSeriesAccessor, name, None)):
+            raise AttributeError(f'"{name}" is not supported on Dask Series')
+
+        def delegated(*args, **kwargs):
+            check_inplace(kwargs)
+            return self._obj.map_partitions(call_series_accessor, name, *args, **kwargs)
+
+        delegated.__name__ = name
+        delegated.__doc__ = getattr(GeosSeriesAccessor, name).__doc__
+        return delegated
+
+    def partition_bounds(self):
+        """
+        Computes the total bounds of each partition.
+
+        Returns:
+            dask.dataframe.DataFrame: DataFrame with the "xmin", "ymin", "xmax" and "ymax" of each partition.
+        """
+        return self._obj.map_partitions(partition_bounds, meta=pd.DataFrame({b: pd.Series(dtype=float) for b in BOUNDS}))
+
+    def total_bounds(self):
+        """
+        Computes the total bounds (extent) of the geometries, as a reduction of the bounds of each partition.
+
+        Returns:
+            dask.dataframe.Series: Series with the "xmin", "ymin", "xmax" and "ymax" of all the geometries.
+        """
+        bounds = self.partition_bounds()
+        return dd.concat([bounds[['xmin', 'ymin']].min(), bounds[['xmax', 'ymax']].max()])
+
+    def hilbert_distance(self, total_bounds=None, level=16):
+        """
+        Computes the distance along a Hilbert curve of the centers of the bounding boxes of the geometries.
+        See :meth:`pgpd.GeosSeriesAccessor.hilbert_distance` for more information.
+
+        Args:
+            total_bounds (array-like, optional): Extent that is covered by the curve; Default **computed total bounds of all partitions**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+        Returns:
+            dask.dataframe.Series: int64 distances.
+        """
+        return self._curve_distance('hilbert', total_bounds, level)
+
+    def morton_distance(self, total_bounds=None, level=16):
+        """
+        Computes the distance along a Morton (Z-order) curve of the centers of the bounding boxes of the geometries.
+        See :meth:`pgpd.GeosSeriesAccessor.morton_distance` for more information.
+
+        Args:
+            total_bounds (array-like, optional): Extent that is covered by the curve; Default **computed total bounds of all partitions**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+
+        Returns:
+            dask.dataframe.Series: int64 distances.
+        """
+        return self._curve_distance('morton', total_bounds, level)
+
+    def _curve_distance(self, curve, total_bounds, level):
+        # Every partition needs to use the same extent, otherwise the distances cannot be compared
+        if total_bounds is None:
+            total_bounds = self.total_bounds().compute().to_numpy()
+
+        meta = pd.Series(dtype=np.int64, name=f'{curve}_distance')
+        return self._obj.map_partitions(partition_curve_distance, curve, np.asarray(total_bounds), level, meta=meta)
+
+
+class GeosDaskDataFrameAccessor:
+    """
+    Access shapely functionality of a Dask DataFrame through the "geos" accessor keyword.
+
+    The methods of the :class:`~pgpd.GeosDataFrameAccessor` are run on each partition with :meth:`dask.dataframe.DataFrame.map_partitions`.
+    Additionally, this accessor provides a spatial repartitioning of the data and a spatial join that only pairs partitions with intersecting bounds.
+    Computations run on any Dask scheduler, including the local threaded and process schedulers.
+    """
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in ('to_parquet', 'sort_spatially') or not callable(getattr(GeosDataFrameAccessor, name, None)):
+            raise AttributeError(f'"{name}" is not supported on Dask DataFrames')
+
+        def delegated(*args, **kwargs):
+            check_inplace(kwargs)
+            return self._obj.map_partitions(call_dataframe_accessor, name, *args, **kwargs)
+
+        delegated.__name__ = name
+        delegated.__doc__ = getattr(GeosDataFrameAccessor, name).__doc__
+        return delegated
+
+    def partition_bounds(self, geometry=None):
+        """
+        Computes the total bounds of each partition.
+
+        Args:
+            geometry (str, optional): Name of the geos column; Default **only geos column**.
+
+        Returns:
+            dask.dataframe.DataFrame: DataFrame with the "xmin", "ymin", "xmax" and "ymax" of each partition.
+        """
+        return self._column(geometry).geos.partition_bounds()
+
+    def sort_spatially(self, geometry=None, curve='hilbert', level=16, npartitions=None):
+        """
+        Sort and repartition the rows of the DataFrame along a space-filling curve through the centers of the bounding boxes of the geometries.
+
+        Each partition contains a range of the curve, so that the partitions are spatially compact,
+        which allows :meth:`~pgpd.GeosDaskDataFrameAccessor.sjoin` to skip pairs of partitions that cannot match.
+        The extent of the curve is computed first and the data is then shuffled with :meth:`dask.dataframe.DataFrame.sort_values`.
+
+        Args:
+            geometry (str, optional): Name of the geos column to sort by; Default **only geos column**.
+            curve ('hilbert' or 'morton', optional): Type of space-filling curve; Default **hilbert**.
+            level (int, optional): Number of iterations of the curve, which should be in the range [1, 16]; Default **16**.
+            npartitions (int, optional): Number of output partitions; Default **same number of partitions**.
+
+        Returns:
+            dask.dataframe.DataFrame: Spatially sorted DataFrame, where rows with missing or empty geometries are placed last.
+        """
+        distance = self._column(geometry).geos._curve_distance(curve, None, level)
+
+        key = '__pgpd_curve_distance__'
+        df = self._obj.assign(**{key: distance})
+        df = df.sort_values(key, npartitions=npartitions or self._obj.npartitions)
+        return df.drop(columns=[key])
+
+    def sjoin(self, other, predicate='intersects', how='inner', left_on=None, right_on=None, lsuffix='left', rsuffix='right', distance=None):
+        """
+        Spatially join the partitions of this DataFrame with another DataFrame.
+        See :meth:`pgpd.GeosDataFrameAccessor.sjoin` for more information about the arguments.
+
+        If the other DataFrame is a pandas DataFrame, it is joined with each partition.
+        If it is a Dask DataFrame, each partition is only joined with the partitions of the other DataFrame whose bounds intersect with it,
+        so that spatially partitioned data (see :meth:`~pgpd.GeosDaskDataFrameAccessor.sort_spatially`) only joins a few pairs of partitions.
+
+        Args:
+            other (pandas.DataFrame or dask.dataframe.DataFrame): DataFrame to join with.
+            predicate (str, optional): Binary predicate to match geometries; Default **intersects**.
+            how ('inner' or 'left', optional): Type of join; Default **inner**.
+            left_on (str, optional): Name of the geos column of this DataFrame; Default **only geos column**.
+            right_on (str, optional): Name of the geos column of the other DataFrame; Default **only geos column**.
+            lsuffix (str, optional): Suffix for overlapping columns of this DataFrame; Default **left**.
+            rsuffix (str, optional): Suffix for overlapping columns of the other DataFrame; Default **right**.
+            distance (float, optional): Distance for the "dwithin" predicate; Default **None**.
+
+        Returns:
+            dask.dataframe.DataFrame: Joined DataFrame, which uses the index of this DataFrame.
+
+        Raises:
+            ValueError: ``how='right'``, which is not supported for partitioned data (swap the DataFrames instead).
+        """
+        if how not in ('inner', 'left'):
+            raise ValueError(f'"how" should be one of "inner" or "left" for Dask DataFrames, not "{how}"')
+
+        args = (predicate, how, left_on, right_on, lsuffix, rsuffix, distance)
+        if not isinstance(other, dd.DataFrame):
+            meta = sjoin(self._obj._meta, other.iloc[:0], *args)
+            return self._obj.map_partitions(sjoin, other, *args, meta=meta)
+
+        meta = sjoin(self._obj._meta, other._meta, *args)
+        lbounds, rbounds = dask.compute(self.partition_bounds(left_on), other.geos.partition_bounds(right_on))
+        lbounds, rbounds = lbounds.to_numpy(), rbounds.to_numpy()
+        if predicate == 'dwithin' and distance is not None:
+            lbounds = lbounds + np.asarray(distance) * np.array([-1, -1, 1, 1])
+
+        # Partitions without geometries have NaN bounds and do not intersect with any other partition
+        overlap = (
+            (lbounds[:, None, 0] <= rbounds[None, :, 2])
+            & (lbounds[:, None, 2] >= rbounds[None, :, 0])
+            & (lbounds[:, None, 1] <= rbounds[None, :, 3])
+            & (lbounds[:, None, 3] >= rbounds[None, :, 1])
+        )
+
+        left_parts = self._obj.to_delayed()
+        right_parts = other.to_delayed()
+        joined = [
+            dask.delayed(sjoin_partitions)(left_part, [right_parts[j] for j in np.flatnonzero(row)], other._meta, *args)
+            for left_part, row in zip(left_parts, overlap)
+        ]
+        return dd.from_delayed(joined, meta=meta, verify_meta=False)
+
+    def sjoin_nearest(self, other, *args, **kwargs):
+        """
+        Spatially join each partition of this DataFrame with a pandas DataFrame, by matching each geometry with its nearest neighbour(s).
+        See :meth:`pgpd.GeosDataFrameAccessor.sjoin_nearest` for more information about the arguments.
+
+        Args:
+            other (pandas.DataFrame): DataFrame to join with, which cannot be a Dask DataFrame as the nearest geometry could be in any partition.
+            args: Arguments passed to :meth:`~pgpd.GeosDataFrameAccessor.sjoin_nearest`.
+            kwargs: Keyword arguments passed to :meth:`~pgpd.GeosDataFrameAccessor.sjoin_nearest`.
+
+        Returns:
+            dask.dataframe.DataFrame: Joined DataFrame, which uses the index of this DataFrame.
+        """
+        if isinstance(other, dd.DataFrame):
+            raise TypeError('"other" should be a pandas DataFrame')
+        if kwargs.get('how', 'inner') == 'right' or (len(args) > 2 and args[2] == 'right'):
+            raise ValueError('"how" should be one of "inner" or "left" for Dask DataFrames')
+
+        meta = sjoin_nearest(self._obj._meta, other.iloc[:0], *args, **kwargs)
+        return self._obj.map_partitions(sjoin_nearest, other, *args, meta=meta, **kwargs)
+
+    def _column(self, geometry):
+        """Return the geos column of the Dask DataFrame, inferring it from the meta if there is only one."""
+        return self._obj[get_geos_column(self._obj._meta, geometry).name]
+
+
+def check_inplace(kwargs):
+    """Dask collections are immutable, so we cannot modify the partitions in place."""
+    if kwargs.get('inplace', False):
+        raise ValueError('Dask collections cannot be modified inplace')
+
+
+def call_series_accessor(s, name, *args, **kwargs):
+    """Call a :class:`~pgpd.GeosSeriesAccessor` method on a partition."""
+    result = getattr(s.geos, name)(*args, **kwargs)
+    return result._obj if isinstance(result, GeosSeriesAccessor) else result
+
+
+def call_dataframe_accessor(df, name, *args, **kwargs):
+    """Call a :class:`~pgpd.GeosDataFrameAccessor` method on a partition."""
+    return getattr(df.geos, name)(*args, **kwargs)
+
+
+def partition_bounds(s):
+    """Compute the total bounds of a partition as a single row DataFrame."""
+    return pd.DataFrame([s.array.total_bounds], columns=BOUNDS)
+
+
+def partition_curve_distance(s, curve, total_bounds, level):
+    """Compute the space-filling curve distance of the geometries of a partition."""
+    return pd.Series(curve_distance(curve, s.array.bounds, total_bounds, level), index=s.index, name=f'{curve}_distance')
+
+
+def sjoin_partitions(left, right_parts, right_meta, *args):
+    """Join a partition with the concatenation of the partitions of the other DataFrame that intersect with it."""
+    right = pd.concat(right_parts) if len(right_parts) > 0 else right_meta
+    return sjoin(left, right, *args)
+
+
+if dd is not None:
+    register_series_accessor('geos')(GeosDaskSeriesAccessor)
+    register_dataframe_accessor('geos')(GeosDaskDataFrameAccessor)
+
+    @make_array_nonempty.register(GeosDtype)
+    def make_geos_nonempty(dtype):
+        return GeosArray._simple_new(np.array([shapely.Point(0, 0), None], dtype=object))
+
+    @make_scalar.register(GeosDtype.type)
+    def make_geos_scalar(x):
+        return shapely.Point(0, 0)
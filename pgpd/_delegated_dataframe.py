@@ -1,6 +1,8 @@
 #
 # Delegated Accessor Attributes for DataFrames
 #
+from inspect import signature
+
 import pandas as pd
 
 from ._accessor_series import GeosSeriesAccessor
@@ -19,6 +21,7 @@ def unary_dataframe_expanded(name, expansion):
         expansion (int): Type of dataframe expansion
     """
     func_summary = get_summary(rgetattr(GeosSeriesAccessor, f'{name}.__doc__', None))
+    series_inplace = 'inplace' in signature(getattr(GeosSeriesAccessor, name)).parameters
 
     def delegated1(self, *args, inplace=False, **kwargs):
         """
@@ -35,7 +38,14 @@ def unary_dataframe_expanded(name, expansion):
         Returns:
             pandas.DataFrame or None:
                 DataFrame where each "geos" column from the original is transformed or None if ``inplace=True``.
+
+        Note:
+            If the Series method supports it, ``inplace=True`` replaces the geometries in the existing columns,
+            instead of computing new columns and assigning them to the DataFrame.
         """
+        if inplace:
+            return apply_inplace(self._obj, name, args, kwargs, series_inplace)
+
         result = {}
         remainder = []
         for column, dtype in self._obj.dtypes.items():
@@ -44,13 +54,7 @@ def unary_dataframe_expanded(name, expansion):
             else:
                 remainder.append(column)
 
-        if not inplace:
-            return pd.DataFrame.from_dict({**{col: self._obj[col].copy() for col in remainder}, **result})
-
-        for column, values in result.items():
-            self._obj[column] = values
-
-        return None
+        return pd.DataFrame.from_dict({**{col: self._obj[col].copy() for col in remainder}, **result})
 
     def delegated2(self, *args, **kwargs):
         """
@@ -80,3 +84,16 @@ def unary_dataframe_expanded(name, expansion):
 
     delegated2.__doc__ = delegated2.__doc__.format(func=name, summary=func_summary)
     return delegated2
+
+
+def apply_inplace(df, name, args, kwargs, series_inplace):
+    """
+    Modify each geos column of the DataFrame with a :class:`pgpd.GeosSeriesAccessor` method.
+    Methods that support ``inplace=True`` replace the geometries of the existing columns, otherwise the results are assigned to the columns.
+    """
+    columns = [column for column, dtype in df.dtypes.items() if pd.api.types.pandas_dtype('geos') == dtype]
+    for column in columns:
+        if series_inplace:
+            getattr(df[column].geos, name)(*args, inplace=True, **kwargs)
+        else:
+            df[column] = getattr(df[column].geos, name)(*args, **kwargs)
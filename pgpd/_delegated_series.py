@@ -10,6 +10,10 @@ import pandas as pd
 import shapely
 
 from ._array import GeosArray
+from ._categorical import GeosCategoricalArray
+from ._options import options
+from ._parallel import apply_chunked
+from ._sindex import GeosSpatialIndex
 from ._util import get_summary, rgetattr
 
 __all__ = [
@@ -21,6 +25,8 @@ __all__ = [
     'unary_dataframe_indexed',
     'unary_dataframe_keyed',
     'binary',
+    'binary_blocks',
+    'binary_pairs',
     'enable_dataframe_expand',
 ]
 
@@ -127,13 +133,14 @@ def unary_series(name, index=None, geos=False, **defaults):
     return delegated
 
 
-def unary_series_indexed(name, geos=False, **defaults):
+def unary_series_indexed(name, geos=False, parallel=True, **defaults):
     """
     Create a method that returns a Series with values, where each object in the original data maps to one new value.
 
     Args:
         name (str): Name of the method within the ``shapely`` module.
         geos (bool, optional): Whether the returned data is shapely dtype; Default **False**.
+        parallel (bool, optional): Whether the function can be run on chunks of the data in parallel; Default **True**.
         defaults (**kwargs): Default argument values that cannot be overwritten
     """
     try:
@@ -151,14 +158,26 @@ def unary_series_indexed(name, geos=False, **defaults):
             pandas.Series: Series with the results of the function.
         """
         args, kwargs = setup_args(args, kwargs, defaults, default_pos)
-        result = func(self._obj.array.data, *args, **kwargs)
-        if geos:
-            result = GeosArray(result)
+
+        def compute(data):
+            return apply_chunked(func, data, *args, **kwargs) if parallel else func(data, *args, **kwargs)
+
+        array = self._obj.array
+        if isinstance(array, GeosCategoricalArray) and all(np.ndim(arg) == 0 for arg in (*args, *kwargs.values())):
+            # Scalar arguments give the same result for each occurrence of a geometry, so we only compute the categories
+            result = array.map_categories(compute, geos=geos)
+        else:
+            result = compute(array.data)
+            if geos:
+                result = GeosArray._simple_new(result)
 
         return pd.Series(result, index=self._obj.index, name=func.__name__)
 
     delegated.__doc__ = setup_docstring(delegated.__doc__, defaults, func=name, summary=func_summary)
     delegated.__DataFrameExpand__ = 1
+    if parallel:
+        # Elementwise functions can be fused in a lazy chain (see pgpd._lazy.LazyChain)
+        delegated.__LazyStep__ = (func, geos, defaults, default_pos)
     return delegated
 
 
@@ -188,9 +207,9 @@ def unary_series_keyed(name, geos=False, **defaults):
             pandas.Series: Series with the results of the function.
         """
         args, kwargs = setup_args(args, kwargs, defaults, default_pos)
-        result, index = func(self._obj.array.data, *args, **kwargs)
+        result, index = apply_chunked(func, self._obj.array.data, *args, keyed=True, **kwargs)
         if geos:
-            result = GeosArray(result)
+            result = GeosArray._simple_new(result)
 
         return pd.Series(result, index=self._obj.index[index], name=func.__name__)
 
@@ -226,9 +245,9 @@ def unary_dataframe_indexed(name, columns, geos=False, **defaults):
             pandas.Series: Series with the results of the function.
         """
         args, kwargs = setup_args(args, kwargs, defaults, default_pos)
-        result = func(self._obj.array.data, *args, **kwargs)
+        result = apply_chunked(func, self._obj.array.data, *args, **kwargs)
         if any(geos):
-            result = [GeosArray(result[:, i]) if g else result[:, i] for g, i in zip(geos, range(result.shape[1]))]
+            result = [GeosArray._simple_new(result[:, i]) if g else result[:, i] for g, i in zip(geos, range(result.shape[1]))]
 
         return pd.DataFrame(result, index=self._obj.index, columns=columns)
 
@@ -265,9 +284,9 @@ def unary_dataframe_keyed(name, columns, geos=False, **defaults):
             pandas.Series: Series with the results of the function.
         """
         args, kwargs = setup_args(args, kwargs, defaults, default_pos)
-        result, index = func(self._obj.array.data, *args, **kwargs)
+        result, index = apply_chunked(func, self._obj.array.data, *args, keyed=True, **kwargs)
         if any(geos):
-            result = [GeosArray(result[:, i]) if g else result[:, i] for g, i in zip(geos, range(result.shape[1]))]
+            result = [GeosArray._simple_new(result[:, i]) if g else result[:, i] for g, i in zip(geos, range(result.shape[1]))]
 
         return pd.DataFrame(result, index=self._obj.index[index], columns=columns)
 
@@ -275,13 +294,16 @@ def unary_dataframe_keyed(name, columns, geos=False, **defaults):
     return delegated
 
 
-def binary(name, geos=False, **defaults):  # noqa: C901
+def binary(name, geos=False, sparse=False, **defaults):  # noqa: C901
     """
     Create a binary method that runs a shapely function on the original data and some other.
 
     Args:
         name (str): Name of the method within the ``shapely`` module.
         geos (bool, optional): Whether the returned data is shapely dtype; Default **False**.
+        sparse (bool, optional):
+            Whether the function is a predicate that can only be true for geometries with intersecting bounding boxes,
+            which enables the "pairs" manner; Default **False**.
     """
     try:
         func, func_summary = get_func_info(name)
@@ -297,12 +319,15 @@ def binary(name, geos=False, **defaults):  # noqa: C901
 
         Args:
             other (pandas.Series or numpy.ndarray or shapely.Geometry, optional): Second argument to :py:obj:`~shapely.{func}`; Default **self**.
-            manner ('keep' or 'align' or 'expand', optional): How to apply the :py:obj:`~shapely.{func}` to the data; Default **None** .
+            manner ('keep' or 'align' or 'expand' or 'blocks' or 'pairs', optional):
+                How to apply the :py:obj:`~shapely.{func}` to the data; Default **None** .
             kwargs: Keyword arguments passed to :py:obj:`~shapely.{func}`.
 
         Returns:
             pandas.Series: Series with the result of the function applied to self and other, with the same index as self.
             numpy.ndarray: 2-Dimensional array with the results of the function applied to each combination of geometries between self and other.
+            generator: Generator that yields ``(rows, block)`` tuples, where ``block`` contains the expanded results of the ``rows`` slice of self.
+            pandas.DataFrame: "self" and "other" labels of each combination of geometries for which the predicate is true.
 
         Raises:
             ValueError: ``other`` argument is not a geos Series or shapely NumPy Array
@@ -320,30 +345,53 @@ def binary(name, geos=False, **defaults):  # noqa: C901
                 Expand the data with a new index, before running the function.
                 This means that the result will be an array of dimensions ``<len(a), len(b)>``
                 containing the result of all possible combinations of geometries.
+                If you pass a preallocated (or memory-mapped) ``out`` array, the result gets computed in blocks of rows and written into it.
+            - **blocks**:
+                Same as "expand", but returns a generator that computes the result in blocks of rows.
+                The number of rows per block is chosen so that a block fits in :attr:`pgpd.options.block_memory <pgpd._options.Options>`.
+            - **pairs**:
+                Sparse version of "expand", which is only available for predicates.
+                This returns a DataFrame with the "self" and "other" labels of each combination of geometries for which the predicate is true.
+                The combinations are found with a spatial index, so the cost scales with the number of hits instead of ``len(a) * len(b)``.
 
             Of course, not every method is applicable for each type of ``other`` input.
             Here are the allowed manners for each type of input, as well as the default value:
 
-            - *Series*: keep, align, expand (default: align)
-            - *1D ndarray*: keep, expand (default: keep)
+            - *Series*: keep, align, expand, blocks, pairs (default: align)
+            - *1D ndarray*: keep, expand, blocks, pairs (default: keep)
             - *nD ndarray*: keep (default: keep)
             - *Geometry*: keep (default: keep)
-            - *None* (aka. use self): expand (default: expand)
+            - *None* (aka. use self): expand, blocks, pairs (default: expand)
         """
         if manner is not None:
             manner = manner[0].lower()
 
+        blocks = manner == 'b'
+        if blocks:
+            manner = 'e'
+
+        if manner == 'p':
+            if not sparse:
+                raise ValueError(f'The "pairs" manner is only available for predicates, not "{func.__name__}"')
+            return binary_pairs(func, self._obj, other, {**kwargs, **defaults})
+
+        # Bounding boxes for the prefilter of predicates, which are taken from the cache of the GeosArrays where possible
+        bounds = None
         if other is None:
             if manner is not None and manner != 'e':
                 warnings.warn('When no other is given, we always "expand" to an array', stacklevel=1)
             data = self._obj.array.data[:, np.newaxis]
             other = self._obj.array.data[np.newaxis, :]
+            if sparse:
+                bounds = self._obj.array.bounds[:, np.newaxis], self._obj.array.bounds[np.newaxis, :]
         elif isinstance(other, pd.Series):
             if not (pd.api.types.pandas_dtype('geos') == other.dtype):
                 raise ValueError('"other" should be of dtype "geos".')
 
             if manner == 'e':
                 data = self._obj.array.data[:, np.newaxis]
+                if sparse:
+                    bounds = self._obj.array.bounds[:, np.newaxis], other.array.bounds[np.newaxis, :]
                 other = other.array.data[np.newaxis, :]
             else:
                 this = self._obj
@@ -353,6 +401,8 @@ def binary(name, geos=False, **defaults):  # noqa: C901
                     this, other = this.align(other)
 
                 data = this.array.data
+                if sparse:
+                    bounds = this.array.bounds, other.array.bounds
                 other = other.array.data
         elif isinstance(other, np.ndarray):
             if other.ndim == 1:
@@ -377,14 +427,30 @@ def binary(name, geos=False, **defaults):  # noqa: C901
             raise ValueError('"other" should be a geos Series or shapely NumPy array')
 
         kwargs = {**kwargs, **defaults}
-        result = func(data, other, **kwargs)
+        expanded = data.ndim == 2 and np.ndim(other) == 2
+        if sparse and bounds is None:
+            data_bounds = self._obj.array.bounds[:, np.newaxis] if data.ndim == 2 else self._obj.array.bounds
+            bounds = data_bounds, shapely.bounds(other)
+        if blocks:
+            if not expanded:
+                raise ValueError('The "blocks" manner requires "other" to be a geos Series or 1D shapely NumPy array')
+            return binary_blocks(func, data, other, kwargs, bounds)
+        if expanded and kwargs.get('out') is not None:
+            out = kwargs.pop('out')
+            if out.shape != (data.shape[0], other.shape[1]):
+                raise ValueError(f'"out" should have a shape of {(data.shape[0], other.shape[1])}')
+            for rows, block in binary_blocks(func, data, other, kwargs, bounds):
+                out[rows] = block
+            return out
+
+        result = binary_prefiltered(func, data, other, kwargs, bounds)
         if not isinstance(result, np.ndarray):
             result = result if isinstance(result, Iterable) else [result]
             result = np.array(result)
 
         if result.ndim == 1 and result.shape[0] == self._obj.shape[0]:
             if geos:
-                result = GeosArray(result)
+                result = GeosArray._simple_new(result)
             return pd.Series(result, index=self._obj.index, name=func.__name__)
 
         return result
@@ -393,6 +459,107 @@ def binary(name, geos=False, **defaults):  # noqa: C901
     return delegated
 
 
+def binary_blocks(func, data, other, kwargs, bounds=None):
+    """
+    Compute an expanded binary function in blocks of rows.
+
+    Args:
+        func (callable): Shapely function.
+        data (numpy.ndarray): ``<Nx1>`` array of geometries.
+        other (numpy.ndarray): ``<1xM>`` array of geometries.
+        kwargs (dict): Keyword arguments passed to the function.
+        bounds (tuple, optional): ``<Nx1x4>`` and ``<1xMx4>`` bounds of the geometries, to prefilter a predicate (see :func:`binary_prefiltered`).
+
+    Yields:
+        tuple: ``(rows, block)`` where ``rows`` is a slice of the first axis and ``block`` the ``<len(rows)xM>`` result.
+    """
+    # We assume 8 bytes per result (float64, object), which is an upper bound for the results of shapely functions
+    num_rows = max(1, int(options.block_memory // (8 * max(other.shape[1], 1))))
+    for start in range(0, data.shape[0], num_rows):
+        rows = slice(start, min(start + num_rows, data.shape[0]))
+        block_bounds = None if bounds is None else (bounds[0][rows], bounds[1])
+        yield rows, binary_prefiltered(func, data[rows], other, kwargs, block_bounds)
+
+
+def binary_prefiltered(func, data, other, kwargs, bounds=None):
+    """
+    Compute a binary function, where predicates are only evaluated for geometries with intersecting bounding boxes.
+
+    Predicates that can only be true for geometries with intersecting bounding boxes (the "sparse" predicates),
+    are false for all other combinations, which can be rejected with a cheap vectorized comparison of the bounds.
+    Missing and empty geometries have NaN bounds and are always passed to the predicate, so that the results remain exact.
+
+    Args:
+        func (callable): Shapely function.
+        data (numpy.ndarray): Geometries.
+        other (numpy.ndarray or shapely.lib.Geometry): Geometries, which are broadcast against ``data``.
+        kwargs (dict): Keyword arguments passed to the function.
+        bounds (tuple, optional): Bounds of ``data`` and ``other`` (with an extra last dimension of 4), or None to disable the prefilter.
+
+    Returns:
+        numpy.ndarray: Result of the function.
+    """
+    if bounds is None or len(kwargs) > 0:
+        return apply_chunked(func, data, other, **kwargs)
+
+    data_bounds, other_bounds = bounds
+    mask = (
+        (data_bounds[..., 0] <= other_bounds[..., 2])
+        & (data_bounds[..., 2] >= other_bounds[..., 0])
+        & (data_bounds[..., 1] <= other_bounds[..., 3])
+        & (data_bounds[..., 3] >= other_bounds[..., 1])
+    )
+    mask |= np.isnan(data_bounds[..., 0])
+    mask |= np.isnan(other_bounds[..., 0])
+    if mask.all():
+        return apply_chunked(func, data, other, **kwargs)
+
+    result = np.zeros(mask.shape, dtype=bool)
+    idx = np.nonzero(mask)
+    if len(idx[0]):
+        data = np.broadcast_to(data, mask.shape)[idx]
+        other = np.broadcast_to(other, mask.shape)[idx]
+        result[idx] = apply_chunked(func, data, other)
+    return result
+
+
+def binary_pairs(func, series, other, kwargs):
+    """
+    Compute the (self, other) label pairs for which a predicate is true.
+
+    The candidate pairs are found with a spatial index on ``other``, which only returns pairs with intersecting bounding boxes.
+    Predicates that are natively supported by the index are evaluated by the index itself, others are refined afterwards.
+    """
+    if other is None:
+        other_index = series.index
+        sindex = series.array.sindex
+    elif isinstance(other, pd.Series):
+        if not (pd.api.types.pandas_dtype('geos') == other.dtype):
+            raise ValueError('"other" should be of dtype "geos".')
+        other_index = other.index
+        sindex = other.array.sindex
+    elif isinstance(other, np.ndarray) and other.ndim == 1:
+        other_index = pd.RangeIndex(other.shape[0])
+        sindex = GeosSpatialIndex(other)
+    else:
+        raise ValueError('The "pairs" manner requires "other" to be a geos Series or 1D shapely NumPy array')
+
+    data = series.array.data
+    if len(kwargs) == 0 and func.__name__ in sindex.valid_query_predicates:
+        idx, other_idx = sindex.query(data, predicate=func.__name__)
+    else:
+        idx, other_idx = sindex.query(data)
+        mask = apply_chunked(func, data[idx], sindex.geometries[other_idx], **kwargs)
+        idx, other_idx = idx[mask], other_idx[mask]
+
+    return pd.DataFrame(
+        {
+            'self': np.asarray(series.index.take(idx)),
+            'other': np.asarray(other_index.take(other_idx)),
+        }
+    )
+
+
 def enable_dataframe_expand(expansion=1):
     def decorator(func):
         func.__DataFrameExpand__ = expansion
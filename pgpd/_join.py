@@ -0,0 +1,242 @@
+#
+# Spatial Joins
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+__all__ = ['sjoin', 'sjoin_nearest']
+
+
+def sjoin(left, right, predicate='intersects', how='inner', left_on=None, right_on=None, lsuffix='left', rsuffix='right', distance=None):
+    """
+    Spatially join two DataFrames.
+    See :meth:`pgpd.GeosDataFrameAccessor.sjoin` for more information.
+    """
+    if how not in ('inner', 'left', 'right'):
+        raise ValueError(f'"how" should be one of "inner", "left" or "right", not "{how}"')
+
+    right = get_geos_frame(right)
+    left_geos = get_geos_column(left, left_on)
+    right_geos = get_geos_column(right, right_on)
+
+    sindex = right_geos.array.sindex
+    if predicate not in sindex.valid_query_predicates:
+        raise ValueError(f'Predicate "{predicate}" is not supported, use one of {sorted(sindex.valid_query_predicates - {None})}')
+
+    lidx, ridx = sindex.query(left_geos.array.data, predicate=predicate, distance=distance)
+    return join_frames(left, right, lidx, ridx, how, lsuffix, rsuffix)
+
+
+def sjoin_nearest(
+    left,
+    right,
+    k=1,
+    max_distance=None,
+    how='inner',
+    left_on=None,
+    right_on=None,
+    lsuffix='left',
+    rsuffix='right',
+    distance_col='distance',
+    exclusive=False,
+    all_matches=True,
+):
+    """
+    Spatially join two DataFrames, by matching each geometry with its nearest neighbour(s).
+    See :meth:`pgpd.GeosDataFrameAccessor.sjoin_nearest` for more information.
+    """
+    if how not in ('inner', 'left', 'right'):
+        raise ValueError(f'"how" should be one of "inner", "left" or "right", not "{how}"')
+    if k < 1:
+        raise ValueError('"k" should be at least 1')
+
+    right = get_geos_frame(right)
+    left_data = get_geos_column(left, left_on).array.data
+    sindex = get_geos_column(right, right_on).array.sindex
+
+    if k == 1:
+        (lidx, ridx), distance = sindex.query_nearest(
+            left_data,
+            max_distance=max_distance,
+            return_distance=True,
+            exclusive=exclusive,
+            all_matches=all_matches,
+        )
+    else:
+        lidx, ridx, distance = nearest_k(sindex, left_data, k, max_distance, exclusive, all_matches)
+
+    extra = {} if distance_col is None else {distance_col: distance}
+    return join_frames(left, right, lidx, ridx, how, lsuffix, rsuffix, **extra)
+
+
+def nearest_k(sindex, data, k, max_distance, exclusive, all_matches):
+    """
+    Find the k nearest tree geometries for each input geometry.
+
+    If a ``max_distance`` is given, we only consider the candidates within that radius, which bounds the memory usage.
+    Otherwise, we search with a per-row radius that starts at the distance to the nearest neighbour and doubles
+    until each row has at least k candidates (or the tree is exhausted).
+    """
+    if shapely.geos_version < (3, 10, 0):
+        raise RuntimeError('Nearest joins with k > 1 require GEOS >= 3.10')
+
+    if max_distance is not None:
+        lidx, ridx, distance = dwithin_pairs(sindex, data, np.arange(len(data)), max_distance, exclusive)
+        return select_nearest(lidx, ridx, distance, k, all_matches)
+
+    (rows, _), radius = sindex.query_nearest(data, return_distance=True, exclusive=exclusive, all_matches=False)
+    xmin, ymin, xmax, ymax = shapely.total_bounds(sindex.geometries)
+    step = max(np.hypot(xmax - xmin, ymax - ymin) / np.sqrt(max(len(sindex), 1)), np.finfo(float).eps)
+
+    # Once the radius covers the union of the row and tree bounds, all tree geometries are candidates
+    bounds = shapely.bounds(data[rows])
+    limit = np.hypot(
+        np.maximum(bounds[:, 2], xmax) - np.minimum(bounds[:, 0], xmin),
+        np.maximum(bounds[:, 3], ymax) - np.minimum(bounds[:, 1], ymin),
+    )
+
+    result = []
+    while len(rows):
+        lidx, ridx, distance = dwithin_pairs(sindex, data, rows, radius, exclusive)
+        counts = np.bincount(lidx, minlength=len(data))[rows]
+        done = (counts >= k) | (radius >= limit)
+
+        mask = np.isin(lidx, rows[done])
+        result.append((lidx[mask], ridx[mask], distance[mask]))
+
+        rows, radius, limit = rows[~done], radius[~done], limit[~done]
+        radius = np.where(radius > 0, radius * 2, step)
+
+    if len(result) == 0:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp), np.array([], dtype=float)
+
+    lidx, ridx, distance = (np.concatenate(r) for r in zip(*result))
+    return select_nearest(lidx, ridx, distance, k, all_matches)
+
+
+def dwithin_pairs(sindex, data, rows, distance, exclusive):
+    """Return the (input, tree) pairs and their distance, for all tree geometries within a distance of the given input rows."""
+    lidx, ridx = sindex.query(data[rows], predicate='dwithin', distance=distance)
+    lidx = rows[lidx]
+    left = data[lidx]
+    right = sindex.geometries[ridx]
+
+    if exclusive:
+        mask = ~shapely.equals(left, right)
+        lidx, ridx, left, right = lidx[mask], ridx[mask], left[mask], right[mask]
+
+    return lidx, ridx, shapely.distance(left, right)
+
+
+def select_nearest(lidx, ridx, distance, k, all_matches):
+    """Keep the k nearest pairs for each input geometry, optionally including ties."""
+    if len(lidx) == 0:
+        return lidx, ridx, distance
+
+    order = np.lexsort((ridx, distance, lidx))
+    lidx, ridx, distance = lidx[order], ridx[order], distance[order]
+
+    starts = np.flatnonzero(np.r_[True, lidx[1:] != lidx[:-1]])
+    counts = np.diff(np.r_[starts, len(lidx)])
+    if all_matches:
+        kth = distance[starts + np.minimum(counts, k) - 1]
+        keep = distance <= np.repeat(kth, counts)
+    else:
+        keep = (np.arange(len(lidx)) - np.repeat(starts, counts)) < k
+
+    return lidx[keep], ridx[keep], distance[keep]
+
+
+def get_geos_frame(obj):
+    """Return the object as a DataFrame, converting geos Series into a single column DataFrame."""
+    if isinstance(obj, pd.Series):
+        obj = obj.geos.to_geos()
+        return obj.to_frame(obj.name if obj.name is not None else 'geometry')
+    if isinstance(obj, pd.DataFrame):
+        # The accessor converts GeoDataFrames, but returns regular DataFrames as is
+        return obj.geos._obj
+
+    raise TypeError('"other" should be a DataFrame or a geos Series')
+
+
+def get_geos_column(df, column=None):
+    """Return the geos column of a DataFrame, inferring it if there is only one."""
+    geos_columns = df.dtypes[df.dtypes == 'geos'].index
+    if column is None:
+        if len(geos_columns) != 1:
+            raise ValueError('There are multiple columns of "geos", please specify which one to use')
+        column = geos_columns[0]
+    elif column not in geos_columns:
+        raise TypeError(f'Column "{column}" should be of "geos" type')
+
+    return df[column]
+
+
+def join_frames(left, right, lidx, ridx, how, lsuffix, rsuffix, **extra):
+    """
+    Combine the rows of two DataFrames, given matching positional indices.
+
+    Args:
+        left (pandas.DataFrame): Left DataFrame.
+        right (pandas.DataFrame): Right DataFrame.
+        lidx (numpy.ndarray): Positional indices in the left DataFrame.
+        ridx (numpy.ndarray): Positional indices in the right DataFrame.
+        how ('inner' or 'left' or 'right'): Type of join.
+        lsuffix (str): Suffix for overlapping columns from the left DataFrame.
+        rsuffix (str): Suffix for overlapping columns from the right DataFrame.
+        extra (numpy.ndarray): Extra columns with a value for each (lidx, ridx) pair, which are appended to the result.
+
+    Returns:
+        pandas.DataFrame: Joined DataFrame, which uses the index of the left (inner, left) or right (right) DataFrame.
+    """
+    if how == 'left':
+        lidx, ridx, extra = add_unmatched(lidx, ridx, len(left), extra)
+    elif how == 'right':
+        ridx, lidx, extra = add_unmatched(ridx, lidx, len(right), extra)
+
+    if how == 'right':
+        index = right.index.take(ridx)
+        index_col = f'index_{lsuffix}'
+        index_values = take_rows(pd.Series(left.index), lidx)
+    else:
+        index = left.index.take(lidx)
+        index_col = f'index_{rsuffix}'
+        index_values = take_rows(pd.Series(right.index), ridx)
+
+    overlap = left.columns.intersection(right.columns)
+    left_part = take_rows(left, lidx).rename(columns={c: f'{c}_{lsuffix}' for c in overlap})
+    right_part = take_rows(right, ridx).rename(columns={c: f'{c}_{rsuffix}' for c in overlap})
+    left_part.index = index
+    right_part.index = index
+
+    left_part[index_col] = index_values.to_numpy()
+    result = pd.concat([left_part, right_part], axis=1)
+    for name, values in extra.items():
+        result[name] = values
+
+    return result
+
+
+def add_unmatched(idx, other_idx, length, extra):
+    """Add the positions that have no match, with a -1 placeholder for the other side and sort by ``idx``."""
+    unmatched = np.ones(length, dtype=bool)
+    unmatched[idx] = False
+    unmatched = np.flatnonzero(unmatched)
+    if len(unmatched) == 0 and np.all(idx[:-1] <= idx[1:]):
+        return idx, other_idx, extra
+
+    idx = np.concatenate([idx, unmatched])
+    other_idx = np.concatenate([other_idx, np.full(len(unmatched), -1, dtype=other_idx.dtype)])
+    extra = {name: np.concatenate([values, np.full(len(unmatched), np.nan)]) for name, values in extra.items()}
+
+    order = np.argsort(idx, kind='stable')
+    return idx[order], other_idx[order], {name: values[order] for name, values in extra.items()}
+
+
+def take_rows(obj, indices):
+    """Take rows by position, where -1 indicates a missing value."""
+    obj = obj.reset_index(drop=True)
+    if len(indices) and indices.min() < 0:
+        return obj.reindex(indices)
+    return obj.take(indices)
@@ -0,0 +1,106 @@
+#
+# Lazy chains of elementwise shapely functions
+#
+import numpy as np
+import pandas as pd
+
+from ._array import GeosArray
+from ._categorical import GeosCategoricalArray
+from ._delegated_series import setup_args
+from ._options import options
+from ._parallel import apply_stream, split_arg
+
+__all__ = ['LazyChain']
+
+
+class LazyChain:
+    """
+    Deferred chain of elementwise shapely functions, which is created with :meth:`pgpd.GeosSeriesAccessor.lazy`.
+
+    The chain accepts the methods of the :class:`~pgpd.GeosSeriesAccessor` that compute a single value for each geometry
+    (eg. :meth:`~pgpd.GeosSeriesAccessor.buffer` or :meth:`~pgpd.GeosSeriesAccessor.area`), with the same arguments.
+    Calling these methods only records them, until :meth:`~pgpd._lazy.LazyChain.collect` runs all the steps
+    on chunks of :attr:`pgpd.options.chunksize <pgpd._options.Options>` rows at a time.
+    The intermediate geometries of a chunk are freed as soon as the chunk is finished,
+    so that only the final result needs memory for all the rows, instead of an intermediate Series for every step.
+    The chunks are computed on a thread pool (see :attr:`pgpd.options.n_jobs <pgpd._options.Options>`).
+
+    Args:
+        obj (pandas.Series): Series with geos data to compute the chain on.
+
+    Example:
+        >>> s = pd.Series(shapely.box(range(3), 0, range(1, 4), 1), dtype='geos')
+        >>> s.geos.lazy().make_valid().buffer(1).simplify(0.5).area().collect()
+        0    6.199217
+        1    6.199217
+        2    6.199217
+        Name: area, dtype: float64
+    """
+
+    def __init__(self, obj):
+        self._obj = obj
+        self._steps = []
+
+    def __repr__(self):
+        steps = ' -> '.join(step[0].__name__ for step in self._steps) or 'none'
+        return f'<{self.__class__.__name__}: {steps}>'
+
+    def __getattr__(self, name):
+        from ._accessor_series import GeosSeriesAccessor
+
+        step = getattr(getattr(GeosSeriesAccessor, name, None), '__LazyStep__', None)
+        if name.startswith('_') or step is None:
+            raise AttributeError(f'"{name}" cannot be computed lazily, as it does not compute a single value for each geometry')
+
+        func, geos, defaults, positions = step
+
+        def record(*args, **kwargs):
+            if len(self._steps) and not self._steps[-1][1]:
+                raise TypeError(f'Cannot add "{name}" after "{self._steps[-1][0].__name__}", which does not return geometries')
+
+            args, kwargs = setup_args(list(args), kwargs, defaults, positions)
+            self._steps.append((func, geos, args, kwargs))
+            return self
+
+        record.__name__ = name
+        record.__doc__ = getattr(GeosSeriesAccessor, name).__doc__
+        return record
+
+    def collect(self):
+        """
+        Compute all the steps of the chain.
+
+        Returns:
+            pandas.Series: Result of the last step, which is named after its shapely function.
+        """
+        if len(self._steps) == 0:
+            return self._obj.copy()
+
+        func, geos = self._steps[-1][:2]
+        array = self._obj.array
+        if isinstance(array, GeosCategoricalArray) and all(
+            np.ndim(arg) == 0 for _, _, args, kwargs in self._steps for arg in (*args, *kwargs.values())
+        ):
+            # Scalar arguments give the same result for each occurrence of a geometry, so we only compute the categories
+            result = array.map_categories(self._compute, geos=geos)
+        else:
+            result = self._compute(array.data)
+            if geos:
+                result = GeosArray._simple_new(result)
+
+        return pd.Series(result, index=self._obj.index, name=func.__name__)
+
+    def _compute(self, data):
+        length = data.shape[0]
+        chunksize = max(1, int(options.chunksize))
+        chunks = [slice(start, min(start + chunksize, length)) for start in range(0, length, chunksize)] or [slice(0, 0)]
+
+        def run(rows):
+            result = data[rows]
+            for func, _, args, kwargs in self._steps:
+                chunk_args = [split_arg(arg, rows, length) for arg in args]
+                chunk_kwargs = {key: split_arg(arg, rows, length) for key, arg in kwargs.items()}
+                result = func(result, *chunk_args, **chunk_kwargs)
+            return result
+
+        return np.concatenate(list(apply_stream(run, chunks)))
@@ -0,0 +1,116 @@
+#
+# Memory estimates of GEOS geometries
+#
+import sys
+
+import numpy as np
+import pandas as pd
+import shapely
+
+__all__ = ['estimate_memory', 'geometry_memory', 'memory_report']
+
+# Rough sizes of the objects that make up a geometry (including allocator overhead), which were calibrated on a 64-bit build
+PYOBJECT_BYTES = sys.getsizeof(shapely.Point()) + 16
+GEOMETRY_BYTES = 64
+SEQUENCE_BYTES = 64
+POINTER_BYTES = 8
+
+
+def geometry_memory(data):
+    """
+    Estimate the memory that is used by each geometry, which includes the shapely object and the GEOS geometry.
+
+    The estimate is based on the number of coordinates, coordinate sequences and (nested) parts of each geometry.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries.
+
+    Returns:
+        numpy.ndarray: int64 number of bytes for each geometry, where missing values use 0 bytes.
+    """
+    type_id = shapely.get_type_id(data)
+    valid = type_id >= 0
+
+    size = np.zeros(data.shape[0], dtype=np.int64)
+    size[valid] = PYOBJECT_BYTES + geos_memory(data[valid], type_id[valid])
+    return size
+
+
+def geos_memory(data, type_id):
+    """Estimate the memory of the GEOS geometries, without their shapely objects."""
+    parts = shapely.get_num_geometries(data)
+    rings = shapely.get_num_interior_rings(data) + 1
+    coordinates = shapely.get_num_coordinates(data)
+
+    # GEOS 3.12 stores coordinates with their actual dimensions, older versions always use XYZ coordinates
+    coordinate_bytes = np.where(shapely.has_z(data), 24, 16) if shapely.geos_version >= (3, 12, 0) else 24
+    coordinates = coordinates * coordinate_bytes
+
+    # Points store their coordinate inline, all other simple geometries use a coordinate sequence per line or ring
+    size = GEOMETRY_BYTES + np.select(
+        [type_id == 0, type_id <= 2, type_id == 3, type_id == 4, type_id == 5],
+        [
+            coordinates,
+            SEQUENCE_BYTES + coordinates,
+            rings * (POINTER_BYTES + GEOMETRY_BYTES + SEQUENCE_BYTES) + coordinates,
+            parts * (POINTER_BYTES + GEOMETRY_BYTES) + coordinates,
+            parts * (POINTER_BYTES + GEOMETRY_BYTES + SEQUENCE_BYTES) + coordinates,
+        ],
+        parts * POINTER_BYTES,
+    )
+
+    # MultiPolygons and GeometryCollections are estimated from their parts
+    nested = np.flatnonzero(type_id >= 6)
+    if nested.shape[0] > 0:
+        part_data, index = shapely.get_parts(data[nested], return_index=True)
+        part_size = geos_memory(part_data, shapely.get_type_id(part_data))
+        size[nested] += np.bincount(index, part_size, minlength=nested.shape[0]).astype(np.int64)
+
+    return size
+
+
+def estimate_memory(data, sample=None):
+    """
+    Estimate the total memory that is used by the geometries (see :func:`geometry_memory`).
+
+    Args:
+        data (numpy.ndarray): Shapely geometries.
+        sample (int, optional): Number of evenly spaced geometries to extrapolate the estimate from, or None to use all geometries; Default **None**.
+
+    Returns:
+        int: Estimated number of bytes.
+    """
+    if sample is None or data.shape[0] <= sample:
+        return int(geometry_memory(data).sum())
+
+    index = np.linspace(0, data.shape[0] - 1, max(1, int(sample))).astype(np.intp)
+    return int(geometry_memory(data[index]).mean() * data.shape[0])
+
+
+def memory_report(data):
+    """
+    Break down the estimated memory of the geometries by geometry type.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries.
+
+    Returns:
+        pandas.DataFrame: Number of geometries, coordinates and estimated bytes for each geometry type that is present in the data.
+    """
+    type_id = shapely.get_type_id(data)
+    valid = type_id >= 0
+    type_id = type_id[valid]
+    size = geometry_memory(data)[valid]
+    coordinates = shapely.get_num_coordinates(data[valid])
+
+    types = list(shapely.GeometryType)[1:]
+    length = len(types)
+    report = pd.DataFrame(
+        {
+            'count': np.bincount(type_id, minlength=length),
+            'coordinates': np.bincount(type_id, coordinates, minlength=length).astype(np.int64),
+            'bytes': np.bincount(type_id, size, minlength=length).astype(np.int64),
+        },
+        index=pd.Index([t.name for t in types], name='geometry_type'),
+    )
+    return report[report['count'] > 0]
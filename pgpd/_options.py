@@ -0,0 +1,97 @@
+#
+# Global Options
+#
+from contextlib import contextmanager
+
+__all__ = ['options']
+
+
+class Options:
+    """
+    Global options of the pgpd library.
+
+    You can set options globally by modifying the attributes,
+    or temporarily by calling this object as a context manager.
+
+    Attributes:
+        block_memory (int): Memory budget in bytes for a single block of results, when computing expanded results in blocks; Default **256MiB**.
+        n_jobs (int): Number of threads to run shapely functions with (negative numbers count back from the number of CPUs); Default **1**.
+        backend (str): Whether to run shapely functions on a pool of "threads" or "processes",
+            where the geometries are shared with the processes through shared memory; Default **threads**.
+        chunksize (int): Minimal number of rows per chunk, when running shapely functions on multiple threads; Default **65536**.
+        factorize_grid_size (float): Grid size to snap geometries to before comparing them in eg. :meth:`pandas.Series.drop_duplicates`,
+            or None to compare them with their full precision; Default **None**.
+        factorize_normalize (bool): Whether to normalize geometries before comparing them in eg. :meth:`pandas.Series.drop_duplicates`,
+            which makes the comparison independent of the order of the coordinates; Default **False**.
+        memory_sample (int): Number of geometries to extrapolate the memory estimate of geos columns from (eg. :meth:`pandas.DataFrame.memory_usage`),
+            or None to estimate the memory of all geometries; Default **None**.
+        sort_curve (str): Space-filling curve ("hilbert" or "morton") that is used to sort geos columns (eg. :meth:`pandas.Series.sort_values`),
+            or None to sort geometries by their WKB encoding, which is deterministic but has no spatial meaning; Default **None**.
+
+    Example:
+        >>> import pgpd
+        >>> pgpd.options.block_memory = 2**30
+        >>> with pgpd.options(block_memory=2**20):
+        ...     pgpd.options.block_memory
+        1048576
+        >>> pgpd.options.block_memory
+        1073741824
+        >>> with pgpd.options(n_jobs=-1):
+        ...     s.geos.buffer(1)  # Runs on all CPU cores
+    """
+
+    _defaults = {
+        'block_memory': 2**28,
+        'n_jobs': 1,
+        'backend': 'threads',
+        'chunksize': 2**16,
+        'memory_sample': None,
+        'sort_curve': None,
+        'factorize_grid_size': None,
+        'factorize_normalize': False,
+    }
+
+    def __init__(self):
+        object.__setattr__(self, '_values', dict(self._defaults))
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f'Unknown option "{name}"') from None
+
+    def __setattr__(self, name, value):
+        if name not in self._values:
+            raise AttributeError(f'Unknown option "{name}"')
+        self._values[name] = value
+
+    def __reduce__(self):
+        # Pickle a reference to the global options, so that objects which hold them can be sent to other processes
+        return 'options'
+
+    def __dir__(self):
+        return list(self._values)
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for k, v in self._values.items())
+        return f'{self.__class__.__name__}({values})'
+
+    @contextmanager
+    def __call__(self, **kwargs):
+        """Temporarily set options within a context."""
+        previous = {}
+        try:
+            for name, value in kwargs.items():
+                previous[name] = getattr(self, name)
+                setattr(self, name, value)
+            yield self
+        finally:
+            for name, value in previous.items():
+                setattr(self, name, value)
+
+    def reset(self):
+        """Reset all options to their default values."""
+        self._values.update(self._defaults)
+
+
+options = Options()
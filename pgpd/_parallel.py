@@ -0,0 +1,228 @@
+#
+# Parallel execution of shapely functions
+#
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from ._options import options
+from ._shared import read_shared_memory, write_shared_memory
+from ._wkb import WKBStorage, encode_wkb
+
+__all__ = ['apply_chunked', 'apply_stream', 'get_chunks', 'get_executor', 'get_n_jobs']
+
+_local = threading.local()
+_lock = threading.Lock()
+_executors = {}
+
+
+def get_n_jobs():
+    """Return the number of threads to use, according to :attr:`pgpd.options.n_jobs <pgpd._options.Options>`."""
+    n_jobs = options.n_jobs
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(1, int(n_jobs))
+
+
+def get_executor(n_jobs, processes=False):
+    """
+    Return a cached thread or process pool with ``n_jobs`` workers.
+
+    Pools are never shut down when ``n_jobs`` changes, as other threads might still submit work to them.
+    Their idle workers are cleaned up when the interpreter exits.
+    """
+    with _lock:
+        executor = _executors.get((processes, n_jobs))
+        if executor is None:
+            executor = ProcessPoolExecutor(n_jobs) if processes else ThreadPoolExecutor(n_jobs, thread_name_prefix='pgpd')
+            _executors[(processes, n_jobs)] = executor
+        return executor
+
+
+def get_chunks(length):
+    """
+    Split a length into row slices for parallel execution.
+
+    Returns:
+        list<slice> or None: Row slices or None if the data should not be split.
+    """
+    n_jobs = get_n_jobs()
+    chunksize = max(1, int(options.chunksize))
+    if n_jobs <= 1 or length < 2 * chunksize or getattr(_local, 'active', False):
+        return None
+
+    # Create a few chunks per thread, which balances the load for geometries of varying complexity
+    size = max(chunksize, -(-length // (4 * n_jobs)))
+    return [slice(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def apply_chunked(func, data, *args, keyed=False, **kwargs):
+    """
+    Apply a shapely function to the data in chunks of rows on a thread pool.
+
+    Shapely releases the GIL while running GEOS operations, so this scales with the number of threads.
+    Array arguments with the same length as the data are split alongside the data, all other arguments are passed as is.
+    If the data is small or :attr:`pgpd.options.n_jobs <pgpd._options.Options>` is 1, the function is simply called once.
+
+    With :attr:`pgpd.options.backend <pgpd._options.Options>` set to "processes", the chunks are computed on a process pool instead.
+    The geometries are then written once to a shared memory segment as WKB data,
+    from which each worker only decodes its own chunk, and geometry arguments and results are transferred as WKB buffers.
+    Functions that cannot be pickled (eg. lambdas) or data that are not geometries are still computed on the thread pool.
+
+    Args:
+        func (callable): Shapely function, which should operate elementwise on the first axis of the data.
+        data (numpy.ndarray): Shapely geometries.
+        args: Extra arguments to the function.
+        keyed (bool, optional): Whether the function returns a ``(result, index)`` tuple with indices into the data; Default **False**.
+        kwargs: Keyword arguments to the function.
+
+    Returns:
+        numpy.ndarray or tuple: The result of the function, stitched back together in the original order.
+    """
+    length = data.shape[0] if np.ndim(data) else 0
+    chunks = get_chunks(length)
+    if chunks is None or len(chunks) == 1:
+        return func(data, *args, **kwargs)
+
+    if options.backend == 'processes' and is_picklable(func) and np.ndim(data) == 1 and shapely.is_valid_input(data).all():
+        results = apply_processes(func, data, chunks, args, kwargs)
+        return join_results(results, chunks, keyed)
+
+    def run(rows):
+        _local.active = True
+        try:
+            chunk_args = [split_arg(arg, rows, length) for arg in args]
+            chunk_kwargs = {name: split_arg(arg, rows, length) for name, arg in kwargs.items()}
+            return func(data[rows], *chunk_args, **chunk_kwargs)
+        finally:
+            _local.active = False
+
+    results = list(get_executor(get_n_jobs()).map(run, chunks))
+    return join_results(results, chunks, keyed)
+
+
+def join_results(results, chunks, keyed):
+    """Stitch the results of the chunks back together."""
+    if keyed:
+        values = np.concatenate([r[0] for r in results])
+        index = np.concatenate([r[1] + rows.start for r, rows in zip(results, chunks)])
+        return values, index
+
+    return np.concatenate(results)
+
+
+def apply_processes(func, data, chunks, args, kwargs):
+    """Compute the chunks on a process pool, where the geometries are shared with the workers through shared memory."""
+    length = data.shape[0]
+    shm = write_shared_memory(*encode_wkb(data, include_srid=True))
+    try:
+        executor = get_executor(get_n_jobs(), processes=True)
+        futures = [
+            executor.submit(
+                run_shared,
+                shm.name,
+                rows,
+                func,
+                [pack(split_arg(arg, rows, length)) for arg in args],
+                {name: pack(split_arg(arg, rows, length)) for name, arg in kwargs.items()},
+            )
+            for rows in chunks
+        ]
+        return [unpack(future.result()) for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def run_shared(name, rows, func, args, kwargs):
+    """Decode a chunk of geometries from shared memory and run a function on it (runs in the worker processes)."""
+    data = read_shared_memory(name, rows)
+    result = func(data, *[unpack(arg) for arg in args], **{key: unpack(arg) for key, arg in kwargs.items()})
+    return pack(result)
+
+
+class PackedGeometries(NamedTuple):
+    """Geometries encoded as a WKB buffer with offsets, which are cheaper to pickle than the individual geometries."""
+
+    buffer: np.ndarray
+    offsets: np.ndarray
+
+
+def pack(value):
+    """Encode 1D arrays of geometries (or tuples containing them) as :class:`PackedGeometries`, before sending them to another process."""
+    if isinstance(value, tuple):
+        return tuple(pack(v) for v in value)
+    if isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype == object and shapely.is_valid_input(value).all():
+        return PackedGeometries(*encode_wkb(value, include_srid=True))
+    return value
+
+
+def unpack(value):
+    """Decode :class:`PackedGeometries`, after receiving them from another process."""
+    if isinstance(value, PackedGeometries):
+        return WKBStorage.from_buffer(value.buffer, value.offsets).decode()
+    if isinstance(value, tuple):
+        return tuple(unpack(v) for v in value)
+    return value
+
+
+def is_picklable(func):
+    """Check whether a function can be sent to a process pool."""
+    try:
+        pickle.dumps(func)
+    except Exception:
+        return False
+    return True
+
+
+def apply_stream(func, batches):
+    """
+    Apply a function to each batch of an iterable on a thread pool, yielding the results in order.
+
+    At most ``n_jobs`` batches are processed at the same time and the input is consumed lazily,
+    so that the peak memory usage is bounded by a few batches.
+
+    Args:
+        func (callable): Function to apply to each batch.
+        batches (Iterable): Input batches.
+
+    Yields:
+        any: The result of the function for each batch.
+    """
+    n_jobs = get_n_jobs()
+    if n_jobs <= 1 or getattr(_local, 'active', False):
+        for batch in batches:
+            yield func(batch)
+        return
+
+    def run(batch):
+        _local.active = True
+        try:
+            return func(batch)
+        finally:
+            _local.active = False
+
+    executor = get_executor(n_jobs)
+    pending = deque()
+    for batch in batches:
+        pending.append(executor.submit(run, batch))
+        if len(pending) >= n_jobs:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def split_arg(arg, rows, length):
+    if isinstance(arg, (np.ndarray, pd.Series)) and arg.ndim >= 1 and arg.shape[0] == length:
+        return arg[rows] if isinstance(arg, np.ndarray) else arg.iloc[rows]
+    return arg
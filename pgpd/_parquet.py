@@ -0,0 +1,233 @@
+#
+# GeoParquet IO
+#
+import json
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from ._curves import hilbert_distance
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+__all__ = ['read_parquet']
+
+GEOPARQUET_VERSION = '1.1.0'
+BBOX_FIELDS = ('xmin', 'ymin', 'xmax', 'ymax')
+
+
+def read_parquet(path, columns=None, bbox=None, **kwargs):
+    """
+    Read a GeoParquet file into a DataFrame with geos columns.
+
+    If the file has bounding box covering columns (eg. written with :meth:`pgpd.GeosDataFrameAccessor.to_parquet`),
+    filtering with a ``bbox`` happens before decoding any WKB data.
+    First, we skip entire row groups by looking at the statistics of the covering columns,
+    which is efficient if the rows are spatially sorted.
+    Afterwards, the remaining rows are filtered on the values of the covering columns.
+    For files without covering columns, we decode the geometries and filter them on their bounds.
+    The coordinate reference systems of the columns (``crs`` metadata) are ignored, as geos columns have no CRS.
+
+    Args:
+        path (str or path-like or file-like): Path to the Parquet file.
+        columns (list of str, optional): Columns to read; Default **all columns**.
+        bbox (array-like, optional):
+            Bounding box ``(xmin, ymin, xmax, ymax)``.
+            Only rows whose primary geometry bounds intersect this box are returned; Default **None**.
+        kwargs: Extra keyword arguments that are passed to :class:`pyarrow.parquet.ParquetFile`.
+
+    Returns:
+        pandas.DataFrame: DataFrame where all geometry columns are of geos dtype.
+
+    Raises:
+        ImportError: PyArrow is not installed.
+        ValueError: The file is not a GeoParquet file.
+
+    Example:
+        >>> df = pd.DataFrame({
+        ...     'a': list('abcde'),
+        ...     'pt': shapely.points(range(5), range(5)),
+        ... }).astype({'pt': 'geos'})
+        >>> df.geos.to_parquet('data.parquet')
+        >>> pgpd.read_parquet('data.parquet', bbox=(0.5, 0.5, 2.5, 2.5))
+           a           pt
+        1  b  POINT (1 1)
+        2  c  POINT (2 2)
+    """
+    if pa is None:
+        raise ImportError('PyArrow is required for this function')
+
+    pf = pq.ParquetFile(path, **kwargs)
+    metadata = get_geo_metadata(pf.schema_arrow)
+    if metadata is None:
+        raise ValueError('File does not contain GeoParquet "geo" metadata')
+
+    geo_columns = metadata['columns']
+    primary = metadata['primary_column']
+    covering = geo_columns.get(primary, {}).get('covering', {}).get('bbox')
+    covering_columns = {c['covering']['bbox']['xmin'][0] for c in geo_columns.values() if 'bbox' in c.get('covering', {})}
+
+    read_columns = columns
+    if bbox is not None and columns is not None:
+        # We need the covering column or the primary geometry to filter the rows
+        extra = covering['xmin'][0] if covering is not None else primary
+        read_columns = [*columns, extra] if extra not in columns else columns
+
+    if bbox is not None and covering is not None:
+        table = read_bbox_covering(pf, read_columns, bbox, covering)
+    else:
+        table = pf.read(columns=read_columns, use_pandas_metadata=True)
+
+    df = table.to_pandas()
+    for name, column in geo_columns.items():
+        if name in df.columns and df[name].dtype != 'geos':
+            # Files written by other libraries contain plain binary columns
+            if column.get('encoding', 'WKB') != 'WKB':
+                raise ValueError(f'Column "{name}" has an unsupported encoding: {column["encoding"]}')
+            df[name] = pd.array(shapely.from_wkb(df[name].to_numpy()), dtype='geos')
+
+    if bbox is not None and covering is None:
+        xmin, ymin, xmax, ymax = bbox
+        bounds = shapely.bounds(df[primary].array.data)
+        df = df[(bounds[:, 0] <= xmax) & (bounds[:, 2] >= xmin) & (bounds[:, 1] <= ymax) & (bounds[:, 3] >= ymin)]
+
+    if columns is not None:
+        return df[list(columns)]
+    return df.drop(columns=[c for c in covering_columns if c in df.columns])
+
+
+def read_bbox_covering(pf, columns, bbox, covering):
+    """Read the rows of a Parquet file whose bounding box covering column intersects the given bbox."""
+    xmin, ymin, xmax, ymax = bbox
+    bounds = {name: covering[name] for name in BBOX_FIELDS}
+
+    # Skip row groups using the column statistics
+    paths = {'.'.join(path): name for name, path in bounds.items()}
+    row_groups = []
+    for i in range(pf.num_row_groups):
+        stats = {}
+        row_group = pf.metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.path_in_schema in paths and column.is_stats_set and column.statistics.has_min_max:
+                stats[paths[column.path_in_schema]] = column.statistics
+
+        if (
+            ('xmin' in stats and stats['xmin'].min > xmax)
+            or ('ymin' in stats and stats['ymin'].min > ymax)
+            or ('xmax' in stats and stats['xmax'].max < xmin)
+            or ('ymax' in stats and stats['ymax'].max < ymin)
+        ):
+            continue
+        row_groups.append(i)
+
+    table = pf.read_row_groups(row_groups, columns=columns, use_pandas_metadata=True)
+
+    # Filter the remaining rows on the covering columns, before converting the WKB data
+    field = {name: pc.struct_field(table[path[0]], path[1]) for name, path in bounds.items()}
+    mask = pc.and_(
+        pc.and_(pc.less_equal(field['xmin'], xmax), pc.greater_equal(field['xmax'], xmin)),
+        pc.and_(pc.less_equal(field['ymin'], ymax), pc.greater_equal(field['ymax'], ymin)),
+    )
+    return table.filter(mask)
+
+
+def write_parquet(df, path, geometry=None, row_group_size=2**16, bbox_covering=True, sort=True, **kwargs):
+    """
+    Write a DataFrame with geos columns to a GeoParquet file.
+    See :meth:`pgpd.GeosDataFrameAccessor.to_parquet` for more information.
+    """
+    if pa is None:
+        raise ImportError('PyArrow is required for this function')
+
+    geos_columns = list(df.dtypes[df.dtypes == 'geos'].index)
+    if geometry is None:
+        geometry = geos_columns[0]
+    elif geometry not in geos_columns:
+        raise TypeError(f'Column "{geometry}" should be of "geos" type')
+
+    bounds = {name: df[name].array.bounds for name in geos_columns}
+    if sort:
+        order = np.argsort(hilbert_distance(bounds[geometry], df[geometry].array.total_bounds), kind='stable')
+        df = df.take(order)
+        bounds = {name: b[order] for name, b in bounds.items()}
+
+    table = pa.Table.from_pandas(df)
+    metadata = {
+        'version': GEOPARQUET_VERSION,
+        'primary_column': geometry,
+        'columns': {},
+    }
+
+    for name in geos_columns:
+        column = get_column_metadata(df[name].array.data, bounds[name])
+        if bbox_covering:
+            bbox_name = f'{name}_bbox'
+            column['covering'] = {'bbox': {field: [bbox_name, field] for field in BBOX_FIELDS}}
+
+            missing = np.isnan(bounds[name]).any(axis=1)
+            bbox = pa.StructArray.from_arrays(
+                [pa.array(bounds[name][:, i], mask=missing) for i in range(4)],
+                names=BBOX_FIELDS,
+                mask=pa.array(missing),
+            )
+            table = table.append_column(bbox_name, bbox)
+
+        metadata['columns'][name] = column
+
+    schema_metadata = table.schema.metadata or {}
+    table = table.replace_schema_metadata({**schema_metadata, b'geo': json.dumps(metadata).encode('utf-8')})
+    pq.write_table(table, path, row_group_size=row_group_size, **kwargs)
+
+
+def get_column_metadata(data, bounds):
+    """Create the GeoParquet metadata of a single geometry column."""
+    type_ids = shapely.get_type_id(data)
+    has_z = shapely.has_z(data)
+    valid = type_ids >= 0
+
+    # Only the distinct combinations of type and dimension are mapped to names
+    keys = np.unique(type_ids[valid] + 1000 * has_z[valid])
+    geometry_types = {GEOMETRY_TYPES[shapely.GeometryType(key % 1000).name] + (' Z' if key >= 1000 else '') for key in keys}
+
+    # Geos columns have no CRS and a missing "crs" key would mean OGC:CRS84, so we explicitly mark it as unknown
+    metadata = {
+        'encoding': 'WKB',
+        'geometry_types': sorted(geometry_types),
+        'crs': None,
+    }
+
+    if not np.isnan(bounds).all():
+        metadata['bbox'] = [
+            float(np.nanmin(bounds[:, 0])),
+            float(np.nanmin(bounds[:, 1])),
+            float(np.nanmax(bounds[:, 2])),
+            float(np.nanmax(bounds[:, 3])),
+        ]
+
+    return metadata
+
+
+def get_geo_metadata(schema):
+    """Return the parsed GeoParquet metadata of an arrow schema or None."""
+    if schema.metadata is None or b'geo' not in schema.metadata:
+        return None
+    return json.loads(schema.metadata[b'geo'].decode('utf-8'))
+
+
+GEOMETRY_TYPES = {
+    'POINT': 'Point',
+    'LINESTRING': 'LineString',
+    'LINEARRING': 'LineString',
+    'POLYGON': 'Polygon',
+    'MULTIPOINT': 'MultiPoint',
+    'MULTILINESTRING': 'MultiLineString',
+    'MULTIPOLYGON': 'MultiPolygon',
+    'GEOMETRYCOLLECTION': 'GeometryCollection',
+}
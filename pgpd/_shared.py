@@ -0,0 +1,64 @@
+#
+# Shared memory WKB buffers
+#
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from ._wkb import WKBStorage
+
+__all__ = ['read_shared_memory', 'write_shared_memory']
+
+
+def write_shared_memory(buffer, offsets):
+    """
+    Copy a WKB buffer with offsets into a new shared memory segment.
+
+    The segment contains the number of geometries N, followed by the ``N+1`` int64 offsets and the WKB data.
+
+    Args:
+        buffer (numpy.ndarray): uint8 buffer with WKB data.
+        offsets (numpy.ndarray): int64 ``N+1`` offsets of the geometries in the buffer.
+
+    Returns:
+        multiprocessing.shared_memory.SharedMemory: New segment, which should be closed and unlinked by the caller.
+    """
+    header = offsets.shape[0] + 1
+    shm = SharedMemory(create=True, size=max(1, 8 * header + buffer.nbytes))
+
+    # The views need to be released before the segment can be closed, so they only live within this function
+    positions = np.ndarray(header, dtype=np.int64, buffer=shm.buf)
+    positions[0] = offsets.shape[0] - 1
+    positions[1:] = offsets
+    np.ndarray(buffer.nbytes, dtype=np.uint8, buffer=shm.buf, offset=8 * header)[:] = buffer
+    return shm
+
+
+def read_shared_memory(name, rows=None):
+    """
+    Decode the geometries of a shared memory segment, which was created with :func:`write_shared_memory`.
+
+    Args:
+        name (str): Name of the shared memory segment.
+        rows (slice or numpy.ndarray, optional): Rows to decode; Default **all rows**.
+
+    Returns:
+        numpy.ndarray: Shapely geometries.
+    """
+    shm = SharedMemory(name=name)
+    try:
+        return decode_segment(shm.buf, rows)
+    finally:
+        shm.close()
+
+
+def decode_segment(buf, rows):
+    """Decode rows of a shared memory buffer, without keeping any views into the buffer."""
+    length = int(np.frombuffer(buf, dtype=np.int64, count=1)[0])
+    offsets = np.frombuffer(buf, dtype=np.int64, count=length + 1, offset=8)
+    buffer = np.ndarray(offsets[-1], dtype=np.uint8, buffer=buf, offset=8 * (length + 2))
+
+    storage = WKBStorage.from_buffer(buffer, offsets)
+    if rows is not None:
+        storage = storage.take(rows)
+    return storage.decode()
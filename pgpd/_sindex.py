@@ -0,0 +1,158 @@
+#
+# Spatial Index
+#
+import copy
+
+import numpy as np
+import pandas as pd
+import shapely
+
+__all__ = ['GeosSpatialIndex']
+
+
+class GeosSpatialIndex:
+    """
+    Spatial index built on top of a :class:`shapely.STRtree`.
+
+    This index is lazily created and cached by :attr:`pgpd.GeosArray.sindex`,
+    so you should usually not need to create one yourself.
+    All query methods return positional indices by default,
+    but can return the labels of the original Series instead by passing ``labels=True``.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries to index.
+        index (pandas.Index, optional): Labels corresponding to the geometries; Default **positional indices**.
+        node_capacity (int, optional): Maximum number of child nodes per parent node in the tree; Default **10**.
+
+    Example:
+        >>> s = pd.Series(shapely.box(range(5), 0, range(10, 15), 10), index=list('abcde'), dtype='geos')
+        >>> s.geos.sindex.query(shapely.points(12.5, 5))
+        array([3, 4])
+        >>> s.geos.sindex.query(shapely.points(12.5, 5), labels=True)
+        Index(['d', 'e'], dtype='object')
+    """
+
+    def __init__(self, data, index=None, node_capacity=10):
+        # Copy the pointer array, so that modifications to the original data do not corrupt the tree
+        self._data = np.array(data, dtype=object)
+        self.index = index
+        self.tree = shapely.STRtree(self._data, node_capacity=node_capacity)
+
+    def __len__(self):
+        """Number of (non-missing) geometries in the index."""
+        return len(self.tree)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {len(self)} geometries>'
+
+    @property
+    def geometries(self):
+        """Geometries stored in the index (including missing values)."""
+        return self._data
+
+    @property
+    def valid_query_predicates(self):
+        """Predicates that can be used in :meth:`~pgpd.GeosSpatialIndex.query`."""
+        predicates = {p.name for p in shapely.strtree.BinaryPredicate} | {None}
+        if shapely.geos_version >= (3, 10, 0):
+            predicates.add('dwithin')
+        return predicates
+
+    def query(self, geometry, predicate=None, distance=None, labels=False):
+        """
+        Return the indices of all geometries in the tree that match the input geometry bounds and optional predicate.
+        This function is a wrapper around :func:`shapely.STRtree.query`.
+
+        Args:
+            geometry (shapely.lib.Geometry or array-like or pandas.Series): Input geometries to query the tree with.
+            predicate (str, optional): Predicate that should be true for ``predicate(input, tree)``; Default **None**.
+            distance (float or array-like, optional): Distance for the "dwithin" predicate; Default **None**.
+            labels (bool, optional): Whether to return labels instead of positional indices; Default **False**.
+
+        Returns:
+            numpy.ndarray or pandas.Index or pandas.DataFrame:
+                The matching tree indices for a single geometry
+                or a ``<2xN>`` array with (input, tree) indices for multiple geometries.
+                If ``labels=True``, the indices are converted to labels
+                and the result is either a :class:`pandas.Index` or a DataFrame with "input" and "tree" columns.
+        """
+        geometry, input_index = self._get_input(geometry)
+        result = self.tree.query(geometry, predicate=predicate, distance=distance)
+        if labels:
+            return self._to_labels(result, input_index)
+        return result
+
+    def query_nearest(self, geometry, max_distance=None, return_distance=False, exclusive=False, all_matches=True, labels=False):
+        """
+        Return the indices of the nearest geometries in the tree for each input geometry.
+        This function is a wrapper around :func:`shapely.STRtree.query_nearest`.
+
+        Args:
+            geometry (shapely.lib.Geometry or array-like or pandas.Series): Input geometries to query the tree with.
+            max_distance (float, optional): Maximum distance within which to search for nearest items; Default **None**.
+            return_distance (bool, optional): Whether to also return the distance to the nearest items; Default **False**.
+            exclusive (bool, optional): Whether to ignore geometries that are equal to the input; Default **False**.
+            all_matches (bool, optional): Whether to return all equidistant nearest items or only one; Default **True**.
+            labels (bool, optional): Whether to return labels instead of positional indices; Default **False**.
+
+        Returns:
+            numpy.ndarray or pandas.Index or pandas.DataFrame or tuple:
+                Same as :meth:`~pgpd.GeosSpatialIndex.query`.
+                If ``return_distance=True``, a tuple with the indices and the distances is returned.
+        """
+        geometry, input_index = self._get_input(geometry)
+        result = self.tree.query_nearest(
+            geometry,
+            max_distance=max_distance,
+            return_distance=return_distance,
+            exclusive=exclusive,
+            all_matches=all_matches,
+        )
+
+        if return_distance:
+            result, distance = result
+            if labels:
+                result = self._to_labels(result, input_index)
+            return result, distance
+
+        if labels:
+            return self._to_labels(result, input_index)
+        return result
+
+    def query_bbox(self, bbox, labels=False):
+        """
+        Return the indices of all geometries in the tree whose bounding box intersects the given bounding box(es).
+
+        Args:
+            bbox (array-like): Bounding box ``(xmin, ymin, xmax, ymax)`` or ``<Nx4>`` array of bounding boxes.
+            labels (bool, optional): Whether to return labels instead of positional indices; Default **False**.
+
+        Returns:
+            numpy.ndarray or pandas.Index or pandas.DataFrame: Same as :meth:`~pgpd.GeosSpatialIndex.query`.
+        """
+        bbox = np.asarray(bbox, dtype=float)
+        if bbox.shape[-1] != 4 or bbox.ndim > 2:
+            raise ValueError('bbox should be of shape <4> or <Nx4>')
+
+        return self.query(shapely.box(bbox[..., 0], bbox[..., 1], bbox[..., 2], bbox[..., 3]), labels=labels)
+
+    def _with_index(self, index):
+        """Return a shallow copy of the spatial index, that uses the given labels."""
+        sindex = copy.copy(self)
+        sindex.index = index
+        return sindex
+
+    def _get_input(self, geometry):
+        if isinstance(geometry, pd.Series):
+            return np.asarray(geometry.geos.to_geos().array), geometry.index
+        if hasattr(geometry, 'dtype') and pd.api.types.pandas_dtype('geos') == geometry.dtype:
+            return np.asarray(geometry), None
+        return geometry, None
+
+    def _to_labels(self, result, input_index):
+        tree_index = self.index if self.index is not None else pd.RangeIndex(len(self._data))
+        if result.ndim == 1:
+            return tree_index.take(result)
+
+        input_labels = input_index.take(result[0]) if input_index is not None else result[0]
+        return pd.DataFrame({'input': np.asarray(input_labels), 'tree': np.asarray(tree_index.take(result[1]))})
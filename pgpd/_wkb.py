@@ -0,0 +1,201 @@
+#
+# Lazily decoded WKB storage
+#
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+from pandas.core.algorithms import take
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+__all__ = ['WKBStorage', 'encode_wkb']
+
+
+class WKBStorage:
+    """
+    Contiguous WKB byte buffer, from which geometries are decoded on demand.
+
+    Every geometry is stored as a ``buffer[starts[i]:ends[i]]`` segment, where missing values have an empty segment.
+    Selecting rows (eg. slicing or taking) only selects start and end positions and never copies the WKB data,
+    which allows to filter data that is backed by a memory-mapped file without reading it.
+
+    Args:
+        buffer (numpy.ndarray): uint8 buffer with WKB data.
+        starts (numpy.ndarray): Start position of each geometry in the buffer.
+        ends (numpy.ndarray): End position of each geometry in the buffer.
+        chunksize (int, optional): Number of geometries that are decoded together when accessing a single element; Default **65536**.
+        cache_size (int, optional): Maximum number of decoded chunks to keep in an LRU cache; Default **0**.
+    """
+
+    def __init__(self, buffer, starts, ends, chunksize=2**16, cache_size=0):
+        self.buffer = buffer
+        self.starts = starts
+        self.ends = ends
+        self.chunksize = chunksize
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_buffer(cls, buffer, offsets, chunksize=2**16, cache_size=0):
+        """
+        Create a storage from a buffer and offsets.
+
+        Args:
+            buffer (bytes-like or str or os.PathLike): WKB data or path to a file with WKB data, which gets memory-mapped.
+            offsets (array-like): ``N+1`` offsets of the geometries in the buffer.
+            chunksize (int, optional): Number of geometries that are decoded together when accessing a single element; Default **65536**.
+            cache_size (int, optional): Maximum number of decoded chunks to keep in an LRU cache; Default **0**.
+        """
+        if isinstance(buffer, (str, os.PathLike)):
+            buffer = np.memmap(buffer, dtype=np.uint8, mode='r')
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.ndim != 1 or len(offsets) == 0:
+            raise ValueError('Offsets should be a 1D array with N+1 elements')
+        if offsets[0] < 0 or offsets[-1] > len(buffer) or np.any(offsets[1:] < offsets[:-1]):
+            raise ValueError('Offsets should be increasing and lie within the buffer')
+
+        return cls(buffer, offsets[:-1], offsets[1:], chunksize, cache_size)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def nbytes(self):
+        """Number of bytes of the selected WKB data and positions."""
+        return int((self.ends - self.starts).sum()) + self.starts.nbytes + self.ends.nbytes
+
+    def isna(self):
+        return self.starts == self.ends
+
+    def take(self, indices, allow_fill=False):
+        """Select geometries by position, which shares the underlying buffer (-1 results in a missing value if ``allow_fill=True``)."""
+        if allow_fill:
+            starts = take(self.starts, indices, allow_fill=True, fill_value=0)
+            ends = take(self.ends, indices, allow_fill=True, fill_value=0)
+        else:
+            starts, ends = self.starts[indices], self.ends[indices]
+
+        return self.__class__(self.buffer, starts, ends, self.chunksize, self.cache_size)
+
+    @classmethod
+    def concatenate(cls, storages):
+        """Concatenate multiple storages, which only copies the WKB data if they do not share the same buffer."""
+        first = storages[0]
+        if all(s.buffer is first.buffer for s in storages):
+            starts = np.concatenate([s.starts for s in storages])
+            ends = np.concatenate([s.ends for s in storages])
+            return cls(first.buffer, starts, ends, first.chunksize, first.cache_size)
+
+        buffers, offsets = zip(*(s.to_buffer() for s in storages))
+        shift = np.cumsum([0] + [len(b) for b in buffers[:-1]])
+        offsets = np.concatenate([o[:-1] + d for o, d in zip(offsets, shift)] + [[shift[-1] + len(buffers[-1])]])
+        return cls(np.concatenate(buffers), offsets[:-1], offsets[1:], first.chunksize, first.cache_size)
+
+    def __getitem__(self, key):
+        """Decode a single geometry, using the LRU cache of decoded chunks."""
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f'index {key} is out of bounds for size {len(self)}')
+        if self.cache_size <= 0:
+            return self.decode(slice(key, key + 1))[0]
+
+        chunk, position = divmod(key, self.chunksize)
+        with self._lock:
+            values = self._cache.get(chunk)
+            if values is not None:
+                self._cache.move_to_end(chunk)
+                return values[position]
+
+        values = self.decode(slice(chunk * self.chunksize, (chunk + 1) * self.chunksize))
+        with self._lock:
+            self._cache[chunk] = values
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return values[position]
+
+    def to_buffer(self):
+        """
+        Return the WKB data as a contiguous buffer with offsets.
+
+        Returns:
+            tuple: uint8 buffer and int64 ``N+1`` offsets, which are zero-copy views if the selected data is contiguous.
+        """
+        starts, ends = self.starts, self.ends
+        lengths = ends - starts
+        if len(starts) == 0:
+            return np.empty(0, dtype=np.uint8), np.zeros(1, dtype=np.int64)
+
+        # Missing values have no data and do not break contiguity
+        valid = lengths > 0
+        if not valid.any():
+            return np.empty(0, dtype=np.uint8), np.zeros(len(starts) + 1, dtype=np.int64)
+
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        vstarts, vends = starts[valid], ends[valid]
+        if np.all(vstarts[1:] == vends[:-1]):
+            return self.buffer[vstarts[0] : vends[-1]], offsets
+
+        # Gather runs of adjacent segments into a new buffer, without building an index for every byte
+        breaks = np.flatnonzero(vstarts[1:] != vends[:-1]) + 1
+        run_starts = vstarts[np.concatenate([[0], breaks])]
+        run_ends = vends[np.concatenate([breaks - 1, [len(vends) - 1]])]
+        return np.concatenate([self.buffer[s:e] for s, e in zip(run_starts, run_ends)]), offsets
+
+    def to_wkb(self, index=slice(None)):
+        """Return the WKB data as an object array of bytes, with None for missing values."""
+        buffer, offsets = self.__class__(self.buffer, self.starts[index], self.ends[index]).to_buffer()
+        if pa is not None:
+            array = pa.LargeBinaryArray.from_buffers(
+                pa.large_binary(),
+                len(offsets) - 1,
+                [None, pa.py_buffer(offsets), pa.py_buffer(buffer)],
+            )
+            values = array.to_numpy(zero_copy_only=False)
+        else:
+            view = memoryview(buffer)
+            values = np.empty(len(offsets) - 1, dtype=object)
+            values[:] = [bytes(view[s:e]) for s, e in zip(offsets[:-1], offsets[1:])]
+
+        values[offsets[:-1] == offsets[1:]] = None
+        return values
+
+    def decode(self, index=slice(None)):
+        """Decode the geometries into shapely objects."""
+        return shapely.from_wkb(self.to_wkb(index))
+
+
+def encode_wkb(data, **kwargs):
+    """
+    Encode shapely geometries into a contiguous WKB buffer.
+
+    Args:
+        data (numpy.ndarray): Shapely geometries.
+        kwargs: Keyword arguments passed to :func:`shapely.to_wkb`.
+
+    Returns:
+        tuple: uint8 buffer and int64 ``N+1`` offsets, where missing values have an empty segment.
+    """
+    values = shapely.to_wkb(data, **kwargs)
+    if pa is not None:
+        array = pa.array(values, type=pa.large_binary(), from_pandas=True)
+        _, offsets, buffer = array.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64, count=len(array) + 1)
+        buffer = np.frombuffer(buffer, dtype=np.uint8) if buffer is not None else np.empty(0, dtype=np.uint8)
+        return buffer[offsets[0] : offsets[-1]], offsets - offsets[0]
+
+    missing = shapely.is_missing(data)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    lengths[~missing] = [len(v) for v in values[~missing]]
+    buffer = np.frombuffer(b''.join(values[~missing]), dtype=np.uint8)
+    return buffer, np.concatenate([[0], np.cumsum(lengths)])
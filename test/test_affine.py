@@ -0,0 +1,117 @@
+#
+#   Test affine transformations
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+import shapely.affinity
+
+import pgpd  # noqa: F401
+
+
+def test_affine_matrix_stack():
+    s = pd.Series(shapely.box(np.arange(5), 0, np.arange(5) + 1, 2), dtype='geos')
+    matrix = np.tile(np.eye(3), (5, 1, 1))
+    matrix[:, 0, 2] = np.arange(5)
+
+    result = s.geos.affine(matrix)
+    expected = s.geos.affine((1, 0, 0, 1, 0, 0)).geos.translate(np.arange(5), 0)
+    assert result.geos.equals(expected).all()
+    np.testing.assert_allclose(result.geos.bounds()['xmin'], np.arange(5) * 2)
+
+
+def test_rotate_array():
+    s = pd.Series(shapely.box(np.arange(5), 0, np.arange(5) + 1, 2), dtype='geos')
+    angles = np.linspace(0, np.pi, 5)
+
+    result = s.geos.rotate(angles, origin='center')
+    expected = [shapely.affinity.rotate(g, a, origin='center', use_radians=True) for g, a in zip(s.array.data, angles)]
+    assert shapely.equals_exact(result.array.data, np.array(expected), 1e-9).all()
+
+    origins = shapely.points(np.arange(5), 1)
+    result = s.geos.rotate(angles, origin=origins)
+    expected = [shapely.affinity.rotate(g, a, origin=o, use_radians=True) for g, a, o in zip(s.array.data, angles, origins)]
+    assert shapely.equals_exact(result.array.data, np.array(expected), 1e-9).all()
+
+
+def test_scale_skew_array():
+    s = pd.Series(shapely.box(np.arange(5), 0, np.arange(5) + 1, 2), dtype='geos')
+
+    scaled = s.geos.scale(np.arange(1, 6), 2, origin=(0, 0))
+    np.testing.assert_allclose(scaled.geos.area(), np.arange(1, 6) * 4)
+
+    skewed = s.geos.skew(0.1, np.arange(5) * 0.1, origin='centroid')
+    expected = [shapely.affinity.skew(g, 0.1, a, origin='centroid', use_radians=True) for g, a in zip(s.array.data, np.arange(5) * 0.1)]
+    assert shapely.equals_exact(skewed.array.data, np.array(expected), 1e-9).all()
+
+
+def test_transform_chain():
+    s = pd.Series(shapely.buffer(shapely.points(np.arange(10), np.arange(10) % 3), 1, quad_segs=3), dtype='geos')
+    angles = np.linspace(0, 1, 10)
+
+    expected = (
+        s.geos.rotate(angles, origin='center')
+        .geos.scale(2, 1, origin='center')
+        .geos.skew(0.2, 0.1, origin='centroid')
+        .geos.translate(angles, 1, 2)
+        .geos.rotate(0.1, 0.2, 0.3, origin='center')
+    )
+    chain = (
+        s.geos.transform_chain()
+        .rotate(angles, origin='center')
+        .scale(2, 1, origin='center')
+        .skew(0.2, 0.1, origin='centroid')
+        .translate(angles, 1, 2)
+        .rotate(0.1, 0.2, 0.3, origin='center')
+    )
+
+    assert chain.matrix.shape == (10, 4, 4)
+    assert shapely.equals_exact(chain.apply().array.data, expected.array.data, 1e-9).all()
+
+
+def test_transform_inplace():
+    s = pd.Series(shapely.box(np.arange(5), 0, np.arange(5) + 1, 2), dtype='geos')
+    original = s.copy()
+    expected = s.geos.rotate(0.5, origin='center').geos.translate(np.arange(5), 1)
+    array = s.array
+    sindex = array.sindex
+
+    assert s.geos.rotate(0.5, origin='center', inplace=True) is None
+    assert s.geos.translate(np.arange(5), 1, inplace=True) is None
+    assert s.array is array
+    assert array._sindex is None and array.sindex is not sindex
+    assert shapely.equals_exact(s.array.data, expected.array.data, 1e-9).all()
+    assert shapely.equals(original.array.data, shapely.box(np.arange(5), 0, np.arange(5) + 1, 2)).all()
+
+    df = pd.DataFrame({'a': np.arange(5), 'geom': original}).astype({'geom': 'geos'})
+    assert df.geos.scale(2, 2, origin=(0, 0), inplace=True) is None
+    np.testing.assert_allclose(df['geom'].geos.area(), 8)
+
+
+def test_transform_chain_inplace():
+    s = pd.Series(shapely.box(np.arange(3), 0, np.arange(3) + 1, 1), dtype='geos')
+    array = s.array
+
+    assert s.geos.transform_chain().translate(1, 2).apply(inplace=True) is None
+    assert s.array is array
+    np.testing.assert_allclose(s.geos.bounds()['ymin'], 2)
+
+    # Converted Series cannot be modified inplace, like with the other transformations
+    converted = pd.Series(shapely.points(np.arange(3), 0))
+    with pytest.raises(ValueError):
+        converted.geos.transform_chain().translate(1, 2).apply(inplace=True)
+    with pytest.raises(ValueError):
+        converted.geos.translate(1, 2, inplace=True)
+
+
+def test_set_coordinates():
+    s = pd.Series(shapely.points(np.arange(3), 0), dtype='geos')
+    coords = np.ones((3, 2))
+
+    result = s.geos.set_coordinates(coords)
+    assert shapely.equals(result.array.data, shapely.points(1, 1)).all()
+    assert shapely.equals(s.array.data, shapely.points(np.arange(3), 0)).all()
+
+    s.geos.set_coordinates(coords, inplace=True)
+    assert shapely.equals(s.array.data, shapely.points(1, 1)).all()
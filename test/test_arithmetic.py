@@ -0,0 +1,48 @@
+#
+#   Test coordinate arithmetic
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def test_arithmetic_per_geometry():
+    data = pgpd.GeosArray(shapely.box(range(4), 0, range(10, 14), 10))
+    other = np.array([[0, 1], [2, 3], [4, 5], [6, 7]])
+
+    expected = shapely.transform(data.data, lambda pt: pt + np.repeat(other, 5, 0))
+    assert shapely.equals(data + other, expected).all()
+    assert shapely.equals(other + data, expected).all()
+
+    with pgpd.options(block_memory=48):
+        assert shapely.equals(data + other, expected).all()
+
+    expected = shapely.transform(data.data, lambda pt: np.repeat(other, 5, 0) - pt)
+    assert shapely.equals(other - data, expected).all()
+    assert shapely.equals(12 / (12 / (data + 1)), (data + 1).data).all()
+
+
+def test_arithmetic_z():
+    data = pgpd.GeosArray(np.array([shapely.points(1, 2), shapely.points(1, 2, 3), None]))
+
+    result = data * 2
+    np.testing.assert_array_equal(shapely.get_coordinates(result.data, include_z=True)[:, 2], [np.nan, 6])
+    assert result._has_z
+
+    result = data + np.array([[1, 1], [2, 2], [3, 3]])
+    np.testing.assert_array_equal(shapely.get_coordinates(result.data, include_z=True), [[2, 3, np.nan], [3, 4, np.nan]])
+    assert shapely.is_missing(result.data[2])
+
+
+def test_arithmetic_inplace():
+    s = pd.Series(shapely.points(range(5), 0), dtype='geos')
+    data = s.array.copy()
+    sindex = data.sindex
+
+    data += np.array([0, 10])
+    data -= 1
+    assert data.sindex is not sindex
+    np.testing.assert_array_equal(shapely.get_coordinates(data.data), np.c_[np.arange(5) - 1, np.full(5, 9)])
+    np.testing.assert_array_equal(shapely.get_coordinates(s.array.data), np.c_[np.arange(5), np.zeros(5)])
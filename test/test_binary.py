@@ -0,0 +1,109 @@
+#
+#   Test binary methods
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+import pgpd
+
+
+def test_pairs_self():
+    s = pd.Series(shapely.box(range(5), 0, range(2, 7), 2), index=list('abcde'), dtype='geos')
+
+    dense = s.geos.intersects(manner='expand')
+    pairs = s.geos.intersects(manner='pairs')
+
+    assert list(pairs.columns) == ['self', 'other']
+    assert len(pairs) == dense.sum()
+    self_idx = s.index.get_indexer(pairs['self'])
+    other_idx = s.index.get_indexer(pairs['other'])
+    assert dense[self_idx, other_idx].all()
+
+
+def test_pairs_other():
+    s = pd.Series(shapely.box(range(5), 0, range(2, 7), 2), index=list('abcde'), dtype='geos')
+    other = pd.Series(shapely.points([1.5, 4.5, 20], 1), index=list('xyz'), dtype='geos')
+
+    pairs = s.geos.contains(other, manner='pairs')
+    pd.testing.assert_frame_equal(pairs, pd.DataFrame({'self': list('abde'), 'other': list('xxyy')}))
+
+    pairs = s.geos.equals(s.array.data, manner='pairs')
+    np.testing.assert_array_equal(pairs['other'], range(5))
+
+
+def test_pairs_not_predicate():
+    s = pd.Series(shapely.points(range(5), 0), dtype='geos')
+
+    with pytest.raises(ValueError):
+        s.geos.distance(manner='pairs')
+
+
+def test_expand_blocks():
+    s = pd.Series(shapely.points(np.arange(50), 0), dtype='geos')
+    dense = s.geos.distance(manner='expand')
+
+    with pgpd.options(block_memory=8 * 50 * 8):
+        blocks = list(s.geos.distance(manner='blocks'))
+    assert len(blocks) == 7
+    assert blocks[0][0] == slice(0, 8)
+    np.testing.assert_allclose(np.vstack([block for _, block in blocks]), dense)
+
+
+def test_expand_out():
+    s = pd.Series(shapely.points(np.arange(50), 0), dtype='geos')
+    dense = s.geos.distance(manner='expand')
+
+    out = np.empty((50, 50))
+    with pgpd.options(block_memory=8 * 50 * 8):
+        result = s.geos.distance(s, manner='expand', out=out)
+    assert result is out
+    np.testing.assert_allclose(out, dense)
+
+
+def test_bbox_prefilter():
+    data = np.array([*shapely.box(range(0, 50, 5), 0, range(2, 52, 5), 2), None, shapely.Polygon(), shapely.points(3, 1)])
+    s = pd.Series(data, dtype='geos')
+    other = pd.Series(np.roll(data, 3), dtype='geos')
+
+    for name in ('intersects', 'within', 'equals', 'touches'):
+        func = getattr(shapely, name)
+        np.testing.assert_array_equal(getattr(s.geos, name)(other, manner='keep'), func(data, other.array.data))
+        np.testing.assert_array_equal(getattr(s.geos, name)(), func(data[:, None], data[None, :]))
+        np.testing.assert_array_equal(getattr(s.geos, name)(shapely.points(1, 1)), func(data, shapely.points(1, 1)))
+
+    with pgpd.options(block_memory=8 * len(data) * 2):
+        blocks = np.concatenate([block for _, block in s.geos.intersects(other, manner='blocks')])
+    np.testing.assert_array_equal(blocks, shapely.intersects(data[:, None], other.array.data[None, :]))
+
+
+def test_bounds_cache():
+    data = pgpd.GeosArray(shapely.box(range(5), 0, range(1, 6), 1))
+    bounds = data.bounds
+    assert data.bounds is bounds
+    assert not bounds.flags.writeable
+    np.testing.assert_array_equal(data.total_bounds, [0, 0, 5, 1])
+
+    subset = data.take([3, -1], allow_fill=True)
+    np.testing.assert_array_equal(subset._bounds, [[3, 0, 4, 1], [np.nan] * 4])
+
+    data[0] = shapely.points(-1, 5)
+    assert data._bounds is None
+    np.testing.assert_array_equal(data.total_bounds, [-1, 0, 5, 5])
+
+
+def test_bounds_slice():
+    s = pd.Series(shapely.box(range(3), 0, range(1, 4), 1), dtype='geos')
+    np.testing.assert_array_equal(s.array.total_bounds, [0, 0, 3, 1])
+    query = shapely.box(99, 99, 101, 101)
+
+    view = s.array[:2]
+    view[0] = shapely.points(100, 100)
+    np.testing.assert_array_equal(view.total_bounds, [1, 0, 100, 100])
+    np.testing.assert_array_equal(s.array.total_bounds, [0, 0, 3, 1])
+    np.testing.assert_array_equal(s.array.bounds, shapely.bounds(s.array.data))
+
+    # The prefilter uses the cached bounds
+    np.testing.assert_array_equal(s.geos.intersects(query), [False, False, False])
+    np.testing.assert_array_equal(pd.Series(view).geos.intersects(query), [True, False])
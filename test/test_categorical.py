@@ -0,0 +1,123 @@
+#
+#   Test dictionary-encoded geometries
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+import pgpd
+
+
+def get_data():
+    boxes = shapely.box(np.arange(3), 0, np.arange(1, 4), 1)
+    return np.array([boxes[0], boxes[1], None, boxes[1], boxes[2], boxes[0]], dtype=object)
+
+
+def test_encoding():
+    data = get_data()
+    arr = pgpd.GeosCategoricalArray(data)
+
+    np.testing.assert_array_equal(arr.codes, [0, 1, -1, 1, 2, 0])
+    assert len(arr.categories) == 3
+    assert arr.dtype == 'geos'
+    assert len(arr) == 6
+    assert arr[2] is None
+    assert arr[3] is arr[1]
+    np.testing.assert_array_equal(arr.isna(), [False, False, True, False, False, False])
+    assert (arr == pgpd.GeosArray(data)).sum() == 5
+
+    dense = arr.to_dense()
+    assert type(dense) is pgpd.GeosArray
+    assert type(pgpd.GeosArray(arr)) is pgpd.GeosArray
+    assert shapely.equals(dense.data[[0, 1, 3, 4, 5]], data[[0, 1, 3, 4, 5]]).all()
+    assert pgpd.GeosArray(data).to_categorical().codes.tolist() == arr.codes.tolist()
+    np.testing.assert_array_equal(arr.to_wkb(), pgpd.GeosArray(data).to_wkb())
+    np.testing.assert_array_equal(arr.bounds, pgpd.GeosArray(data).bounds)
+
+    with pytest.raises(ValueError):
+        pgpd.GeosCategoricalArray.from_codes([0, 3], arr.categories)
+
+
+def test_selection():
+    arr = pgpd.GeosCategoricalArray(get_data())
+
+    sub = arr[1:4]
+    assert isinstance(sub, pgpd.GeosCategoricalArray)
+    assert sub.categories is arr.categories
+    np.testing.assert_array_equal(sub.codes, [1, -1, 1])
+
+    taken = arr.take([0, -1, 4], allow_fill=True, fill_value=shapely.Point(5, 5))
+    assert isinstance(taken, pgpd.GeosCategoricalArray)
+    assert taken[1].equals(shapely.Point(5, 5))
+    assert arr.take([0, -1], allow_fill=True)[1] is None
+
+    concat = pgpd.GeosCategoricalArray._concat_same_type([arr, sub])
+    assert isinstance(concat, pgpd.GeosCategoricalArray)
+    np.testing.assert_array_equal(concat.codes, [*arr.codes, 1, -1, 1])
+
+    other = pgpd.GeosCategoricalArray(shapely.points([1, 2], [1, 2]))
+    concat = pgpd.GeosCategoricalArray._concat_same_type([arr, other])
+    np.testing.assert_array_equal(concat.codes, [0, 1, -1, 1, 2, 0, 3, 4])
+
+    dense = pgpd.GeosCategoricalArray._concat_same_type([arr, pgpd.GeosArray(shapely.points([1], [1]))])
+    assert type(dense) is pgpd.GeosArray
+    assert len(dense) == 7
+
+
+def test_setitem():
+    arr = pgpd.GeosCategoricalArray(get_data())
+    copy = arr.copy()
+
+    arr[0] = shapely.Point(1, 1)
+    arr[[1, 2]] = [None, shapely.Point(2, 2)]
+    assert arr[0].equals(shapely.Point(1, 1))
+    assert arr[1] is None
+    assert arr[2].equals(shapely.Point(2, 2))
+    assert arr[5].equals(copy[5])
+    assert copy[0].equals(copy[5])
+
+
+def test_setitem_view():
+    s = pd.Series(pgpd.GeosCategoricalArray(get_data()), dtype='geos')
+    codes = s.array.codes.copy()
+    area = s.geos.area()
+
+    view = s.array[:3]
+    view[0] = shapely.Point(1, 1)
+    assert view[0].equals(shapely.Point(1, 1))
+    np.testing.assert_array_equal(s.array.codes, codes)
+    pd.testing.assert_series_equal(s.geos.area(), area)
+
+    # Transformed arrays share the codes as well
+    moved = s.array + [1, 0]
+    moved[1] = None
+    np.testing.assert_array_equal(s.array.codes, codes)
+
+
+def test_series():
+    data = get_data()
+    s = pd.Series(pgpd.GeosCategoricalArray(data), dtype='geos')
+    dense = pd.Series(data, dtype='geos')
+
+    pd.testing.assert_series_equal(s.geos.area(), dense.geos.area())
+    pd.testing.assert_series_equal(s.geos.get_num_coordinates(), dense.geos.get_num_coordinates())
+
+    centroid = s.geos.centroid()
+    assert isinstance(centroid.array, pgpd.GeosCategoricalArray)
+    assert shapely.equals(centroid.array.data, dense.geos.centroid().array.data).sum() == 5
+
+    moved = s.geos.translate(1, 1)
+    assert isinstance(moved.array, pgpd.GeosCategoricalArray)
+    np.testing.assert_array_equal(moved.array.bounds[0], [1, 1, 2, 2])
+    np.testing.assert_array_equal(s.array.bounds[0], [0, 0, 1, 1])
+
+    shifted = s.array + np.arange(12).reshape(6, 2)
+    assert type(shifted) is pgpd.GeosArray
+    np.testing.assert_array_equal(shifted.bounds[5], [10, 11, 11, 12])
+
+    s.geos.scale(2, 2, origin=(0, 0), inplace=True)
+    np.testing.assert_array_equal(s.array.bounds[4], [4, 0, 6, 2])
+
+    assert len(pd.concat([s, s])) == 12
+    assert s[s.notna()].array.categories is s.array.categories
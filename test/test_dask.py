@@ -0,0 +1,106 @@
+#
+#   Test Dask integration
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+import pgpd  # noqa: F401
+
+dd = pytest.importorskip('dask.dataframe')
+
+
+@pytest.fixture
+def left():
+    rng = np.random.default_rng(0)
+    points = shapely.points(rng.random((40, 2)) * 20)
+    points[[3, 17]] = None
+    return pd.DataFrame({'a': np.arange(40), 'geometry': pd.Series(points, dtype='geos')})
+
+
+@pytest.fixture
+def right():
+    boxes = shapely.box(np.arange(10) * 2, 0, np.arange(10) * 2 + 1.5, 20)
+    return pd.DataFrame({'b': np.arange(10), 'geometry': pd.Series(boxes, dtype='geos')})
+
+
+def test_meta(left):
+    df = dd.from_pandas(left, npartitions=4)
+    assert df.dtypes['geometry'] == 'geos'
+    assert df._meta_nonempty['geometry'].dtype == 'geos'
+
+    result = df.compute()
+    pd.testing.assert_frame_equal(result, left)
+
+
+@pytest.mark.parametrize('scheduler', ['threads', 'processes'])
+def test_series_accessor(left, scheduler):
+    s = dd.from_pandas(left['geometry'], npartitions=4)
+
+    result = s.geos.buffer(1).geos.area().compute(scheduler=scheduler)
+    pd.testing.assert_series_equal(result, left['geometry'].geos.buffer(1).geos.area())
+
+    result = s.geos.total_bounds().compute(scheduler=scheduler)
+    np.testing.assert_allclose(result.to_numpy(), left['geometry'].array.total_bounds)
+
+    with pytest.raises(ValueError):
+        s.geos.set_precision(1, inplace=True)
+    with pytest.raises(AttributeError):
+        s.geos.unknown_method()
+
+
+def test_curve_distance(left):
+    s = dd.from_pandas(left['geometry'], npartitions=4)
+
+    # Distances are computed with the extent of all partitions
+    result = s.geos.hilbert_distance().compute()
+    pd.testing.assert_series_equal(result, left['geometry'].geos.hilbert_distance())
+
+
+def test_sort_spatially(left):
+    df = dd.from_pandas(left, npartitions=4)
+    result = df.geos.sort_spatially(npartitions=3)
+    assert result.npartitions == 3
+
+    result = result.compute()
+    assert sorted(result['a']) == list(range(40))
+    distance = result['geometry'].geos.hilbert_distance(left['geometry'].array.total_bounds)
+    assert distance.is_monotonic_increasing
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+@pytest.mark.parametrize('scheduler', ['threads', 'processes'])
+def test_sjoin(left, right, how, scheduler):
+    expected = left.geos.sjoin(right, how=how)
+    expected = expected.sort_values(['a', 'b']).reset_index(drop=True)
+
+    ldf = dd.from_pandas(left, npartitions=4)
+    rdf = dd.from_pandas(right, npartitions=3)
+    for other in (right, rdf):
+        result = ldf.geos.sjoin(other, how=how).compute(scheduler=scheduler)
+        result = result.sort_values(['a', 'b']).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError):
+        ldf.geos.sjoin(rdf, how='right')
+
+
+def test_sjoin_disjoint(right):
+    # Partitions without intersecting bounds are never joined
+    other = right.assign(geometry=right['geometry'] + [100, 100])
+    ldf = dd.from_pandas(right, npartitions=2)
+    rdf = dd.from_pandas(other, npartitions=2)
+
+    assert len(ldf.geos.sjoin(rdf).compute()) == 0
+    assert len(ldf.geos.sjoin(rdf, how='left').compute()) == len(right)
+    assert len(ldf.geos.sjoin(rdf, predicate='dwithin', distance=150).compute()) == len(right.geos.sjoin(other, predicate='dwithin', distance=150))
+
+
+def test_sjoin_nearest(left, right):
+    expected = left.geos.sjoin_nearest(right)
+    result = dd.from_pandas(left, npartitions=4).geos.sjoin_nearest(right).compute()
+    pd.testing.assert_frame_equal(result, expected)
+
+    with pytest.raises(TypeError):
+        dd.from_pandas(left, npartitions=4).geos.sjoin_nearest(dd.from_pandas(right, npartitions=2))
@@ -0,0 +1,71 @@
+#
+#   Test factorization of geometries
+#
+import pickle
+
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def get_series():
+    data = [
+        shapely.box(0, 0, 1, 1),
+        shapely.box(0, 0, 1, 1),
+        None,
+        shapely.box(0, 0, 1, 1, ccw=False),
+        shapely.box(0, 0, 1.001, 1),
+    ]
+    return pd.Series(data, dtype='geos')
+
+
+def test_factorize():
+    s = get_series()
+
+    codes, uniques = s.factorize()
+    np.testing.assert_array_equal(codes, [0, 0, -1, 1, 2])
+    assert shapely.equals_exact(uniques.array.data, s.array.data[[0, 3, 4]]).all()
+
+    np.testing.assert_array_equal(s.duplicated(), [False, True, False, False, False])
+    assert len(s.drop_duplicates()) == 4
+    assert len(s.unique()) == 4
+    np.testing.assert_array_equal(s.value_counts(), [2, 1, 1])
+    np.testing.assert_array_equal(s.groupby(s, sort=False).size(), [2, 1, 1])
+
+
+def test_factorize_options():
+    s = get_series()
+
+    with pgpd.options(factorize_normalize=True):
+        np.testing.assert_array_equal(s.factorize()[0], [0, 0, -1, 0, 1])
+
+    with pgpd.options(factorize_normalize=True, factorize_grid_size=0.01):
+        np.testing.assert_array_equal(s.factorize()[0], [0, 0, -1, 0, 0])
+        assert s.nunique() == 1
+
+
+def test_factorize_lazy():
+    s = get_series()
+    buffer, offsets = s.array.to_buffer()
+    lazy = pgpd.GeosArray.from_buffer(buffer, offsets)
+
+    np.testing.assert_array_equal(lazy.factorize()[0], s.factorize()[0])
+    assert lazy._data is None
+
+
+def test_factorize_encoding():
+    data = shapely.set_srid(shapely.points([0, 1, 2], 0), 4326)
+    wkb = shapely.to_wkb(data, byte_order=0)
+    big_endian = pgpd.GeosArray.from_buffer(b''.join(wkb), np.cumsum([0, *map(len, wkb)]))
+    srid = pickle.loads(pickle.dumps(pgpd.GeosArray(data), protocol=5))
+    assert big_endian._data is None
+    assert srid._data is None
+
+    # Keys only depend on the geometries, not on the byte order, the SRID or whether the data is decoded
+    s = pd.Series(pgpd.GeosArray._concat_same_type([big_endian, srid]))
+    assert len(s.drop_duplicates()) == 3
+    assert len(pd.Series(pgpd.GeosArray._concat_same_type([big_endian, pgpd.GeosArray(shapely.points([0, 1, 2], 0))])).unique()) == 3
+    np.testing.assert_array_equal(s.factorize()[0], [0, 1, 2, 0, 1, 2])
+    assert s.value_counts().tolist() == [2, 2, 2]
@@ -1,13 +1,44 @@
 #
 #   Test IO functionality
 #
+import json
+
 import geopandas as gpd
 import geopandas.testing
+import numpy as np
 import pandas as pd
+import pytest
 import shapely
 import shapely.geometry
 
-import pgpd  # noqa: F401
+import pgpd
+
+
+def test_constructor():
+    data = pgpd.GeosArray([shapely.points(0, 0), np.nan, pd.NA, None])
+    assert data.data.dtype == object
+    assert data.data[1:].tolist() == [None, None, None]
+    assert data.isna().tolist() == [False, True, True, True]
+
+    taken = data.take([0, -1], allow_fill=True)
+    assert taken.data.tolist() == [data[0], None]
+
+    with pytest.raises(TypeError):
+        pgpd.GeosArray([shapely.points(0, 0), 'POINT (1 1)'])
+
+
+def test_from_sequence_mixed():
+    point = shapely.points(1, 2)
+    data = pd.Series([None, np.nan, 'POINT (1 2)', shapely.to_wkb(point), shapely.to_wkb(point, hex=True), point, pd.NA], dtype=object)
+
+    result = data.astype('geos')
+    assert result.isna().tolist() == [True, True, False, False, False, False, True]
+    assert shapely.equals(result.array.data[2:6], point).all()
+
+    pd.testing.assert_series_equal(pd.Series(['POINT (1 2)', None]).astype('geos').geos.to_wkt(), pd.Series(['POINT (1 2)', None]), check_names=False)
+
+    with pytest.raises(TypeError):
+        pd.Series([point, 5], dtype=object).astype('geos')
 
 
 def test_wkt():
@@ -75,3 +106,105 @@ def test_geopandas_df():
     result = geos_data.geos.to_geopandas()
 
     gpd.testing.assert_geodataframe_equal(data, result)
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    data = pd.DataFrame(
+        {
+            'extra': [1, 2, 3, 4],
+            'geometry': [
+                shapely.geometry.Point((10, 20)),
+                shapely.geometry.LineString([(0, 0), (15, 10)]),
+                shapely.geometry.Polygon([(-5, -5), (0, 0), (-5, 5), (-10, 0)]),
+                None,
+            ],
+        }
+    ).astype({'geometry': 'geos'})
+
+    data.to_parquet(tmp_path / 'data.parquet')
+    result = pd.read_parquet(tmp_path / 'data.parquet')
+
+    assert result['geometry'].dtype == 'geos'
+    assert result['geometry'].isna().tolist() == [False, False, False, True]
+    assert result['geometry'].iloc[:3].geos.equals(data['geometry'].iloc[:3]).all()
+
+
+def test_geoparquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    data = pd.DataFrame(
+        {
+            'extra': range(100),
+            'geometry': shapely.points(range(100), range(100)),
+        }
+    ).astype({'geometry': 'geos'})
+    data.loc[50, 'geometry'] = None
+
+    data.geos.to_parquet(tmp_path / 'data.parquet', row_group_size=10)
+    result = pgpd.read_parquet(tmp_path / 'data.parquet')
+    assert list(result.columns) == ['extra', 'geometry']
+    assert result['geometry'].dtype == 'geos'
+    pd.testing.assert_series_equal(result.sort_index()['extra'], data['extra'])
+
+    result = pgpd.read_parquet(tmp_path / 'data.parquet', bbox=(9.5, 9.5, 20.5, 20.5), columns=['extra'])
+    assert list(result.columns) == ['extra']
+    assert sorted(result['extra']) == list(range(10, 21))
+
+    # Geos columns have no CRS, which should not be interpreted as OGC:CRS84
+    metadata = json.loads(pq.read_schema(tmp_path / 'data.parquet').metadata[b'geo'])
+    assert 'crs' in metadata['columns']['geometry']
+    assert metadata['columns']['geometry']['crs'] is None
+
+
+def test_geoparquet_metadata():
+    from pgpd._parquet import get_column_metadata
+
+    data = np.array(
+        [
+            shapely.points(0, 0),
+            shapely.points(1, 1, 1),
+            None,
+            shapely.box(0, 0, 1, 1),
+            shapely.points(2, 2),
+            shapely.LinearRing([(0, 0), (1, 0), (1, 1)]),
+        ]
+    )
+    metadata = get_column_metadata(data, shapely.bounds(data))
+    assert metadata['geometry_types'] == ['LineString', 'Point', 'Point Z', 'Polygon']
+    assert metadata['bbox'] == [0, 0, 2, 2]
+
+    metadata = get_column_metadata(np.array([None]), np.full((1, 4), np.nan))
+    assert metadata['geometry_types'] == []
+    assert 'bbox' not in metadata
+
+
+def test_wkb_buffer(tmp_path):
+    data = pgpd.GeosArray(np.array([shapely.points(0, 0), None, shapely.box(0, 0, 1, 1), shapely.points(3, 3)]))
+    buffer, offsets = data.to_buffer()
+    buffer.tofile(tmp_path / 'data.wkb')
+
+    lazy = pgpd.GeosArray.from_buffer(tmp_path / 'data.wkb', offsets, chunksize=2, cache_size=1)
+    assert lazy.isna().tolist() == [False, True, False, False]
+
+    df = pd.DataFrame({'a': [1, 2, 3, 4], 'geometry': lazy})
+    subset = df[df['a'] > 2]['geometry'].array
+    assert subset._data is None
+    assert subset[1].equals(shapely.points(3, 3))
+    assert subset.take([1, -1], allow_fill=True).to_wkt().tolist() == ['POINT (3 3)', None]
+    assert subset._data is None
+
+    assert subset.to_wkt().tolist() == ['POLYGON ((1 0, 1 1, 0 1, 0 0, 1 0))', 'POINT (3 3)']
+    assert subset._data is not None
+
+
+def test_wkb_buffer_gather():
+    data = np.array([shapely.points(0, 0), None, shapely.box(0, 0, 1, 1), shapely.points(3, 3), shapely.points(4, 4)])
+    buffer, offsets = pgpd.GeosArray(data).to_buffer()
+    lazy = pgpd.GeosArray.from_buffer(buffer, offsets)
+
+    # Non-contiguous selections gather the WKB data into a new buffer
+    for indices in ([4, 1, 0, 2], [0, 3, 4], [3, 3, 2]):
+        subset = lazy.take(indices)
+        sub_buffer, sub_offsets = subset.to_buffer()
+        assert len(sub_buffer) == sub_offsets[-1]
+        assert shapely.equals(pgpd.GeosArray.from_buffer(sub_buffer, sub_offsets).data, data[indices]).sum() == len(indices) - (1 in indices)
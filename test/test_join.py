@@ -0,0 +1,86 @@
+#
+#   Test spatial join functionality
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd  # noqa: F401
+
+
+def get_frames():
+    left = pd.DataFrame(
+        {
+            'a': list('abc'),
+            'pt': shapely.points([0.5, 5.5, 20], 0.5),
+        }
+    ).astype({'pt': 'geos'})
+    right = pd.DataFrame(
+        {
+            'b': [10, 20, 30],
+            'poly': shapely.box([0, 5, 0], 0, [1, 6, 1], 1),
+        },
+        index=list('xyz'),
+    ).astype({'poly': 'geos'})
+
+    return left, right
+
+
+def test_sjoin_inner():
+    left, right = get_frames()
+    result = left.geos.sjoin(right, predicate='within')
+
+    np.testing.assert_array_equal(result.index, [0, 0, 1])
+    np.testing.assert_array_equal(result['index_right'], ['x', 'z', 'y'])
+    np.testing.assert_array_equal(result['b'], [10, 30, 20])
+    assert list(result.columns) == ['a', 'pt', 'index_right', 'b', 'poly']
+    assert result['poly'].dtype == 'geos'
+
+
+def test_sjoin_left():
+    left, right = get_frames()
+    result = left.geos.sjoin(right, how='left')
+
+    np.testing.assert_array_equal(result.index, [0, 0, 1, 2])
+    assert result['poly'].isna().tolist() == [False, False, False, True]
+    assert result['index_right'].isna().tolist() == [False, False, False, True]
+
+
+def test_sjoin_right():
+    left, right = get_frames()
+    result = left.geos.sjoin(right.rename(columns={'b': 'a'}), how='right')
+
+    np.testing.assert_array_equal(result.index, ['x', 'y', 'z'])
+    np.testing.assert_array_equal(result['index_left'], [0, 1, 0])
+    assert list(result.columns) == ['a_left', 'pt', 'index_left', 'a_right', 'poly']
+
+
+def test_sjoin_nearest():
+    left = pd.DataFrame({'pt': shapely.points([0, 5, 20], 0)}).astype({'pt': 'geos'})
+    right = pd.DataFrame({'line': shapely.linestrings([[[0, 1], [1, 1]], [[4, 2], [6, 2]], [[10, 0], [10, 5]]])}).astype({'line': 'geos'})
+
+    result = left.geos.sjoin_nearest(right)
+    np.testing.assert_array_equal(result['index_right'], [0, 1, 2])
+    np.testing.assert_allclose(result['distance'], [1, 2, 10])
+
+    result = left.geos.sjoin_nearest(right, k=2, max_distance=10)
+    np.testing.assert_array_equal(result.index, [0, 0, 1, 1, 2])
+    np.testing.assert_array_equal(result['index_right'], [0, 1, 1, 0, 2])
+
+
+def test_sjoin_nearest_k():
+    rng = np.random.default_rng(0)
+    left = pd.DataFrame({'a': pd.Series(shapely.points(rng.random((200, 2)) * 100), dtype='geos')})
+    right = pd.DataFrame({'b': pd.Series(shapely.points(rng.random((300, 2)) * 100), dtype='geos')})
+
+    result = left.geos.sjoin_nearest(right, k=3, all_matches=False)
+    distance = shapely.distance(left['a'].array.data[:, None], right['b'].array.data[None, :])
+    np.testing.assert_allclose(result['distance'].to_numpy().reshape(-1, 3), np.sort(distance, axis=1)[:, :3])
+
+
+def test_sjoin_nearest_ties():
+    left = pd.DataFrame({'a': pd.Series(shapely.points([0], [0]), dtype='geos')})
+    right = pd.DataFrame({'b': pd.Series(shapely.points([1, -1, 0, 5], [0, 0, 1, 5]), dtype='geos')})
+
+    assert len(left.geos.sjoin_nearest(right, k=2)) == 3
+    assert len(left.geos.sjoin_nearest(right, k=2, all_matches=False)) == 2
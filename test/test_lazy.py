@@ -0,0 +1,66 @@
+#
+#   Test lazy chains
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+import pgpd
+
+
+def get_series():
+    points = shapely.points(np.arange(50), np.arange(50) % 7)
+    points[[4, 20]] = None
+    return pd.Series(points, index=np.arange(50) * 2, dtype='geos')
+
+
+@pytest.mark.parametrize('n_jobs', [1, 4])
+def test_collect(n_jobs):
+    s = get_series()
+    expected = s.geos.buffer(2).geos.simplify(0.5).geos.area()
+
+    with pgpd.options(n_jobs=n_jobs, chunksize=8):
+        chain = s.geos.lazy().buffer(2).simplify(0.5).area()
+        assert repr(chain) == '<LazyChain: buffer -> simplify -> area>'
+        result = chain.collect()
+
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_collect_geos():
+    s = get_series()
+    distance = np.linspace(1, 2, 50)
+    expected = s.geos.buffer(distance).geos.centroid()
+
+    with pgpd.options(chunksize=8):
+        result = s.geos.lazy().buffer(distance).centroid().collect()
+
+    assert result.dtype == 'geos'
+    assert result.name == 'centroid'
+    assert result.index.equals(s.index)
+    np.testing.assert_array_equal(shapely.equals_exact(result.array.data, expected.array.data, 1e-9), expected.notna())
+
+
+def test_collect_categorical():
+    s = pd.Series(pgpd.GeosCategoricalArray(shapely.box(range(3), 0, range(1, 4), 1)[[0, 1, 1, 2, 0]]), dtype='geos')
+
+    result = s.geos.lazy().buffer(1).envelope().collect()
+    assert isinstance(result.array, pgpd.GeosCategoricalArray)
+    assert len(result.array.categories) == 3
+    assert result.geos.equals(s.geos.buffer(1).geos.envelope()).all()
+
+
+def test_invalid_steps():
+    s = get_series()
+
+    with pytest.raises(AttributeError):
+        s.geos.lazy().get_parts()
+    with pytest.raises(AttributeError):
+        s.geos.lazy().intersects(s)
+    with pytest.raises(TypeError):
+        s.geos.lazy().area().buffer(1)
+
+    result = s.geos.lazy().collect()
+    assert result is not s
+    assert result.geos.equals(s).sum() == 48
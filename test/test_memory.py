@@ -0,0 +1,64 @@
+#
+#   Test memory estimates
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def get_series():
+    return pd.Series(
+        [
+            *shapely.points(np.arange(3), 0),
+            shapely.linestrings(np.random.rand(10, 2)),
+            shapely.box(0, 0, 1, 1),
+            shapely.multipolygons([shapely.box(0, 0, 1, 1), shapely.box(2, 2, 3, 3)]),
+            None,
+        ],
+        dtype='geos',
+    )
+
+
+def test_memory_usage():
+    s = get_series()
+    arr = s.array
+
+    assert arr.memory_usage() == 8 * len(arr)
+    assert arr.nbytes == arr.memory_usage(deep=True)
+    assert arr.nbytes > 8 * len(arr) + 3 * 24 + 25 * 24
+    assert s.memory_usage(index=False, deep=True) == arr.nbytes
+    assert s.memory_usage(index=False) == 8 * len(arr)
+
+    # Multi-part geometries use more memory than their parts
+    parts = pgpd.GeosArray(shapely.get_parts(arr.data[5]))
+    assert pgpd.GeosArray(arr.data[[5]]).nbytes > parts.nbytes - 8
+
+    # Estimates are cached until the data is modified
+    nbytes = arr.nbytes
+    assert arr._memory is not None
+    arr[6] = shapely.linestrings(np.random.rand(100, 2))
+    assert arr._memory is None
+    assert arr.nbytes > nbytes
+
+
+def test_memory_sample():
+    arr = pgpd.GeosArray(shapely.points(np.random.rand(1000, 2)))
+    exact = arr.nbytes
+
+    with pgpd.options(memory_sample=10):
+        assert arr.nbytes == exact
+
+    categorical = pgpd.GeosCategoricalArray(arr.data[np.arange(1000) % 10])
+    assert categorical.nbytes < exact
+
+
+def test_memory_report():
+    s = get_series()
+    report = s.geos.memory_report()
+
+    assert report.index.tolist() == ['POINT', 'LINESTRING', 'POLYGON', 'MULTIPOLYGON']
+    assert report['count'].tolist() == [3, 1, 1, 1]
+    assert report['coordinates'].tolist() == [3, 10, 5, 10]
+    assert report['bytes'].sum() + s.array.memory_usage() == s.array.nbytes
@@ -0,0 +1,103 @@
+#
+#   Test multithreaded execution
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def test_unary_parallel():
+    s = pd.Series(shapely.points(np.arange(100), 0), index=np.arange(100) * 2, dtype='geos')
+    expected = s.geos.buffer(1)
+
+    with pgpd.options(n_jobs=4, chunksize=10):
+        result = s.geos.buffer(1)
+        distance = s.geos.buffer(np.arange(100) + 1)
+
+    pd.testing.assert_index_equal(result.index, s.index)
+    assert result.geos.equals(expected).all()
+    np.testing.assert_allclose(distance.geos.area(), shapely.area(shapely.buffer(s.array.data, np.arange(100) + 1)))
+
+
+def test_keyed_parallel():
+    s = pd.Series(shapely.multipoints(np.arange(300).reshape(50, 3, 2)), dtype='geos')
+    expected = s.geos.get_parts()
+
+    with pgpd.options(n_jobs=4, chunksize=10):
+        result = s.geos.get_parts()
+
+    pd.testing.assert_index_equal(result.index, expected.index)
+    assert result.geos.equals(expected).all()
+
+
+def test_binary_parallel():
+    s = pd.Series(shapely.points(np.arange(100), 0), dtype='geos')
+    expected = s.geos.distance(manner='expand')
+
+    with pgpd.options(n_jobs=4, chunksize=10):
+        np.testing.assert_allclose(s.geos.distance(manner='expand'), expected)
+        np.testing.assert_allclose(s.geos.distance(s[::-1].reset_index(drop=True)), expected[np.arange(100), np.arange(100)[::-1]])
+
+
+def test_parse_parallel():
+    wkt = pd.Series(['POINT (1 2)', None, np.nan, 'LINESTRING (0 0, 1 1)'] * 25)
+    expected = shapely.from_wkt(wkt.where(wkt.notna(), None).to_numpy())
+
+    with pgpd.options(n_jobs=4, chunksize=10):
+        result = pgpd.GeosArray.from_wkt(wkt)
+        batched = pgpd.GeosArray.from_wkt(wkt.iloc[i : i + 30] for i in range(0, 100, 30))
+        chunks = list(pgpd.GeosArray.stream_wkb(shapely.to_wkb(expected[i : i + 30]) for i in range(0, 100, 30)))
+
+    assert [len(c) for c in chunks] == [30, 30, 30, 10]
+    for data in (result.data, batched.data, np.concatenate([c.data for c in chunks])):
+        assert shapely.equals(data, expected)[~shapely.is_missing(expected)].all()
+        np.testing.assert_array_equal(shapely.is_missing(data), shapely.is_missing(expected))
+
+
+def test_shared_memory():
+    data = pgpd.GeosArray([shapely.points(0, 0), None, shapely.box(0, 0, 1, 1), shapely.points(1, 2, 3)])
+    shm = data.to_shared_memory()
+    try:
+        result = pgpd.GeosArray.from_shared_memory(shm.name)
+        part = pgpd.GeosArray.from_shared_memory(shm.name, slice(1, 3))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    assert (result == data).sum() == 3
+    assert result.isna().tolist() == [False, True, False, False]
+    assert part[0] is None
+    assert part[1].equals(data[2])
+
+
+def test_process_backend():
+    s = pd.Series(shapely.points(np.arange(100), 0), dtype='geos')
+    s[5] = None
+    expected_buffer = s.geos.buffer(1)
+    expected_parts = s.geos.get_parts()
+
+    with pgpd.options(n_jobs=2, chunksize=10, backend='processes'):
+        result = s.geos.buffer(1)
+        distance = s.geos.distance(s[::-1].reset_index(drop=True))
+        parts = s.geos.get_parts()
+
+    assert result.geos.equals(expected_buffer)[s.notna()].all()
+    assert result.isna().tolist() == s.isna().tolist()
+    np.testing.assert_allclose(distance.dropna(), np.abs(np.arange(100) - np.arange(100)[::-1])[[i for i in range(100) if i not in (5, 94)]])
+    pd.testing.assert_index_equal(parts.index, expected_parts.index)
+    assert parts.geos.equals(expected_parts).all()
+
+
+def test_executor_cache():
+    from pgpd._parallel import get_executor
+
+    first = get_executor(2)
+    assert get_executor(2) is first
+
+    # Changing the number of jobs does not shut down pools that other threads might still use
+    second = get_executor(3)
+    assert second is not first
+    assert first.submit(sum, [1, 2]).result() == 3
+    assert get_executor(2) is first
@@ -0,0 +1,54 @@
+#
+#   Test pickling of geometries
+#
+import pickle
+
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def get_data():
+    data = np.array([shapely.points(0, 0), None, shapely.box(0, 0, 1, 1), shapely.points(1, 2, 3)], dtype=object)
+    data[0] = shapely.set_srid(data[0], 4326)
+    return data
+
+
+def test_pickle():
+    data = get_data()
+    arr = pgpd.GeosArray(data)
+
+    result = pickle.loads(pickle.dumps(arr))
+    assert result._data is None
+    assert shapely.equals_exact(result.data[[0, 2, 3]], data[[0, 2, 3]]).all()
+    assert result[1] is None
+    assert shapely.get_srid(result[0]) == 4326
+    assert shapely.has_z(result[3])
+
+    lazy = result[[3, 1, 0]]
+    result = pickle.loads(pickle.dumps(lazy))
+    assert shapely.equals_exact(result.data[[0, 2]], data[[3, 0]]).all()
+    assert result.isna().tolist() == [False, True, False]
+
+
+def test_pickle_out_of_band():
+    arr = pgpd.GeosArray(get_data())
+
+    buffers = []
+    payload = pickle.dumps(arr, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) > 0
+
+    result = pickle.loads(payload, buffers=buffers)
+    assert (result == arr).sum() == 3
+
+
+def test_pickle_dataframe():
+    df = pd.DataFrame({'a': range(4), 'geom': pgpd.GeosArray(get_data()), 'cat': pgpd.GeosCategoricalArray(get_data()[[2, 2, 1, 2]])})
+
+    result = pickle.loads(pickle.dumps(df, protocol=5))
+    assert result.dtypes.tolist() == df.dtypes.tolist()
+    assert (result['geom'].array == df['geom'].array).sum() == 3
+    assert isinstance(result['cat'].array, pgpd.GeosCategoricalArray)
+    np.testing.assert_array_equal(result['cat'].array.codes, [0, 0, -1, 0])
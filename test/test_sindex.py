@@ -0,0 +1,54 @@
+#
+#   Test spatial index functionality
+#
+import numpy as np
+import pandas as pd
+import shapely
+
+import pgpd
+
+
+def test_sindex_query():
+    s = pd.Series(shapely.box(range(5), 0, range(10, 15), 10), index=list('abcde'), dtype='geos')
+    pt = shapely.points(12.5, 5)
+
+    np.testing.assert_array_equal(s.geos.sindex.query(pt), [3, 4])
+    pd.testing.assert_index_equal(s.geos.sindex.query(pt, labels=True), pd.Index(['d', 'e']))
+
+    other = pd.Series(shapely.points([12.5, 0.5], 5), index=['x', 'y'], dtype='geos')
+    result = s.geos.sindex.query(other, predicate='within', labels=True)
+    pd.testing.assert_frame_equal(result, pd.DataFrame({'input': ['x', 'x', 'y'], 'tree': ['d', 'e', 'a']}))
+
+
+def test_sindex_query_nearest():
+    s = pd.Series(shapely.points(range(5), 0), index=list('abcde'), dtype='geos')
+
+    idx, dist = s.geos.sindex.query_nearest(shapely.points(2.5, 0), return_distance=True, labels=True)
+    pd.testing.assert_index_equal(idx, pd.Index(['c', 'd']))
+    np.testing.assert_allclose(dist, [0.5, 0.5])
+
+
+def test_sindex_cache():
+    data = pgpd.GeosArray(shapely.points(range(5), 0))
+    sindex = data.sindex
+    assert data.sindex is sindex
+
+    data[0] = shapely.points(10, 10)
+    assert data.sindex is not sindex
+    np.testing.assert_array_equal(data.sindex.query_bbox((9, 9, 11, 11)), [0])
+
+    assert data.take([0, 1])._sindex is None
+    assert data.copy()._sindex is None
+
+
+def test_sindex_slice():
+    data = pgpd.GeosArray(shapely.box(range(3), 0, range(1, 4), 1))
+    sindex = data.sindex
+
+    # Writing to a slice does not modify the original array, so its index stays valid
+    view = data[:2]
+    view[0] = shapely.points(100, 100)
+    np.testing.assert_array_equal(view.sindex.query(shapely.box(99, 99, 101, 101)), [0])
+    assert data.sindex is sindex
+    assert data[0].equals(shapely.box(0, 0, 1, 1))
+    assert len(data.sindex.query(shapely.box(99, 99, 101, 101))) == 0
@@ -0,0 +1,69 @@
+#
+#   Test spatial sorting
+#
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+import pgpd
+
+
+def test_curve_distance():
+    s = pd.Series([*shapely.points([0, 1, 0, 1], [0, 0, 1, 1]), None], dtype='geos')
+
+    np.testing.assert_array_equal(s.geos.morton_distance(level=1), [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(s.geos.hilbert_distance(level=1), [0, 3, 1, 2, 4])
+    assert s.geos.hilbert_distance().name == 'hilbert_distance'
+
+
+def test_sort_spatially():
+    x = np.array([3, 0, 2, 1, 0, 3])
+    y = np.array([0, 0, 3, 1, 3, 3])
+    df = pd.DataFrame({'a': range(6), 'geom': shapely.points(x, y)}).astype({'geom': 'geos'})
+
+    result = df.geos.sort_spatially()
+    distance = df['geom'].geos.hilbert_distance()
+    np.testing.assert_array_equal(result.index, np.argsort(distance, kind='stable'))
+
+    result = df.geos.sort_spatially(curve='morton', level=2)
+    np.testing.assert_array_equal(result['a'], [1, 3, 0, 4, 2, 5])
+
+
+def test_sort_values():
+    s = pd.Series([shapely.points(1, 1), shapely.points(0, 1), None, shapely.points(1, 0), shapely.points(0, 0)], dtype='geos')
+
+    # Without a curve, geometries are sorted by their WKB keys
+    valid = np.array([0, 1, 3, 4])
+    result = s.sort_values()
+    np.testing.assert_array_equal(result.index, [*valid[np.argsort(shapely.to_wkb(s.array.data[valid]))], 2])
+
+    with pgpd.options(sort_curve='morton'):
+        result = s.sort_values()
+    np.testing.assert_array_equal(result.index, [4, 3, 1, 0, 2])
+
+
+def test_groupby_sort():
+    df = pd.DataFrame({'geom': shapely.points([1, 0, 1, 2, 0], 0), 'value': range(5)}).astype({'geom': 'geos'})
+
+    result = df.groupby('geom').value.sum()
+    assert len(result) == 3
+    assert result.index.dtype == 'geos'
+    assert result.sort_index().index.equals(result.index)
+    expected = df.groupby('geom', sort=False).value.sum()
+    pd.testing.assert_series_equal(result, expected.iloc[np.argsort(shapely.to_wkb(expected.index.array.data))])
+
+    with pgpd.options(sort_curve='hilbert'):
+        result = df.groupby('geom').value.sum()
+    np.testing.assert_array_equal(result, [5, 2, 3])
+
+
+def test_sort_values_lazy():
+    data = shapely.points([3, 1, 2, 0], [0, 5, 1, 2])
+    wkb = shapely.to_wkb(data, byte_order=0, include_srid=True)
+    lazy = pd.Series(pgpd.GeosArray.from_buffer(b''.join(wkb), np.cumsum([0, *map(len, wkb)])))
+    dense = pd.Series(data, dtype='geos')
+
+    # The WKB order is independent of the storage of the geometries
+    np.testing.assert_array_equal(lazy.sort_values().index, dense.sort_values().index)
+    np.testing.assert_array_equal(lazy.argsort(), dense.argsort())